@@ -0,0 +1,372 @@
+import logging
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+
+from typing import Dict
+from pathlib import Path
+from pyarrow import csv as pa_csv
+
+logger = logging.getLogger(__name__)
+
+CHUNK_SIZE = 1_000_000
+START_DATE = np.datetime64('2011-01-01T00:00:00', 's')
+PERIOD_MINUTES = 12 * 365 * 24 * 60
+
+ENCOUNTER_CLASSES = ['ambulatory', 'outpatient', 'inpatient', 'wellness', 'urgentcare', 'emergency']
+MARITAL = ['M', 'S', 'D', 'W']
+RACES = ['white', 'black', 'asian', 'hawaiian', 'native', 'other']
+ETHNICITIES = ['hispanic', 'nonhispanic']
+COUNTIES = ['Suffolk County', 'Middlesex County', 'Norfolk County', 'Essex County', 'Worcester County']
+CITIES = ['Boston', 'Cambridge', 'Quincy', 'Worcester', 'Lowell', 'Springfield', 'Newton', 'Somerville']
+STATES = ['MA', 'MD', 'NY', 'CT', 'RI']
+
+ENCOUNTER_CODES = [(f'{185345009 + i}', f'Encounter for clinical finding type {i} (procedure)') for i in range(60)]
+PROCEDURE_CODES = [(f'{430193006 + i}', f'Procedure of type {i} (procedure)') for i in range(200)]
+REASON_CODES = [(f'{10509002 + i}', f'Condition number {i} (disorder)') for i in range(80)]
+
+HEADERS = {
+    'encounters': [
+        'Id', 'START', 'STOP', 'PATIENT', 'ORGANIZATION', 'PAYER', 'ENCOUNTERCLASS', 'CODE', 'DESCRIPTION',
+        'BASE_ENCOUNTER_COST', 'TOTAL_CLAIM_COST', 'PAYER_COVERAGE', 'REASONCODE', 'REASONDESCRIPTION'
+    ],
+    'organizations': ['Id', 'NAME', 'ADDRESS', 'CITY', 'STATE', 'ZIP', 'LAT', 'LON'],
+    'patients': [
+        'Id', 'BIRTHDATE', 'DEATHDATE', 'PREFIX', 'FIRST', 'LAST', 'SUFFIX', 'MAIDEN', 'MARITAL', 'RACE',
+        'ETHNICITY', 'GENDER', 'BIRTHPLACE', 'ADDRESS', 'CITY', 'STATE', 'COUNTY', 'ZIP', 'LAT', 'LON'
+    ],
+    'payers': ['Id', 'NAME', 'ADDRESS', 'CITY', 'STATE_HEADQUARTERED', 'ZIP', 'PHONE'],
+    'procedures': [
+        'START', 'STOP', 'PATIENT', 'ENCOUNTER', 'CODE', 'DESCRIPTION', 'BASE_COST', 'REASONCODE', 'REASONDESCRIPTION'
+    ]
+}
+
+
+def generate_dataset(output_path: str, encounters: int, seed: int = 42) -> Dict[str, int]:
+    """
+    Gera os 5 CSVs do hospital com dados sintéticos, no formato dos arquivos de `src/data`.
+
+    Os dados seguem os contratos de `contracts/schema.py` e mantêm a integridade
+    referencial: cada encontro aponta para um paciente, uma organização e um
+    pagador existentes, e cada procedimento aponta para um encontro existente, do
+    mesmo paciente e dentro do horário do encontro. As tabelas grandes são geradas
+    em blocos de `CHUNK_SIZE` linhas, então a memória não cresce com o tamanho.
+
+    Args:
+        output_path (str): Diretório onde os CSVs serão gravados.
+        encounters (int): Quantidade de encontros (ex: 10_000 a 10_000_000).
+        seed (int): Semente do gerador aleatório; a mesma semente gera os mesmos dados.
+
+    Returns:
+        Dict[str, int]: Dicionário com {'nome do arquivo': quantidade de linhas}.
+    """
+    rng = np.random.default_rng(seed)
+    output_dir = Path(output_path)
+    output_dir.mkdir(parents=True, exist_ok=True)
+
+    sizes = {
+        'patients': max(100, encounters // 20),
+        'organizations': max(10, encounters // 1_000),
+        'payers': 10,
+        'encounters': encounters
+    }
+
+    _write_csv(output_dir / 'patients.csv', 'patients', [_patients(rng, 0, sizes['patients'])])
+    _write_csv(output_dir / 'organizations.csv', 'organizations', [_organizations(rng, sizes['organizations'])])
+    _write_csv(output_dir / 'payers.csv', 'payers', [_payers(rng, sizes['payers'])])
+
+    procedures = 0
+    with _csv_writer(output_dir / 'encounters.csv', 'encounters') as encounters_writer, \
+            _csv_writer(output_dir / 'procedures.csv', 'procedures') as procedures_writer:
+        for offset in range(0, encounters, CHUNK_SIZE):
+            rows = min(CHUNK_SIZE, encounters - offset)
+            encounters_table, start, stop = _encounters(rng, offset, rows, sizes)
+            encounters_writer.write_table(encounters_table)
+
+            procedures_table = _procedures(rng, encounters_table, start, stop)
+            procedures_writer.write_table(procedures_table)
+            procedures += procedures_table.num_rows
+
+            logger.info(f'{offset + rows}/{encounters} encontros gerados.')
+
+    sizes['procedures'] = procedures
+    logger.info(f'Dados sintéticos gerados em {output_dir}: {sizes}')
+    return sizes
+
+
+def _csv_writer(path: Path, name: str) -> pa_csv.CSVWriter:
+    """
+    Abre um CSV com o cabeçalho no formato dos arquivos originais.
+
+    Args:
+        path (Path): Caminho do CSV.
+        name (str): Nome do arquivo (ex: 'encounters').
+
+    Returns:
+        pa_csv.CSVWriter: Escritor de CSV do pyarrow.
+    """
+    schema = pa.schema([pa.field(column, pa.string()) for column in HEADERS[name]])
+    return pa_csv.CSVWriter(path, schema, write_options=pa_csv.WriteOptions(quoting_style='needed'))
+
+
+def _write_csv(path: Path, name: str, tables) -> None:
+    """
+    Grava uma ou mais tabelas em um CSV.
+
+    Args:
+        path (Path): Caminho do CSV.
+        name (str): Nome do arquivo (ex: 'patients').
+        tables: Tabelas com as colunas de `HEADERS[name]`.
+    """
+    with _csv_writer(path, name) as writer:
+        for table in tables:
+            writer.write_table(table)
+
+
+def _ids(prefix: str, start: int, rows: int) -> pa.Array:
+    """
+    Gera identificadores únicos no formato de UUID (ex: 'e0000000-0000-4000-8000-000000000001').
+
+    Args:
+        prefix (str): Primeiro caractere do identificador, por tabela.
+        start (int): Primeiro número da sequência.
+        rows (int): Quantidade de identificadores.
+
+    Returns:
+        pa.Array: Identificadores.
+    """
+    numbers = pc.utf8_lpad(pc.cast(pa.array(np.arange(start, start + rows)), pa.string()), 12, '0')
+    return pc.binary_join_element_wise(f'{prefix}0000000-0000-4000-8000-', numbers, '')
+
+
+def _choice(rng: np.random.Generator, values, rows: int, null_ratio: float = 0.0) -> pa.Array:
+    """
+    Sorteia valores de uma lista, com uma fração opcional de nulos.
+
+    Args:
+        rng (np.random.Generator): Gerador aleatório.
+        values: Valores possíveis.
+        rows (int): Quantidade de linhas.
+        null_ratio (float): Fração de linhas nulas.
+
+    Returns:
+        pa.Array: Valores sorteados, como texto.
+    """
+    array = pa.array(np.asarray(values, dtype=object)[rng.integers(0, len(values), rows)], pa.string())
+    if null_ratio:
+        array = pc.if_else(pa.array(rng.random(rows) < null_ratio), pa.scalar(None, pa.string()), array)
+
+    return array
+
+
+def _numbers(values: np.ndarray, decimals: int) -> pa.Array:
+    """
+    Formata números como texto com uma quantidade fixa de casas decimais.
+
+    Args:
+        values (np.ndarray): Valores.
+        decimals (int): Casas decimais.
+
+    Returns:
+        pa.Array: Valores formatados.
+    """
+    return pc.cast(pa.array(np.round(values, decimals)), pa.string())
+
+
+def _timestamps(values: np.ndarray) -> pa.Array:
+    """
+    Formata datas no padrão dos arquivos originais (ex: '2011-05-02T01:45:24Z').
+
+    Args:
+        values (np.ndarray): Datas (`datetime64[s]`).
+
+    Returns:
+        pa.Array: Datas formatadas.
+    """
+    return pc.strftime(pa.array(values, pa.timestamp('s')), format='%Y-%m-%dT%H:%M:%SZ')
+
+
+def _patients(rng: np.random.Generator, start: int, rows: int) -> pa.Table:
+    """
+    Gera os pacientes.
+
+    Args:
+        rng (np.random.Generator): Gerador aleatório.
+        start (int): Primeiro número da sequência de identificadores.
+        rows (int): Quantidade de pacientes.
+
+    Returns:
+        pa.Table: Pacientes com as colunas de `HEADERS['patients']`.
+    """
+    birthdate = np.datetime64('1930-01-01') + rng.integers(0, 80 * 365, rows).astype('timedelta64[D]')
+    deathdate = birthdate + rng.integers(20 * 365, 90 * 365, rows).astype('timedelta64[D]')
+    deceased = rng.random(rows) < 0.15
+
+    gender = _choice(rng, ['M', 'F'], rows)
+    first = pc.binary_join_element_wise('Name', _numbers(rng.integers(0, 1000, rows), 0), '')
+    last = pc.binary_join_element_wise('Surname', _numbers(rng.integers(0, 1000, rows), 0), '')
+
+    return pa.table({
+        'Id': _ids('a', start, rows),
+        'BIRTHDATE': pc.strftime(pa.array(birthdate), format='%Y-%m-%d'),
+        'DEATHDATE': pc.if_else(
+            pa.array(deceased), pc.strftime(pa.array(deathdate), format='%Y-%m-%d'), pa.scalar(None, pa.string())
+        ),
+        'PREFIX': pc.if_else(pc.equal(gender, 'M'), 'Mr.', 'Mrs.'),
+        'FIRST': first,
+        'LAST': last,
+        'SUFFIX': _choice(rng, ['Jr.', 'Sr.', 'III'], rows, null_ratio=0.97),
+        'MAIDEN': pc.if_else(pc.equal(gender, 'F'), last, pa.scalar(None, pa.string())),
+        'MARITAL': _choice(rng, MARITAL, rows, null_ratio=0.2),
+        'RACE': _choice(rng, RACES, rows),
+        'ETHNICITY': _choice(rng, ETHNICITIES, rows),
+        'GENDER': gender,
+        'BIRTHPLACE': pc.binary_join_element_wise(_choice(rng, CITIES, rows), 'Massachusetts  US', '  '),
+        'ADDRESS': pc.binary_join_element_wise(_numbers(rng.integers(1, 999, rows), 0), 'Main Street', ' '),
+        'CITY': _choice(rng, CITIES, rows),
+        'STATE': pa.array(['Massachusetts'] * rows, pa.string()),
+        'COUNTY': _choice(rng, COUNTIES, rows),
+        'ZIP': pc.utf8_lpad(_numbers(rng.integers(1000, 2799, rows), 0), 5, '0'),
+        'LAT': _numbers(rng.uniform(41.2, 42.9, rows), 6),
+        'LON': _numbers(rng.uniform(-73.5, -69.9, rows), 6)
+    })
+
+
+def _organizations(rng: np.random.Generator, rows: int) -> pa.Table:
+    """
+    Gera as organizações.
+
+    Args:
+        rng (np.random.Generator): Gerador aleatório.
+        rows (int): Quantidade de organizações.
+
+    Returns:
+        pa.Table: Organizações com as colunas de `HEADERS['organizations']`.
+    """
+    return pa.table({
+        'Id': _ids('b', 0, rows),
+        'NAME': pc.binary_join_element_wise('HOSPITAL', _numbers(np.arange(rows), 0), ' '),
+        'ADDRESS': pc.binary_join_element_wise(_numbers(rng.integers(1, 999, rows), 0), 'HOSPITAL ROAD', ' '),
+        'CITY': _choice(rng, [city.upper() for city in CITIES], rows),
+        'STATE': pa.array(['MA'] * rows, pa.string()),
+        'ZIP': pc.utf8_lpad(_numbers(rng.integers(1000, 2799, rows), 0), 5, '0'),
+        'LAT': _numbers(rng.uniform(41.2, 42.9, rows), 6),
+        'LON': _numbers(rng.uniform(-73.5, -69.9, rows), 6)
+    })
+
+
+def _payers(rng: np.random.Generator, rows: int) -> pa.Table:
+    """
+    Gera os pagadores.
+
+    Args:
+        rng (np.random.Generator): Gerador aleatório.
+        rows (int): Quantidade de pagadores.
+
+    Returns:
+        pa.Table: Pagadores com as colunas de `HEADERS['payers']`.
+    """
+    return pa.table({
+        'Id': _ids('c', 0, rows),
+        'NAME': pc.binary_join_element_wise('Payer', _numbers(np.arange(rows), 0), ' '),
+        'ADDRESS': _choice(rng, ['7500 Security Blvd', '1 Insurance Way'], rows, null_ratio=0.1),
+        'CITY': _choice(rng, ['Baltimore', 'Hartford', 'Boston'], rows, null_ratio=0.1),
+        'STATE_HEADQUARTERED': _choice(rng, STATES, rows, null_ratio=0.1),
+        'ZIP': _choice(rng, ['21244', '06156', '02110'], rows, null_ratio=0.1),
+        'PHONE': _choice(rng, ['1-877-267-2323', '1-800-633-4227'], rows, null_ratio=0.1)
+    })
+
+
+def _encounters(rng: np.random.Generator, offset: int, rows: int, sizes: Dict[str, int]):
+    """
+    Gera um bloco de encontros apontando para pacientes, organizações e pagadores existentes.
+
+    Args:
+        rng (np.random.Generator): Gerador aleatório.
+        offset (int): Posição do primeiro encontro do bloco.
+        rows (int): Quantidade de encontros do bloco.
+        sizes (Dict[str, int]): Quantidade de linhas de cada arquivo.
+
+    Returns:
+        Tuple[pa.Table, np.ndarray, np.ndarray]: Encontros e as datas de início e fim de cada um.
+    """
+    start = START_DATE + rng.integers(0, PERIOD_MINUTES, rows).astype('timedelta64[m]')
+    stop = start + rng.integers(15, 24 * 60, rows).astype('timedelta64[m]')
+
+    code = rng.integers(0, len(ENCOUNTER_CODES), rows)
+    reason = rng.integers(0, len(REASON_CODES), rows)
+    has_reason = pa.array(rng.random(rows) < 0.4)
+
+    base_cost = rng.choice([85.55, 129.16, 142.58], rows)
+    total_cost = base_cost + rng.uniform(0, 5_000, rows)
+
+    table = pa.table({
+        'Id': _ids('d', offset, rows),
+        'START': _timestamps(start),
+        'STOP': _timestamps(stop),
+        'PATIENT': _ids('a', 0, sizes['patients']).take(pa.array(rng.integers(0, sizes['patients'], rows))),
+        'ORGANIZATION': _ids('b', 0, sizes['organizations']).take(pa.array(rng.integers(0, sizes['organizations'], rows))),
+        'PAYER': _ids('c', 0, sizes['payers']).take(pa.array(rng.integers(0, sizes['payers'], rows))),
+        'ENCOUNTERCLASS': _choice(rng, ENCOUNTER_CLASSES, rows),
+        'CODE': pa.array([code for code, _ in ENCOUNTER_CODES]).take(pa.array(code)),
+        'DESCRIPTION': pa.array([description for _, description in ENCOUNTER_CODES]).take(pa.array(code)),
+        'BASE_ENCOUNTER_COST': _numbers(base_cost, 2),
+        'TOTAL_CLAIM_COST': _numbers(total_cost, 2),
+        'PAYER_COVERAGE': _numbers(total_cost * rng.uniform(0, 1, rows), 2),
+        'REASONCODE': pc.if_else(
+            has_reason, pa.array([code for code, _ in REASON_CODES]).take(pa.array(reason)), pa.scalar(None, pa.string())
+        ),
+        'REASONDESCRIPTION': pc.if_else(
+            has_reason,
+            pa.array([description for _, description in REASON_CODES]).take(pa.array(reason)),
+            pa.scalar(None, pa.string())
+        )
+    })
+
+    return table, start, stop
+
+
+def _procedures(rng: np.random.Generator, encounters: pa.Table, start: np.ndarray, stop: np.ndarray) -> pa.Table:
+    """
+    Gera os procedimentos de um bloco de encontros (0 a 2 por encontro, média de 0,6).
+
+    Cada procedimento é do mesmo paciente do encontro e começa dentro do horário do encontro.
+
+    Args:
+        rng (np.random.Generator): Gerador aleatório.
+        encounters (pa.Table): Bloco de encontros.
+        start (np.ndarray): Início de cada encontro.
+        stop (np.ndarray): Fim de cada encontro.
+
+    Returns:
+        pa.Table: Procedimentos com as colunas de `HEADERS['procedures']`.
+    """
+    per_encounter = rng.choice([0, 1, 2], encounters.num_rows, p=[0.55, 0.3, 0.15])
+    index = np.repeat(np.arange(encounters.num_rows), per_encounter)
+    rows = len(index)
+
+    duration = (stop[index] - start[index]).astype('int64')
+    procedure_start = start[index] + (rng.random(rows) * duration).astype('timedelta64[s]')
+    procedure_stop = np.minimum(procedure_start + np.timedelta64(15, 'm'), stop[index])
+
+    code = rng.integers(0, len(PROCEDURE_CODES), rows)
+    reason = rng.integers(0, len(REASON_CODES), rows)
+    has_reason = pa.array(rng.random(rows) < 0.3)
+
+    return pa.table({
+        'START': _timestamps(procedure_start),
+        'STOP': _timestamps(procedure_stop),
+        'PATIENT': encounters.column('PATIENT').take(pa.array(index)),
+        'ENCOUNTER': encounters.column('Id').take(pa.array(index)),
+        'CODE': pa.array([code for code, _ in PROCEDURE_CODES]).take(pa.array(code)),
+        'DESCRIPTION': pa.array([description for _, description in PROCEDURE_CODES]).take(pa.array(code)),
+        'BASE_COST': _numbers(rng.uniform(50, 20_000, rows), 2),
+        'REASONCODE': pc.if_else(
+            has_reason, pa.array([code for code, _ in REASON_CODES]).take(pa.array(reason)), pa.scalar(None, pa.string())
+        ),
+        'REASONDESCRIPTION': pc.if_else(
+            has_reason,
+            pa.array([description for _, description in REASON_CODES]).take(pa.array(reason)),
+            pa.scalar(None, pa.string())
+        )
+    })
@@ -0,0 +1,131 @@
+import io
+import sys
+import json
+import time
+import argparse
+import logging
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from typing import Dict, List, Optional, Any
+from datetime import datetime
+from pathlib import Path
+
+from src.data_source.csv_data_source import DataSource
+from src.data_source.parquet_profiles import WRITE_PROFILES, write_dataframe
+
+logger = logging.getLogger(__name__)
+
+
+def measure_profile(df, dataset: str, profile_name: str, runs: int) -> Dict[str, Any]:
+    """
+    Grava e lê um arquivo com um perfil de escrita e mede tamanho e tempos.
+
+    Cada medição roda `runs` vezes e o resultado é a mediana. A leitura mede
+    `pq.read_table` (Arrow) e a conversão para pandas separadamente, pois a carga
+    no Banco usa um ou outro conforme o `load_mode`.
+
+    Args:
+        df (pd.DataFrame): Dados validados do arquivo.
+        dataset (str): Nome do arquivo (ex: 'encounters').
+        profile_name (str): Perfil de `WRITE_PROFILES`.
+        runs (int): Quantidade de execuções de cada medição.
+
+    Returns:
+        Dict[str, Any]: Tamanho, row groups e tempos de escrita e leitura.
+    """
+    profile = {**WRITE_PROFILES[profile_name], 'name': profile_name}
+
+    encode, decode, to_pandas = [], [], []
+    for _ in range(runs):
+        buffer = io.BytesIO()
+        start = time.perf_counter()
+        write_dataframe(df, buffer, profile)
+        encode.append(time.perf_counter() - start)
+
+        data = pa.py_buffer(buffer.getvalue())
+        start = time.perf_counter()
+        table = pq.read_table(pa.BufferReader(data))
+        decode.append(time.perf_counter() - start)
+
+        start = time.perf_counter()
+        table.to_pandas()
+        to_pandas.append(time.perf_counter() - start)
+
+    metadata = pq.read_metadata(pa.BufferReader(data))
+    result = {
+        'dataset': dataset,
+        'profile': profile_name,
+        'rows': len(df),
+        'bytes': data.size,
+        'row_groups': metadata.num_row_groups,
+        'encode_seconds': round(_median(encode), 4),
+        'decode_seconds': round(_median(decode), 4),
+        'to_pandas_seconds': round(_median(to_pandas), 4)
+    }
+
+    logger.info(
+        f"{dataset} [{profile_name}]: {result['bytes'] / 2**20:.2f} MB | "
+        f"escrita {result['encode_seconds']:.3f}s | leitura {result['decode_seconds']:.3f}s | "
+        f"pandas {result['to_pandas_seconds']:.3f}s | {result['row_groups']} row groups"
+    )
+    return result
+
+
+def _median(values: List[float]) -> float:
+    return sorted(values)[len(values) // 2]
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Compara os perfis de escrita do parquet com os CSVs reais do diretório de dados.
+
+    Os CSVs são validados uma vez (como em `DataSource.transform_data`) e cada
+    perfil grava e lê os mesmos DataFrames em memória, sem Azure nem Banco.
+
+    Exemplo:
+        python -m src.benchmarks.parquet_profiles --profiles default small-size --runs 5
+
+    Args:
+        argv (Optional[List[str]]): Argumentos da linha de comando (padrão: `sys.argv`).
+    """
+    parser = argparse.ArgumentParser(description='Compara os perfis de escrita do parquet.')
+    parser.add_argument('--profiles', nargs='+', default=list(WRITE_PROFILES), choices=list(WRITE_PROFILES))
+    parser.add_argument('--datasets', nargs='+', default=None, help='Arquivos a comparar (padrão: todos).')
+    parser.add_argument('--data-path', default=None, help='Diretório dos CSVs (padrão: o da DataSource).')
+    parser.add_argument('--runs', type=int, default=3, help='Execuções de cada medição.')
+    parser.add_argument('--output', default='parquet_profiles.json', help='Arquivo JSON com os resultados.')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s | %(name)s | %(levelname)s | %(message)s'
+    )
+
+    source = DataSource()
+    if args.data_path:
+        source.file_path = args.data_path
+
+    files = [file for file in source.extract_data() if not args.datasets or Path(file).stem in args.datasets]
+    data = source.transform_data(files)
+
+    results = []
+    for dataset, df in data.items():
+        for profile_name in args.profiles:
+            results.append(measure_profile(df, dataset, profile_name, args.runs))
+
+    report = {
+        'created_at': datetime.now().isoformat(),
+        'runs': args.runs,
+        'profiles': {name: WRITE_PROFILES[name] for name in args.profiles},
+        'results': results
+    }
+
+    with open(args.output, 'w') as output:
+        json.dump(report, output, indent=2)
+
+    logger.info(f'{len(results)} medições salvas em {args.output}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,262 @@
+import os
+import sys
+import json
+import time
+import shutil
+import argparse
+import platform
+import logging
+import subprocess
+
+from functools import partial
+from typing import Callable, Dict, List, Optional, Any
+from datetime import datetime
+from pathlib import Path
+
+from src.benchmarks.data_generator import generate_dataset
+from src.metrics.run_metrics import PeakRss
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+STARTUP_COMMANDS = {
+    'python': ['-c', 'pass'],
+    'cli_help': ['-m', 'src.cli', '--help'],
+    'cli_status': ['-m', 'src.cli', 'status'],
+    'import_controller': ['-c', 'import src.controllers.controller'],
+    'import_data_source': ['-c', 'import src.data_source.csv_data_source'],
+    'build_controller': ['-c', 'from src.controllers.controller import Controller; Controller()']
+}
+
+
+def measure_stage(
+    results: List[Dict[str, Any]],
+    size: int,
+    pipeline: str,
+    stage: str,
+    function: Callable[[], Any],
+    rows: int,
+    data_bytes: Optional[Callable[[], int]] = None
+) -> Any:
+    """
+    Executa uma etapa da pipeline e registra tempo, vazão e pico de memória.
+
+    Args:
+        results (List[Dict]): Lista onde o resultado é adicionado.
+        size (int): Quantidade de encontros do cenário.
+        pipeline (str): Pipeline da etapa ('data_source' ou 'controller').
+        stage (str): Nome da etapa (ex: 'transform').
+        function (Callable): Etapa a ser executada.
+        rows (int): Quantidade de linhas processadas na etapa.
+        data_bytes (Optional[Callable]): Função que retorna os bytes processados na etapa.
+
+    Returns:
+        Any: Retorno da etapa.
+    """
+    with PeakRss() as rss:
+        cpu_start = time.process_time()
+        start = time.perf_counter()
+        output = function()
+        seconds = time.perf_counter() - start
+        cpu_seconds = time.process_time() - cpu_start
+
+    stage_bytes = data_bytes() if data_bytes else 0
+    result = {
+        'size': size,
+        'pipeline': pipeline,
+        'stage': stage,
+        'seconds': round(seconds, 4),
+        'cpu_seconds': round(cpu_seconds, 4),
+        'rows': rows,
+        'bytes': stage_bytes,
+        'rows_per_s': round(rows / seconds, 1) if seconds else None,
+        'mb_per_s': round(stage_bytes / 2**20 / seconds, 2) if seconds and stage_bytes else None,
+        'peak_rss_mb': round(rss.peak / 2**20, 1)
+    }
+    results.append(result)
+
+    logger.info(
+        f"[{size}] {pipeline}.{stage}: {seconds:.2f}s | {result['rows_per_s']} linhas/s | "
+        f"{result['mb_per_s']} MB/s | pico {result['peak_rss_mb']} MB"
+    )
+    return output
+
+
+def run_size(size: int, args: argparse.Namespace, results: List[Dict[str, Any]]) -> None:
+    """
+    Gera os dados de um cenário e mede cada etapa de `DataSource.start` e `Controller.start`.
+
+    O cache de validação e o registro de uploads ficam desligados para que todos os
+    arquivos sejam processados e enviados em toda execução.
+
+    Args:
+        size (int): Quantidade de encontros.
+        args (argparse.Namespace): Argumentos da linha de comando.
+        results (List[Dict]): Lista onde os resultados são adicionados.
+    """
+    from src.cloud.manifest import read_index
+    from src.controllers.controller import Controller
+    from src.data_source.csv_data_source import DataSource
+
+    data_dir = Path(args.work_dir) / str(size)
+    sizes = measure_stage(
+        results, size, 'generator', 'generate', lambda: generate_dataset(str(data_dir), size, args.seed), size
+    )
+    total_rows = sum(sizes.values())
+    csv_bytes = sum(file.stat().st_size for file in data_dir.glob('*.csv'))
+
+    source = DataSource()
+    source.file_path = str(data_dir)
+    source.staging_path = str(Path(args.work_dir) / 'staging')
+    source.validation_cache = None
+    source.upload_ledger = None
+
+    transform_function = source.transform_modes[args.transform_mode]
+    load_function = source.load_data if args.transform_mode == 'default' else source.load_files
+
+    files = measure_stage(results, size, 'data_source', 'extract', source.extract_data, total_rows, lambda: csv_bytes)
+    transformed = measure_stage(
+        results, size, 'data_source', 'transform', partial(transform_function, files), total_rows, lambda: csv_bytes
+    )
+    measure_stage(results, size, 'data_source', 'load', partial(load_function, transformed), total_rows, lambda: csv_bytes)
+    del transformed
+
+    controller = Controller()
+    controller.download_path = str(Path(args.work_dir) / 'downloads')
+
+    def parquet_bytes() -> int:
+        return sum(manifest['size'] for name, manifest in (read_index(controller.cloud) or {}).items() if name in sizes)
+
+    measure_stage(results, size, 'controller', 'create_tables', lambda: (
+        controller.db.drop_tables(), controller.db.create_tables()
+    ), 0)
+
+    extract_function = controller.extract_modes[args.extract_mode]
+    extracted = measure_stage(results, size, 'controller', 'extract', extract_function, total_rows, parquet_bytes)
+
+    if args.extract_mode == 'memory':
+        transform_function = partial(
+            controller.transform_data_from_memory, extracted,
+            to_pandas=args.load_mode not in controller.arrow_load_modes
+        )
+    else:
+        transform_function = controller.transform_data
+
+    transformed = measure_stage(results, size, 'controller', 'transform', transform_function, total_rows, parquet_bytes)
+    del extracted, transform_function
+
+    load_function = partial(controller.load_modes[args.load_mode], transformed)
+    measure_stage(results, size, 'controller', 'load', load_function, total_rows, parquet_bytes)
+    del transformed, load_function
+
+    shutil.rmtree(controller.download_path, ignore_errors=True)
+    if not args.keep_data:
+        shutil.rmtree(data_dir, ignore_errors=True)
+
+
+def measure_startup(results: List[Dict[str, Any]], runs: int) -> None:
+    """
+    Mede o tempo de início de processos novos: interpretador, CLI e import dos módulos da pipeline.
+
+    Cada comando roda `runs` vezes em um subprocesso e o resultado é a mediana.
+    'build_controller' mede o `Controller()` sem criar conexões com a Azure ou o Banco.
+
+    Args:
+        results (List[Dict]): Lista onde os resultados são adicionados.
+        runs (int): Quantidade de execuções de cada comando.
+    """
+    for stage, command in STARTUP_COMMANDS.items():
+        timings = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            subprocess.run([sys.executable, *command], capture_output=True, check=True)
+            timings.append(time.perf_counter() - start)
+
+        seconds = sorted(timings)[len(timings) // 2]
+        results.append({
+            'size': 0,
+            'pipeline': 'startup',
+            'stage': stage,
+            'seconds': round(seconds, 4),
+            'runs': runs
+        })
+        logger.info(f'startup.{stage}: {seconds * 1000:.0f} ms (mediana de {runs})')
+
+
+def _git_commit() -> Optional[str]:
+    """
+    Retorna o commit atual do repositório, se disponível.
+
+    Returns:
+        Optional[str]: Hash do commit.
+    """
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """
+    Roda os benchmarks e grava os resultados em JSON.
+
+    Usa a Azure (ou o Azurite, via `AZURE_STORAGE_CONNECTION_STRING`) e o
+    PostgreSQL configurados no `.env`.
+
+    Exemplo:
+        python -m src.benchmarks.run_benchmarks --sizes 10000 100000 --output benchmarks.json
+
+    Args:
+        argv (Optional[List[str]]): Argumentos da linha de comando (padrão: `sys.argv`).
+    """
+    parser = argparse.ArgumentParser(description='Benchmarks da pipeline de dados do hospital.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES, help='Quantidade de encontros por cenário.')
+    parser.add_argument('--transform-mode', default='streaming', choices=['default', 'streaming', 'parallel'])
+    parser.add_argument('--extract-mode', default='memory', choices=['sync', 'async', 'memory'])
+    parser.add_argument('--load-mode', default='copy', choices=['pandas', 'orm', 'copy', 'parallel'])
+    parser.add_argument('--work-dir', default='src/temp_benchmarks', help='Diretório dos dados gerados.')
+    parser.add_argument('--output', default='benchmark_results.json', help='Arquivo JSON com os resultados.')
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--keep-data', action='store_true', help='Mantém os CSVs gerados.')
+    parser.add_argument('--startup-runs', type=int, default=5, help='Execuções de cada medição de início (0 desliga).')
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s | %(name)s | %(levelname)s | %(message)s'
+    )
+    logging.getLogger('azure').setLevel(logging.WARNING)
+
+    results = []
+    started_at = datetime.now().isoformat()
+
+    try:
+        if args.startup_runs:
+            measure_startup(results, args.startup_runs)
+
+        for size in args.sizes:
+            run_size(size, args, results)
+
+    finally:
+        report = {
+            'started_at': started_at,
+            'finished_at': datetime.now().isoformat(),
+            'git_commit': _git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': os.cpu_count(),
+            'config': {key: value for key, value in vars(args).items() if key != 'output'},
+            'results': results
+        }
+
+        with open(args.output, 'w') as output:
+            json.dump(report, output, indent=2)
+
+        logger.info(f'{len(results)} medições salvas em {args.output}')
+
+
+if __name__ == '__main__':
+    main(sys.argv[1:])
@@ -0,0 +1,307 @@
+import os
+import sys
+import json
+import argparse
+import logging
+
+from typing import Dict, List, Optional, Any
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+TRANSFORM_MODES = ['default', 'streaming', 'parallel']
+LOAD_MODES = ['pandas', 'orm', 'copy', 'parallel']
+EXTRACT_MODES = ['sync', 'async', 'memory']
+EXECUTORS = ['phased', 'pipelined']
+INCREMENTAL_MODES = ['upsert', 'incremental']
+
+
+def ingest(args: argparse.Namespace) -> int:
+    """
+    Roda a pipeline de ingestão: CSV -> validação -> parquet no armazenamento.
+
+    Args:
+        args (argparse.Namespace): Argumentos do subcomando.
+
+    Returns:
+        int: Código de saída.
+    """
+    from src.data_source.csv_data_source import DataSource
+
+    DataSource(validation_backend=args.validation_backend).start(
+        transform_mode=args.transform_mode, profile=args.profile, resume=args.resume
+    )
+    return 0
+
+
+def load(args: argparse.Namespace) -> int:
+    """
+    Roda a pipeline de carga: parquet no armazenamento -> PostgreSQL.
+
+    Args:
+        args (argparse.Namespace): Argumentos do subcomando.
+
+    Returns:
+        int: Código de saída.
+    """
+    from src.controllers.controller import Controller
+
+    controller = Controller()
+    if args.incremental:
+        controller.start_incremental(method=args.incremental, profile=args.profile)
+    else:
+        controller.start(
+            load_mode=args.load_mode, extract_mode=args.extract_mode, profile=args.profile,
+            resume=args.resume, executor=args.executor
+        )
+    return 0
+
+
+def run(args: argparse.Namespace) -> int:
+    """
+    Roda a ingestão e depois a carga.
+
+    Args:
+        args (argparse.Namespace): Argumentos do subcomando.
+
+    Returns:
+        int: Código de saída.
+    """
+    ingest(args)
+    return load(args)
+
+
+def status(args: argparse.Namespace) -> int:
+    """
+    Mostra a configuração, a última execução de cada pipeline, os últimos uploads e os checkpoints.
+
+    Lê apenas arquivos locais (relatórios de métricas e registro de uploads), sem
+    importar pandas/pyarrow nem conectar na Azure ou no Banco. Com `--db`, também
+    consulta a tabela `pipeline_state`.
+
+    Args:
+        args (argparse.Namespace): Argumentos do subcomando.
+
+    Returns:
+        int: Código de saída.
+    """
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+    report_path = Path(os.getenv('METRICS_REPORT_PATH', 'src/metrics_reports'))
+    ledger_path = os.getenv('UPLOAD_LEDGER_PATH', 'src/.upload_ledger.json')
+    checkpoint_path = os.getenv('CHECKPOINT_PATH', 'src/.checkpoints')
+
+    info = {
+        'config': {
+            'storage_backend': os.getenv('STORAGE_BACKEND', 'azure'),
+            'validation_backend': os.getenv('VALIDATION_BACKEND', 'pandera'),
+            'metrics_enabled': os.getenv('METRICS_ENABLED', 'false').lower() == 'true',
+            'metrics_report_path': str(report_path)
+        },
+        'last_runs': _last_runs(report_path),
+        'uploads': _read_json(Path(ledger_path)) if ledger_path else {},
+        'checkpoints': _checkpoints(Path(checkpoint_path)) if checkpoint_path else {}
+    }
+
+    if args.db:
+        from src.database.db_connection import DataBase
+
+        info['pipeline_state'] = {
+            name: {key: str(value) for key, value in state.items()}
+            for name, state in DataBase().get_pipeline_state().items()
+        }
+
+    if args.json:
+        print(json.dumps(info, indent=2, default=str))
+        return 0
+
+    print('Configuração:')
+    for key, value in info['config'].items():
+        print(f'  {key}: {value}')
+
+    print('Últimas execuções:')
+    for pipeline, report in info['last_runs'].items():
+        print(f"  {pipeline}: {report['status']} em {report['finished_at']} ({report['seconds']:.2f}s)")
+    if not info['last_runs']:
+        print('  nenhuma execução registrada')
+
+    print('Últimos uploads:')
+    for name, entry in info['uploads'].items():
+        print(f"  {name}: {entry.get('blob_name')} ({entry.get('uploaded_at')})")
+    if not info['uploads']:
+        print('  nenhum upload registrado')
+
+    print('Checkpoints:')
+    for pipeline, checkpoint in info['checkpoints'].items():
+        print(f"  {pipeline}: {checkpoint['status']} (início {checkpoint['started_at']})")
+        for name, stages in checkpoint['datasets'].items():
+            print(f"    {name}: {', '.join(stages)}")
+    if not info['checkpoints']:
+        print('  nenhum checkpoint registrado')
+
+    if 'pipeline_state' in info:
+        print('Estado no Banco:')
+        for name, state in info['pipeline_state'].items():
+            print(f"  {name}: {state['blob_name']} ({state['row_count']} linhas)")
+
+    return 0
+
+
+def _last_runs(report_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Retorna o resumo do relatório mais recente de cada pipeline.
+
+    Args:
+        report_path (Path): Diretório dos relatórios de `RunMetrics`.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: {'pipeline': {'status', 'finished_at', 'seconds', 'report'}}.
+    """
+    last_runs = {}
+    for report_file in sorted(report_path.glob('*.json')):
+        report = _read_json(report_file)
+        if 'pipeline' not in report:
+            continue
+
+        last_runs[report['pipeline']] = {
+            'status': report.get('status'),
+            'finished_at': report.get('finished_at'),
+            'seconds': report.get('seconds', 0),
+            'report': str(report_file)
+        }
+
+    return last_runs
+
+
+def _checkpoints(checkpoint_path: Path) -> Dict[str, Dict[str, Any]]:
+    """
+    Retorna o resumo dos checkpoints de cada pipeline (ver `CheckpointStore`).
+
+    Args:
+        checkpoint_path (Path): Diretório dos checkpoints.
+
+    Returns:
+        Dict[str, Dict[str, Any]]: {'pipeline': {'status', 'started_at', 'datasets': {'arquivo': [etapas]}}}.
+    """
+    checkpoints = {}
+    for checkpoint_file in sorted(checkpoint_path.glob('*.json')):
+        state = _read_json(checkpoint_file)
+        run = state.get('run') or {}
+
+        checkpoints[checkpoint_file.stem] = {
+            'status': run.get('status'),
+            'started_at': run.get('started_at'),
+            'datasets': {name: list(stages) for name, stages in (state.get('datasets') or {}).items()}
+        }
+
+    return checkpoints
+
+
+def _read_json(path: Path) -> Dict[str, Any]:
+    """
+    Lê um arquivo JSON, vazio se ele não existir ou estiver inválido.
+
+    Args:
+        path (Path): Caminho do arquivo.
+
+    Returns:
+        Dict[str, Any]: Conteúdo do arquivo.
+    """
+    try:
+        with open(path) as f:
+            return json.load(f)
+
+    except (OSError, json.JSONDecodeError):
+        return {}
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """
+    Monta o parser da linha de comando.
+
+    Returns:
+        argparse.ArgumentParser: Parser com os subcomandos 'ingest', 'load', 'run' e 'status'.
+    """
+    parser = argparse.ArgumentParser(prog='hospital-pipeline', description='Pipeline de dados do hospital.')
+    parser.add_argument('--log-level', default='INFO', help='Nível de log (ex: INFO, WARNING).')
+    subparsers = parser.add_subparsers(dest='command', required=True)
+
+    ingest_options = argparse.ArgumentParser(add_help=False)
+    ingest_options.add_argument('--transform-mode', default='default', choices=TRANSFORM_MODES)
+    ingest_options.add_argument('--validation-backend', choices=['pandera', 'arrow'], default=None)
+
+    load_options = argparse.ArgumentParser(add_help=False)
+    load_options.add_argument('--load-mode', default='pandas', choices=LOAD_MODES)
+    load_options.add_argument('--extract-mode', default='sync', choices=EXTRACT_MODES)
+    load_options.add_argument(
+        '--executor', default='phased', choices=EXECUTORS,
+        help="'pipelined' baixa, lê e carrega cada arquivo de forma independente."
+    )
+    load_options.add_argument(
+        '--incremental', choices=INCREMENTAL_MODES, default=None,
+        help='Aplica só os snapshots novos, sem recriar as tabelas.'
+    )
+
+    run_options = argparse.ArgumentParser(add_help=False)
+    run_options.add_argument(
+        '--profile', action='store_true', default=None, help='Grava cProfile e tracemalloc por etapa.'
+    )
+    run_options.add_argument(
+        '--resume', action='store_true',
+        help='Retoma a última execução pelos checkpoints, pulando o que já foi concluído.'
+    )
+
+    subparsers.add_parser(
+        'ingest', parents=[ingest_options, run_options], help='CSV -> parquet no armazenamento.'
+    ).set_defaults(function=ingest)
+    subparsers.add_parser(
+        'load', parents=[load_options, run_options], help='Parquet no armazenamento -> PostgreSQL.'
+    ).set_defaults(function=load)
+    subparsers.add_parser(
+        'run', parents=[ingest_options, load_options, run_options], help='Ingestão seguida da carga.'
+    ).set_defaults(function=run)
+
+    status_parser = subparsers.add_parser('status', help='Última execução, uploads, checkpoints e configuração.')
+    status_parser.add_argument('--db', action='store_true', help='Também consulta o estado no Banco.')
+    status_parser.add_argument('--json', action='store_true', help='Saída em JSON.')
+    status_parser.set_defaults(function=status)
+
+    return parser
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """
+    Ponto de entrada do comando `hospital-pipeline`.
+
+    Os módulos pesados (pandas, pyarrow, SQLAlchemy, Azure) só são importados
+    dentro do subcomando que precisa deles.
+
+    Exemplo:
+        hospital-pipeline run --transform-mode streaming --load-mode copy --extract-mode memory
+        hospital-pipeline load --load-mode copy --executor pipelined
+
+    Args:
+        argv (Optional[List[str]]): Argumentos da linha de comando (padrão: `sys.argv`).
+
+    Returns:
+        int: Código de saída.
+    """
+    args = build_parser().parse_args(argv)
+
+    logging.basicConfig(
+        level=args.log_level.upper(),
+        format='%(asctime)s | %(name)s | %(levelname)s | %(message)s'
+    )
+
+    try:
+        return args.function(args)
+
+    except Exception as e:
+        logger.error(f'Erro ao rodar {args.command}: {str(e)}')
+        return 1
+
+
+if __name__ == '__main__':
+    sys.exit(main())
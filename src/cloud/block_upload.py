@@ -0,0 +1,139 @@
+import base64
+import logging
+import threading
+
+from typing import Optional, Dict, List
+from concurrent.futures import ThreadPoolExecutor, Future
+
+from azure.storage.blob import BlobClient
+
+logger = logging.getLogger(__name__)
+
+
+class BlockBlobWriter:
+    """
+    Arquivo para escrita que envia o conteúdo para um block blob enquanto ele é gerado.
+
+    O que é escrito (ex: pelo `pq.ParquetWriter`) é cortado em blocos de `block_size`
+    bytes, enviados em paralelo com `stage_block`. Ao sair do `with` sem erro, a
+    lista de blocos é confirmada com `commit_block_list` e o blob aparece de uma vez,
+    com os metadados. Se houver erro, a lista não é confirmada e o blob anterior
+    continua valendo (a Azure descarta os blocos não confirmados).
+
+    A memória fica limitada a `block_size * (max_concurrency + 1)`: `write` espera
+    quando já há `max_concurrency` blocos sendo enviados.
+    """
+
+    def __init__(
+        self,
+        blob_client: BlobClient,
+        block_size: int,
+        max_concurrency: int,
+        metadata: Optional[Dict[str, str]] = None
+    ):
+        self.blob_client = blob_client
+        self.block_size = block_size
+        self.metadata = metadata
+
+        self._buffer = bytearray()
+        self._block_ids: List[str] = []
+        self._position = 0
+        self._error: Optional[BaseException] = None
+        self._slots = threading.BoundedSemaphore(max_concurrency)
+        self._executor = ThreadPoolExecutor(max_workers=max_concurrency, thread_name_prefix='stage_block')
+        self._futures: List[Future] = []
+
+    def __enter__(self) -> 'BlockBlobWriter':
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        try:
+            if not exc_type:
+                self._commit()
+
+        finally:
+            self._executor.shutdown(wait=True, cancel_futures=True)
+            self._buffer = bytearray()
+
+    def write(self, data: bytes) -> int:
+        """
+        Adiciona conteúdo ao blob, enviando cada bloco completo.
+
+        Args:
+            data (bytes): Conteúdo a ser escrito.
+
+        Returns:
+            int: Quantidade de bytes escritos.
+        """
+        self._raise_error()
+
+        self._buffer += data
+        self._position += len(data)
+
+        while len(self._buffer) >= self.block_size:
+            block = bytes(self._buffer[:self.block_size])
+            del self._buffer[:self.block_size]
+            self._stage(block)
+
+        return len(data)
+
+    def tell(self) -> int:
+        return self._position
+
+    def writable(self) -> bool:
+        return True
+
+    def flush(self) -> None:
+        return None
+
+    def close(self) -> None:
+        """Não faz nada: o blob só é confirmado ao sair do `with`."""
+        return None
+
+    @property
+    def closed(self) -> bool:
+        return False
+
+    def _stage(self, block: bytes) -> None:
+        """
+        Envia um bloco em segundo plano, esperando uma vaga se todas estiverem ocupadas.
+
+        Args:
+            block (bytes): Conteúdo do bloco.
+        """
+        self._slots.acquire()
+        self._raise_error()
+
+        block_id = base64.b64encode(f'{len(self._block_ids):08d}'.encode()).decode()
+        self._block_ids.append(block_id)
+        self._futures.append(self._executor.submit(self._stage_block, block_id, block))
+
+    def _stage_block(self, block_id: str, block: bytes) -> None:
+        try:
+            self.blob_client.stage_block(block_id=block_id, data=block, length=len(block))
+
+        except BaseException as e:
+            self._error = self._error or e
+            raise
+
+        finally:
+            self._slots.release()
+
+    def _commit(self) -> None:
+        """Envia o último bloco, espera todos os envios e confirma a lista de blocos."""
+        if self._buffer:
+            self._stage(bytes(self._buffer))
+            self._buffer = bytearray()
+
+        for future in self._futures:
+            future.result()
+
+        self.blob_client.commit_block_list(self._block_ids, metadata=self.metadata)
+        logger.info(
+            f'{self.blob_client.blob_name} enviado em {len(self._block_ids)} blocos ({self._position} bytes).'
+        )
+
+    def _raise_error(self) -> None:
+        if self._error is not None:
+            raise self._error
+
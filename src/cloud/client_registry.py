@@ -0,0 +1,314 @@
+import os
+import atexit
+import asyncio
+import logging
+import tempfile
+import threading
+import requests
+
+from dotenv import load_dotenv
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Coroutine, Dict, Optional, Any, Tuple
+
+from azure.core.credentials import AccessToken
+from azure.core.pipeline.transport import RequestsTransport
+from azure.identity import ClientSecretCredential, TokenCachePersistenceOptions
+from azure.storage.blob import BlobServiceClient
+from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_session: Optional[requests.Session] = None
+_credentials: Dict[Tuple[str, str], ClientSecretCredential] = {}
+_service_clients: Dict[str, BlobServiceClient] = {}
+_loop: Optional[asyncio.AbstractEventLoop] = None
+_async_service_clients: Dict[str, AsyncBlobServiceClient] = {}
+
+
+def get_session() -> requests.Session:
+    """
+    Retorna a sessão HTTP do processo, com o pool de conexões compartilhado por todos os clientes.
+
+    O tamanho do pool vem de `AZURE_POOL_SIZE` (padrão: 16).
+
+    Returns:
+        requests.Session: Sessão compartilhada.
+    """
+    global _session
+
+    with _lock:
+        if _session is None:
+            load_dotenv()
+            pool_size = int(os.getenv('AZURE_POOL_SIZE', 16))
+
+            adapter = requests.adapters.HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+            _session = requests.Session()
+            _session.mount('https://', adapter)
+            _session.mount('http://', adapter)
+
+        return _session
+
+
+def get_credential(tenant_id: str, client_id: str, client_secret: str) -> ClientSecretCredential:
+    """
+    Retorna a credencial do processo para um app registration, criando na primeira chamada.
+
+    Os tokens ficam em um cache persistente e criptografado (`msal-extensions`:
+    DPAPI no Windows, Keychain no macOS, libsecret no Linux), então execuções
+    seguidas reutilizam o token até ele expirar. Se o sistema não tiver onde
+    criptografar o cache, o token fica só em memória, a não ser que
+    `AZURE_TOKEN_CACHE_ALLOW_UNENCRYPTED=true`. `AZURE_TOKEN_CACHE=false` desliga
+    o cache em disco.
+
+    Args:
+        tenant_id (str): Tenant da Azure.
+        client_id (str): Client ID do app registration.
+        client_secret (str): Segredo do app registration.
+
+    Returns:
+        ClientSecretCredential: Credencial compartilhada.
+    """
+    key = (tenant_id, client_id)
+
+    with _lock:
+        credential = _credentials.get(key)
+        if credential is None:
+            credential = _credentials[key] = _build_credential(tenant_id, client_id, client_secret)
+
+        return credential
+
+
+def _build_credential(tenant_id: str, client_id: str, client_secret: str) -> ClientSecretCredential:
+    """
+    Cria a credencial com o cache de tokens persistente, se disponível.
+
+    Args:
+        tenant_id (str): Tenant da Azure.
+        client_id (str): Client ID do app registration.
+        client_secret (str): Segredo do app registration.
+
+    Returns:
+        ClientSecretCredential: Credencial criada.
+    """
+    load_dotenv()
+
+    options = {'tenant_id': tenant_id, 'client_id': client_id, 'client_secret': client_secret}
+
+    if os.getenv('AZURE_TOKEN_CACHE', 'true').lower() != 'true':
+        return ClientSecretCredential(**options)
+
+    allow_unencrypted = os.getenv('AZURE_TOKEN_CACHE_ALLOW_UNENCRYPTED', 'false').lower() == 'true'
+    if not allow_unencrypted and not _encryption_available():
+        return ClientSecretCredential(**options)
+
+    persistence = TokenCachePersistenceOptions(
+        name=os.getenv('AZURE_TOKEN_CACHE_NAME', 'hospital_pipeline'),
+        allow_unencrypted_storage=allow_unencrypted
+    )
+    return ClientSecretCredential(**options, cache_persistence_options=persistence)
+
+
+def _encryption_available() -> bool:
+    """
+    Confere se o sistema consegue criptografar o cache de tokens.
+
+    A `ClientSecretCredential` só descobre isso no primeiro `get_token`, e falha a
+    autenticação; aqui a verificação é feita antes de criar a credencial.
+
+    Returns:
+        bool: True se o cache criptografado pode ser usado.
+    """
+    try:
+        from msal_extensions import build_encrypted_persistence
+
+        build_encrypted_persistence(os.path.join(tempfile.gettempdir(), 'hospital_pipeline_token_probe'))
+        return True
+
+    except Exception as e:
+        logger.warning(f'Cache de tokens criptografado indisponível, usando cache em memória: {str(e).splitlines()[0]}')
+        return False
+
+
+def get_blob_service_client(
+    connection_string: Optional[str] = None,
+    account_url: Optional[str] = None,
+    credential: Optional[ClientSecretCredential] = None
+) -> BlobServiceClient:
+    """
+    Retorna o cliente do Blob Storage do processo para uma conta, criando na primeira chamada.
+
+    Todos os clientes usam a mesma sessão HTTP (`get_session`), então as conexões
+    TLS abertas por um componente são reutilizadas pelos demais.
+
+    Args:
+        connection_string (Optional[str]): Connection string da conta (ex: Azurite).
+        account_url (Optional[str]): URL da conta, usada com `credential`.
+        credential (Optional[ClientSecretCredential]): Credencial de `get_credential`.
+
+    Returns:
+        BlobServiceClient: Cliente compartilhado.
+    """
+    key = connection_string or account_url
+    session = get_session()
+
+    with _lock:
+        client = _service_clients.get(key)
+        if client is None:
+            transport = RequestsTransport(session=session, session_owner=False)
+            if connection_string:
+                client = BlobServiceClient.from_connection_string(connection_string, transport=transport)
+            else:
+                client = BlobServiceClient(account_url=account_url, credential=credential, transport=transport)
+
+            _service_clients[key] = client
+
+        return client
+
+
+class AsyncTokenCredential:
+    """
+    Credencial assíncrona que reutiliza o token da credencial síncrona compartilhada.
+
+    Uma credencial assíncrona própria guardaria outro token, pedido de novo a cada
+    event loop. Esta apenas delega para a credencial síncrona, que já guarda o
+    token em cache.
+    """
+
+    def __init__(self, credential: ClientSecretCredential):
+        self.credential = credential
+
+    async def get_token(self, *scopes: str, **kwargs: Any) -> AccessToken:
+        return await asyncio.to_thread(self.credential.get_token, *scopes, **kwargs)
+
+    async def close(self) -> None:
+        return None
+
+    async def __aenter__(self) -> 'AsyncTokenCredential':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+
+def run_async(coroutine: Coroutine) -> Any:
+    """
+    Roda uma corrotina no event loop do processo e espera o resultado.
+
+    O loop fica em uma thread própria e dura o processo inteiro, então os clientes
+    assíncronos (`async_blob_service_client`) e as conexões TLS da sessão
+    aiohttp deles são reutilizados entre as chamadas, o que um `asyncio.run` por
+    chamada não permite. Não deve ser chamada de dentro do próprio loop.
+
+    Args:
+        coroutine (Coroutine): Corrotina a ser executada.
+
+    Returns:
+        Any: Resultado da corrotina.
+    """
+    global _loop
+
+    with _lock:
+        if _loop is None:
+            _loop = asyncio.new_event_loop()
+            threading.Thread(target=_loop.run_forever, name='azure_async', daemon=True).start()
+        loop = _loop
+
+    return asyncio.run_coroutine_threadsafe(coroutine, loop).result()
+
+
+@asynccontextmanager
+async def async_blob_service_client(
+    connection_string: Optional[str] = None,
+    account_url: Optional[str] = None,
+    credential: Optional[AsyncTokenCredential] = None
+) -> AsyncIterator[AsyncBlobServiceClient]:
+    """
+    Abre o cliente assíncrono do Blob Storage para uma conta.
+
+    No event loop de `run_async`, devolve o cliente do processo (criado na primeira
+    chamada), que continua aberto para as próximas. Em outro event loop, cria um
+    cliente só para o `async with`, já que a sessão aiohttp pertence a um loop.
+
+    Args:
+        connection_string (Optional[str]): Connection string da conta (ex: Azurite).
+        account_url (Optional[str]): URL da conta, usada com `credential`.
+        credential (Optional[AsyncTokenCredential]): Credencial usada na criação do cliente.
+
+    Returns:
+        AsyncIterator[AsyncBlobServiceClient]: Cliente a ser usado com `async with`.
+    """
+    def build() -> AsyncBlobServiceClient:
+        if connection_string:
+            return AsyncBlobServiceClient.from_connection_string(connection_string)
+        return AsyncBlobServiceClient(account_url=account_url, credential=credential)
+
+    if asyncio.get_running_loop() is not _loop:
+        async with build() as client:
+            yield client
+        return
+
+    key = connection_string or account_url
+    with _lock:
+        client = _async_service_clients.get(key)
+        if client is None:
+            client = _async_service_clients[key] = build()
+
+    yield client
+
+
+def clear_clients() -> None:
+    """Fecha e descarta os clientes compartilhados e para o event loop de `run_async`."""
+    global _session, _loop
+
+    with _lock:
+        loop, async_clients = _loop, list(_async_service_clients.values())
+        _loop = None
+        _async_service_clients.clear()
+
+        for client in _service_clients.values():
+            client.close()
+        for credential in _credentials.values():
+            credential.close()
+
+        _service_clients.clear()
+        _credentials.clear()
+
+        if _session is not None:
+            _session.close()
+            _session = None
+
+    if loop is not None:
+        async def close() -> None:
+            for client in async_clients:
+                await client.close()
+
+        try:
+            asyncio.run_coroutine_threadsafe(close(), loop).result(timeout=10)
+
+        except Exception as e:
+            logger.warning(f'Erro ao fechar os clientes assíncronos: {str(e)}')
+
+        loop.call_soon_threadsafe(loop.stop)
+
+
+def _forget_clients() -> None:
+    """
+    Descarta os clientes herdados por um processo filho após um `fork`, sem fechá-los.
+
+    As conexões e a thread do event loop pertencem ao processo pai (a thread nem
+    existe no filho), então o filho só esquece as referências e cria as próprias
+    no primeiro uso. O lock também é recriado, caso outra thread o segurasse no `fork`.
+    """
+    global _lock, _session, _loop
+
+    _lock = threading.Lock()
+    _session = None
+    _loop = None
+    _credentials.clear()
+    _service_clients.clear()
+    _async_service_clients.clear()
+
+
+atexit.register(clear_clients)
+os.register_at_fork(after_in_child=_forget_clients)
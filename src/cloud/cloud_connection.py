@@ -1,16 +1,24 @@
 import os
+import asyncio
 import logging
 
 from dotenv import load_dotenv
-from typing import Optional, List
+from typing import AsyncContextManager, Optional, List, Dict, Union, BinaryIO
 from pathlib import Path
 
-from azure.identity import ClientSecretCredential
-from azure.storage.blob import BlobServiceClient
+from azure.core.exceptions import ResourceNotFoundError
+from azure.storage.blob import BlobServiceClient, ContainerClient
+from azure.storage.blob.aio import BlobServiceClient as AsyncBlobServiceClient
+
+from src.cloud.storage import StorageBackend
+from src.cloud.block_upload import BlockBlobWriter
+from src.cloud.client_registry import (
+    AsyncTokenCredential, async_blob_service_client, get_blob_service_client, get_credential, run_async
+)
 
 logger = logging.getLogger(__name__)
 
-class AzureCloud:
+class AzureCloud(StorageBackend):
     """
     Responsável por fazer as conexões com a Azure.
     """
@@ -18,40 +26,62 @@ class AzureCloud:
     def __init__(self, container_name: Optional[str] = None):
         load_dotenv()
 
-        logging.basicConfig(
-            level=logging.INFO,
-            format='%(asctime)s | %(name)s | %(levelname)s | %(message)s'
-        )
-
         self.client_id = os.getenv('AZURE_CLIENT_ID')
         self.tenant_id = os.getenv('AZURE_TENANT_ID')
         self.client_secret = os.getenv('AZURE_CLIENT_SECRET')
         self.account_url = os.getenv('AZURE_ACCOUNT_URL')
         self.container_name = container_name or os.getenv('AZURE_CONTAINER_NAME')
+        self.connection_string = os.getenv('AZURE_STORAGE_CONNECTION_STRING')
+        self.max_downloads = int(os.getenv('AZURE_MAX_DOWNLOADS', 4))
+        self.max_concurrency = int(os.getenv('AZURE_MAX_CONCURRENCY', 4))
+        self.block_size = int(os.getenv('AZURE_BLOCK_SIZE', 8 * 1024 * 1024))
+
+        self.credentials = None
+        self._container_client = None
+
+    @property
+    def blob_service_client(self) -> BlobServiceClient:
+        """
+        Cliente da Azure compartilhado pelo processo (ver `client_registry.py`).
+
+        É buscado no primeiro uso, então construir a `AzureCloud` não cria credencial
+        nem conexão. `DataSource` e `Controller` recebem o mesmo cliente, com a
+        mesma sessão HTTP e o mesmo token.
 
+        Returns:
+            BlobServiceClient: Cliente síncrono do Blob Storage.
+        """
         try:
-            self.credentials = ClientSecretCredential(
-                client_id=self.client_id,
-                tenant_id=self.tenant_id,
-                client_secret=self.client_secret
-            )
+            if self.connection_string:
+                return get_blob_service_client(connection_string=self.connection_string)
+
+            self.credentials = get_credential(self.tenant_id, self.client_id, self.client_secret)
+            return get_blob_service_client(account_url=self.account_url, credential=self.credentials)
 
-            self.blob_service_client = BlobServiceClient(
-                account_url=self.account_url,
-                credential=self.credentials
-            )
-        
         except Exception as e:
             logger.error(f'Erro ao se conectar com a Azure: {str(e)}')
             raise
 
-    def upload_data(self, blob_name: str, data: bytes)-> None:
+    @property
+    def container_client(self) -> ContainerClient:
+        """Cliente do container, reutilizado por todas as operações."""
+        if self._container_client is None:
+            self._container_client = self.blob_service_client.get_container_client(self.container_name)
+        return self._container_client
+
+    def upload_data(
+        self,
+        blob_name: str,
+        data: Union[bytes, BinaryIO],
+        metadata: Optional[Dict[str, str]] = None
+    )-> None:
         """
         Faz o upload de arquivos na Azure.
         
         Args:
             blob_name (str): Nome do arquivo a ser salvo.
-            data (bytes): Conteúdo do arquivo a ser salvo.
+            data (bytes | BinaryIO): Conteúdo do arquivo a ser salvo, ou arquivo aberto para leitura em partes.
+            metadata (Optional[Dict[str, str]]): Metadados salvos junto com o arquivo (ex: {'content_hash': '...'}).
 
         Returns:
             None: Mensagem de sucesso, se erro, mensagem de erro.
@@ -59,18 +89,38 @@ class AzureCloud:
         logger.info('Iniciando Upload de Dados...')
 
         try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name,
-                blob=blob_name
-            )
+            blob_client = self.container_client.get_blob_client(blob_name)
 
-            blob_client.upload_blob(data=data, overwrite=True)
+            blob_client.upload_blob(
+                data=data, overwrite=True, metadata=metadata, max_concurrency=self.max_concurrency
+            )
             logger.info(f'{blob_client} arquivo salvo com sucesso.')
 
         except Exception as e:
             logger.error(f'Erro ao fazer upload de arquivos: {str(e)}')
             raise
 
+    def open_writer(
+        self,
+        blob_name: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> BlockBlobWriter:
+        """
+        Abre um blob para escrita em partes, enviando os blocos enquanto o arquivo é gerado.
+
+        Os blocos têm `AZURE_BLOCK_SIZE` bytes (padrão: 8 MB) e até `AZURE_MAX_CONCURRENCY`
+        são enviados ao mesmo tempo (ver `BlockBlobWriter`).
+
+        Args:
+            blob_name (str): Nome do arquivo a ser salvo.
+            metadata (Optional[Dict[str, str]]): Metadados salvos junto com o arquivo.
+
+        Returns:
+            BlockBlobWriter: Context manager com o arquivo aberto para escrita.
+        """
+        blob_client = self.container_client.get_blob_client(blob_name)
+        return BlockBlobWriter(blob_client, self.block_size, self.max_concurrency, metadata)
+
     def download_data(self, blob_name: str) -> bytes:
         """
         Faz o Download de arquivos da Azure.
@@ -84,10 +134,7 @@ class AzureCloud:
         logger.info('Iniciando Download de Arquivos...')
 
         try:
-            blob_client = self.blob_service_client.get_blob_client(
-                container=self.container_name,
-                blob=blob_name
-            )
+            blob_client = self.container_client.get_blob_client(blob_name)
 
             download_buffer = blob_client.download_blob()
             data = download_buffer.readall()
@@ -98,6 +145,50 @@ class AzureCloud:
             logger.error(f'Erro ao fazer o download de arquivos: {str(e)}')
             raise
 
+    def download_data_if_exists(self, blob_name: str) -> Optional[bytes]:
+        """
+        Faz o Download de um arquivo da Azure, sem erro se ele não existir.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser baixado.
+
+        Returns:
+            Optional[bytes]: Conteúdo binário do arquivo, ou None se ele não existir.
+        """
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+
+            return blob_client.download_blob().readall()
+
+        except ResourceNotFoundError:
+            return None
+
+        except Exception as e:
+            logger.error(f'Erro ao fazer o download de arquivos: {str(e)}')
+            raise
+
+    def get_blob_metadata(self, blob_name: str) -> Optional[Dict[str, str]]:
+        """
+        Retorna os metadados de um arquivo na Azure, sem baixar o conteúdo.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            Optional[Dict[str, str]]: Metadados do arquivo, ou None se ele não existir.
+        """
+        try:
+            blob_client = self.container_client.get_blob_client(blob_name)
+
+            return dict(blob_client.get_blob_properties().metadata)
+
+        except ResourceNotFoundError:
+            return None
+
+        except Exception as e:
+            logger.error(f'Erro ao buscar metadados do arquivo: {str(e)}')
+            raise
+
     def list_blob_files(self, blob_prefix: Optional[str] = None) -> List[Path]:
         """
         Lista os arquivos dentro do Container.
@@ -111,8 +202,7 @@ class AzureCloud:
         logger.info('Listando Arquivos...')
 
         try:
-            container_client = self.blob_service_client.get_container_client(self.container_name)
-            blobs = container_client.list_blobs(name_starts_with=blob_prefix)
+            blobs = self.container_client.list_blobs(name_starts_with=blob_prefix)
 
             blob_name = [blob.name for blob in blobs]
 
@@ -121,4 +211,89 @@ class AzureCloud:
         
         except Exception as e:
             logger.error(f'Erro ao listar arquivos: {str(e)}')
-            raise
\ No newline at end of file
+            raise
+
+    def download_many(
+        self,
+        blob_names: List[str],
+        max_downloads: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> Dict[str, bytes]:
+        """
+        Faz o Download de vários arquivos da Azure ao mesmo tempo.
+
+        Roda no event loop do processo (`run_async`), então as conexões abertas por
+        uma chamada são reutilizadas pelas seguintes.
+
+        Args:
+            blob_names (List[str]): Nomes dos arquivos a serem baixados.
+            max_downloads (Optional[int]): Quantidade de arquivos baixados ao mesmo tempo (padrão: `AZURE_MAX_DOWNLOADS`).
+            max_concurrency (Optional[int]): Conexões por arquivo para leitura em partes (padrão: `AZURE_MAX_CONCURRENCY`).
+
+        Returns:
+            Dict(str, bytes): Dicionário com {'nome do arquivo': conteúdo binário}.
+        """
+        return run_async(self.download_many_async(blob_names, max_downloads, max_concurrency))
+
+    async def download_many_async(
+        self,
+        blob_names: List[str],
+        max_downloads: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> Dict[str, bytes]:
+        """
+        Faz o Download assíncrono de vários arquivos da Azure.
+
+        Os downloads acontecem ao mesmo tempo, limitados por `max_downloads`, e cada
+        arquivo é lido em partes paralelas (`max_concurrency`).
+
+        Args:
+            blob_names (List[str]): Nomes dos arquivos a serem baixados.
+            max_downloads (Optional[int]): Quantidade de arquivos baixados ao mesmo tempo.
+            max_concurrency (Optional[int]): Conexões por arquivo para leitura em partes.
+
+        Returns:
+            Dict(str, bytes): Dicionário com {'nome do arquivo': conteúdo binário}.
+        """
+        logger.info(f'Iniciando Download Assíncrono de {len(blob_names)} Arquivos...')
+
+        semaphore = asyncio.Semaphore(max_downloads or self.max_downloads)
+        concurrency = max_concurrency or self.max_concurrency
+
+        try:
+            async with self._async_service_client() as service_client:
+                container_client = service_client.get_container_client(self.container_name)
+
+                async def download(blob_name: str) -> bytes:
+                    async with semaphore:
+                        blob_client = container_client.get_blob_client(blob_name)
+                        stream = await blob_client.download_blob(max_concurrency=concurrency)
+                        data = await stream.readall()
+
+                        logger.info(f'{blob_name} baixado ({len(data)} bytes).')
+                        return data
+
+                results = await asyncio.gather(*(download(blob_name) for blob_name in blob_names))
+
+            return dict(zip(blob_names, results))
+
+        except Exception as e:
+            logger.error(f'Erro ao fazer o download assíncrono de arquivos: {str(e)}')
+            raise
+
+    def _async_service_client(self) -> AsyncContextManager[AsyncBlobServiceClient]:
+        """
+        Abre o cliente assíncrono da Azure com as mesmas configurações do cliente síncrono.
+
+        Em `download_many`, é o cliente compartilhado do processo (ver
+        `async_blob_service_client`), que mantém as conexões abertas entre as
+        chamadas. A credencial usa o token da credencial síncrona compartilhada.
+
+        Returns:
+            AsyncContextManager[AsyncBlobServiceClient]: Cliente a ser usado com `async with`.
+        """
+        if self.connection_string:
+            return async_blob_service_client(connection_string=self.connection_string)
+
+        credential = AsyncTokenCredential(get_credential(self.tenant_id, self.client_id, self.client_secret))
+        return async_blob_service_client(account_url=self.account_url, credential=credential)
@@ -0,0 +1,281 @@
+import os
+import json
+import uuid
+import shutil
+import logging
+import pyarrow as pa
+
+from dotenv import load_dotenv
+from typing import Optional, List, Dict, Union, BinaryIO, Callable
+from pathlib import Path
+
+from src.cloud.storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+METADATA_DIR = '.metadata'
+TEMP_DIR = '.tmp'
+
+
+class LocalStorage(StorageBackend):
+    """
+    Armazenamento em um diretório local, com o mesmo contrato da `AzureCloud`.
+
+    As escritas vão para um arquivo temporário no mesmo disco e são publicadas com
+    `os.replace`, então um leitor nunca vê um arquivo pela metade. As leituras em
+    lote usam memory map: o parquet é lido direto do cache de páginas, sem cópia.
+    """
+
+    def __init__(self, root_path: Optional[str] = None):
+        load_dotenv()
+
+        self.root_path = Path(root_path or os.getenv('LOCAL_STORAGE_PATH', 'src/local_storage'))
+        self.root_path.mkdir(parents=True, exist_ok=True)
+
+    def upload_data(
+        self,
+        blob_name: str,
+        data: Union[bytes, BinaryIO],
+        metadata: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Salva um arquivo no diretório local.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser salvo (ex: 'encounters/encounters_2026-01-17T22:02:19.parquet').
+            data (bytes | BinaryIO): Conteúdo do arquivo, ou arquivo aberto para leitura em partes.
+            metadata (Optional[Dict[str, str]]): Metadados salvos junto com o arquivo.
+
+        Returns:
+            None: Mensagem de sucesso, se erro, mensagem de erro.
+        """
+        logger.info('Iniciando Upload de Dados...')
+
+        try:
+            path = self._path(blob_name)
+
+            with self._atomic_write(path) as file:
+                if isinstance(data, (bytes, bytearray, memoryview)):
+                    file.write(data)
+                else:
+                    shutil.copyfileobj(data, file)
+
+            self._write_metadata(blob_name, metadata)
+            logger.info(f'{blob_name} arquivo salvo com sucesso.')
+
+        except Exception as e:
+            logger.error(f'Erro ao fazer upload de arquivos: {str(e)}')
+            raise
+
+    def open_writer(
+        self,
+        blob_name: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> '_AtomicWriter':
+        """
+        Abre um arquivo para escrita em partes, publicado ao sair do `with` sem erro.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser salvo.
+            metadata (Optional[Dict[str, str]]): Metadados salvos junto com o arquivo.
+
+        Returns:
+            _AtomicWriter: Context manager com o arquivo aberto para escrita.
+        """
+        return self._atomic_write(self._path(blob_name), on_publish=lambda: self._write_metadata(blob_name, metadata))
+
+    def download_data(self, blob_name: str) -> bytes:
+        """
+        Lê um arquivo do diretório local.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser lido.
+
+        Returns:
+            bytes: Conteúdo binário do arquivo.
+        """
+        logger.info('Iniciando Download de Arquivos...')
+
+        try:
+            return self._path(blob_name).read_bytes()
+
+        except Exception as e:
+            logger.error(f'Erro ao fazer o download de arquivos: {str(e)}')
+            raise
+
+    def download_data_if_exists(self, blob_name: str) -> Optional[bytes]:
+        """
+        Lê um arquivo do diretório local, sem erro se ele não existir.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser lido.
+
+        Returns:
+            Optional[bytes]: Conteúdo binário do arquivo, ou None se ele não existir.
+        """
+        try:
+            return self._path(blob_name).read_bytes()
+
+        except FileNotFoundError:
+            return None
+
+    def get_blob_metadata(self, blob_name: str) -> Optional[Dict[str, str]]:
+        """
+        Retorna os metadados de um arquivo, sem ler o conteúdo.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            Optional[Dict[str, str]]: Metadados do arquivo, ou None se ele não existir.
+        """
+        if not self._path(blob_name).exists():
+            return None
+
+        try:
+            return json.loads(self._metadata_path(blob_name).read_text())
+
+        except FileNotFoundError:
+            return {}
+
+    def list_blob_files(self, blob_prefix: Optional[str] = None) -> List[str]:
+        """
+        Lista os arquivos do diretório local.
+
+        Args:
+            blob_prefix (Optional[str]): Prefixo dos arquivos (ex: 'encounters/').
+
+        Returns:
+            List[str]: Nome completo dos arquivos (ex: 'encounters/encounters_2026-01-17T22:02:19.parquet').
+        """
+        logger.info('Listando Arquivos...')
+
+        blob_names = []
+        for directory, directories, files in os.walk(self.root_path):
+            directories[:] = [name for name in directories if name not in (METADATA_DIR, TEMP_DIR)]
+
+            for file in files:
+                blob_name = (Path(directory) / file).relative_to(self.root_path).as_posix()
+                if not blob_prefix or blob_name.startswith(blob_prefix):
+                    blob_names.append(blob_name)
+
+        logger.info(f'{len(blob_names)} arquivos encontrados em: {blob_prefix}')
+        return sorted(blob_names)
+
+    def download_many(
+        self,
+        blob_names: List[str],
+        max_downloads: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> Dict[str, pa.Buffer]:
+        """
+        Mapeia vários arquivos em memória, sem copiar o conteúdo.
+
+        Os buffers podem ser lidos com `pq.read_table(pa.BufferReader(buffer))`.
+        `max_downloads` e `max_concurrency` existem apenas pelo contrato.
+
+        Args:
+            blob_names (List[str]): Nomes dos arquivos.
+            max_downloads (Optional[int]): Ignorado.
+            max_concurrency (Optional[int]): Ignorado.
+
+        Returns:
+            Dict(str, pa.Buffer): Dicionário com {'nome do arquivo': buffer mapeado em memória}.
+        """
+        logger.info(f'Mapeando {len(blob_names)} Arquivos em memória...')
+
+        try:
+            data = {}
+            for blob_name in blob_names:
+                with pa.memory_map(str(self._path(blob_name)), 'r') as file:
+                    data[blob_name] = file.read_buffer()
+
+            return data
+
+        except Exception as e:
+            logger.error(f'Erro ao mapear arquivos: {str(e)}')
+            raise
+
+    def _path(self, blob_name: str) -> Path:
+        """
+        Retorna o caminho local de um arquivo, sem permitir sair do diretório raiz.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            Path: Caminho do arquivo.
+        """
+        path = (self.root_path / blob_name).resolve()
+        if not path.is_relative_to(self.root_path.resolve()):
+            raise ValueError(f'Nome de arquivo inválido: {blob_name}')
+
+        return path
+
+    def _metadata_path(self, blob_name: str) -> Path:
+        """
+        Retorna o caminho do arquivo de metadados de um arquivo.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            Path: Caminho do JSON de metadados.
+        """
+        return self._path(f'{METADATA_DIR}/{blob_name}.json')
+
+    def _write_metadata(self, blob_name: str, metadata: Optional[Dict[str, str]]) -> None:
+        """
+        Salva os metadados de um arquivo, ou remove os anteriores se não houver.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+            metadata (Optional[Dict[str, str]]): Metadados do arquivo.
+        """
+        metadata_path = self._metadata_path(blob_name)
+        if metadata:
+            with self._atomic_write(metadata_path) as file:
+                file.write(json.dumps(metadata).encode())
+        else:
+            metadata_path.unlink(missing_ok=True)
+
+    def _atomic_write(self, path: Path, on_publish: Optional[Callable[[], None]] = None) -> '_AtomicWriter':
+        """
+        Abre um arquivo temporário que substitui `path` ao ser fechado sem erro.
+
+        Args:
+            path (Path): Caminho final do arquivo.
+            on_publish (Optional[Callable[[], None]]): Chamado depois que o arquivo é publicado.
+
+        Returns:
+            _AtomicWriter: Context manager com o arquivo aberto para escrita.
+        """
+        return _AtomicWriter(path, self.root_path / TEMP_DIR, on_publish)
+
+
+class _AtomicWriter:
+    """Escreve em um arquivo temporário e publica com `os.replace` no final."""
+
+    def __init__(self, path: Path, temp_dir: Path, on_publish: Optional[Callable[[], None]] = None):
+        self.path = path
+        self.temp_path = temp_dir / uuid.uuid4().hex
+        self.file = None
+        self.on_publish = on_publish
+
+    def __enter__(self) -> BinaryIO:
+        self.temp_path.parent.mkdir(parents=True, exist_ok=True)
+        self.file = open(self.temp_path, 'wb')
+        return self.file
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.file.close()
+
+        if exc_type:
+            self.temp_path.unlink(missing_ok=True)
+            return
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        os.replace(self.temp_path, self.path)
+
+        if self.on_publish:
+            self.on_publish()
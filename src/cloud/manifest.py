@@ -0,0 +1,71 @@
+import json
+import logging
+
+from typing import Dict, Optional, Any
+
+from src.cloud.storage import StorageBackend
+
+logger = logging.getLogger(__name__)
+
+INDEX_BLOB_NAME = '_index.json'
+MANIFEST_FILE_NAME = '_latest.json'
+
+
+def manifest_blob_name(name: str) -> str:
+    """
+    Retorna o nome do manifesto de um arquivo (ex: 'encounters/_latest.json').
+
+    Args:
+        name (str): Nome do arquivo (ex: 'encounters').
+
+    Returns:
+        str: Nome do blob do manifesto.
+    """
+    return f'{name}/{MANIFEST_FILE_NAME}'
+
+
+def read_index(cloud: StorageBackend) -> Optional[Dict[str, Dict[str, Any]]]:
+    """
+    Lê o índice global com o último snapshot de cada arquivo.
+
+    Args:
+        cloud (StorageBackend): Armazenamento dos arquivos.
+
+    Returns:
+        Optional[Dict[str, Dict[str, Any]]]: {'nome do arquivo': manifesto}, ou None se o índice não existir.
+    """
+    data = cloud.download_data_if_exists(INDEX_BLOB_NAME)
+    if data is None:
+        return None
+
+    try:
+        return json.loads(data)
+
+    except json.JSONDecodeError as e:
+        logger.warning(f'Índice de snapshots inválido, ignorando: {str(e)}')
+        return None
+
+
+def write_manifests(cloud: StorageBackend, manifests: Dict[str, Dict[str, Any]]) -> None:
+    """
+    Salva o manifesto de cada arquivo e atualiza o índice global.
+
+    Cada manifesto aponta para o último snapshot, com tamanho, quantidade de
+    linhas e hash do conteúdo. Arquivos que não estão em `manifests` mantêm a
+    entrada anterior no índice.
+
+    Args:
+        cloud (StorageBackend): Armazenamento dos arquivos.
+        manifests (Dict[str, Dict[str, Any]]): {'nome do arquivo': manifesto} dos snapshots novos.
+    """
+    if not manifests:
+        return
+
+    for name, manifest in manifests.items():
+        cloud.upload_data(blob_name=manifest_blob_name(name), data=json.dumps(manifest).encode())
+
+    index = read_index(cloud) or {}
+    index.update(manifests)
+
+    cloud.upload_data(blob_name=INDEX_BLOB_NAME, data=json.dumps(index, indent=2).encode())
+    logger.info(f'Índice de snapshots atualizado para: {sorted(manifests)}')
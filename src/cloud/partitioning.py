@@ -0,0 +1,175 @@
+import io
+import hashlib
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+
+from typing import Iterator, Tuple, Union, Dict, Any
+from datetime import datetime
+from pathlib import Path
+
+from src.data_source.parquet_profiles import open_parquet_writer
+
+PARTITION_ROOT = 'partitioned'
+
+
+def partition_key(year: int, month: int) -> str:
+    """
+    Monta a chave Hive de uma partição (ex: 'year=2011/month=05').
+
+    Args:
+        year (int): Ano da partição.
+        month (int): Mês da partição.
+
+    Returns:
+        str: Chave da partição.
+    """
+    return f'year={year:04d}/month={month:02d}'
+
+
+def partition_bounds(key: str) -> Tuple[datetime, datetime]:
+    """
+    Retorna o intervalo [início, fim) de uma partição (ex: 'year=2011/month=12' -> 2011-12-01, 2012-01-01).
+
+    Args:
+        key (str): Chave da partição.
+
+    Returns:
+        Tuple[datetime, datetime]: Primeiro dia do mês e primeiro dia do mês seguinte.
+    """
+    year, month = (int(part.split('=')[1]) for part in key.split('/'))
+    return datetime(year, month, 1), datetime(year + month // 12, month % 12 + 1, 1)
+
+
+def partition_blob_name(name: str, key: str, file_name: str) -> str:
+    """
+    Monta o nome do blob de uma partição (ex: 'partitioned/encounters/year=2011/month=05/encounters_2026-01-17T22:02:19.parquet').
+
+    As partições ficam fora do prefixo '{name}/' para não se misturarem com os snapshots completos.
+
+    Args:
+        name (str): Nome do arquivo (ex: 'encounters').
+        key (str): Chave da partição.
+        file_name (str): Data e hora do envio, gerado por `_rename_file`.
+
+    Returns:
+        str: Nome do blob.
+    """
+    return f'{PARTITION_ROOT}/{name}/{key}/{name}_{file_name}'
+
+
+def partition_overlaps(key: str, start: datetime, end: datetime) -> bool:
+    """
+    Verifica se o mês de uma partição cruza o intervalo [start, end).
+
+    Args:
+        key (str): Chave da partição.
+        start (datetime): Início do intervalo (inclusivo).
+        end (datetime): Fim do intervalo (exclusivo).
+
+    Returns:
+        bool: True se a partição puder ter datas dentro do intervalo.
+    """
+    month_start, month_end = partition_bounds(key)
+    return month_start < end and month_end > start
+
+
+def iter_partitions(source: Union[pa.Table, Path], column: str) -> Iterator[Tuple[str, pa.Table]]:
+    """
+    Separa os dados por ano/mês de uma coluna de data, uma partição por vez.
+
+    Os dados são ordenados uma única vez pela coluna e cada partição é um recorte
+    (sem cópia) da tabela ordenada. A ordenação também deixa o min/max de cada
+    row group estreito, para que o filtro por data descarte row groups inteiros.
+    Colunas categóricas ganham um dicionário só com os valores da partição (ver
+    `_compact_dictionaries`).
+
+    Args:
+        source (pa.Table | Path): Dados validados, em memória ou em um parquet local.
+        column (str): Coluna de data usada na partição (ex: 'start').
+
+    Returns:
+        Iterator[Tuple[str, pa.Table]]: Pares ('chave da partição', dados).
+    """
+    table = source if isinstance(source, pa.Table) else pq.read_table(source)
+
+    dates = table.column(column)
+    if dates.null_count:
+        raise ValueError(f"Coluna de partição '{column}' possui {dates.null_count} valores nulos")
+
+    table = table.sort_by(column)
+    dates = table.column(column)
+
+    months = pc.add(pc.multiply(pc.year(dates), 100), pc.month(dates))
+    offset = 0
+    for count in pc.value_counts(months).to_pylist():
+        month, rows = count['values'], count['counts']
+        yield partition_key(month // 100, month % 100), _compact_dictionaries(table.slice(offset, rows))
+        offset += rows
+
+
+def _compact_dictionaries(table: pa.Table) -> pa.Table:
+    """
+    Refaz o dicionário das colunas categóricas apenas com os valores presentes na tabela.
+
+    Um recorte de uma coluna dicionário mantém o dicionário do arquivo inteiro, então
+    uma categoria nova em qualquer mês mudaria o parquet de todas as partições.
+
+    Args:
+        table (pa.Table): Recorte de uma tabela.
+
+    Returns:
+        pa.Table: Tabela com os mesmos tipos e dicionários próprios.
+    """
+    for index, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            column = table.column(index).cast(field.type.value_type).cast(field.type)
+            table = table.set_column(index, field, column)
+
+    return table
+
+
+def table_hash(table: pa.Table) -> str:
+    """
+    Calcula o hash SHA-256 do conteúdo de uma tabela, serializada em Arrow IPC.
+
+    Os metadados do schema, a divisão em chunks e os dicionários das colunas
+    categóricas (convertidas para os valores) são descartados antes, para que o
+    mesmo conteúdo gere o mesmo hash independente de como foi lido ou recortado.
+
+    Args:
+        table (pa.Table): Dados da partição.
+
+    Returns:
+        str: Hash em hexadecimal.
+    """
+    table = table.replace_schema_metadata(None)
+    for index, field in enumerate(table.schema):
+        if pa.types.is_dictionary(field.type):
+            values = pa.field(field.name, field.type.value_type, field.nullable)
+            table = table.set_column(index, values, table.column(index).cast(values.type))
+    table = table.combine_chunks()
+
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+
+    return hashlib.sha256(sink.getvalue()).hexdigest()
+
+
+def write_partition(table: pa.Table, profile: Dict[str, Any]) -> bytes:
+    """
+    Grava uma partição em parquet com estatísticas de min/max por row group.
+
+    Args:
+        table (pa.Table): Dados da partição.
+        profile (Dict[str, Any]): Perfil de escrita do arquivo (`WriteProfiles.get`); as
+            estatísticas são sempre gravadas, pois a leitura filtra por elas.
+
+    Returns:
+        bytes: Conteúdo do parquet.
+    """
+    buffer = io.BytesIO()
+    with open_parquet_writer(buffer, table.schema, {**profile, 'write_statistics': True}) as writer:
+        writer.write_table(table, row_group_size=profile['row_group_size'])
+    return buffer.getvalue()
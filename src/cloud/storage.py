@@ -0,0 +1,170 @@
+import io
+import os
+
+from abc import ABC, abstractmethod
+from dotenv import load_dotenv
+from typing import Optional, List, Dict, Union, BinaryIO, ContextManager
+
+
+class StorageBackend(ABC):
+    """
+    Contrato comum dos armazenamentos de arquivos da pipeline (Azure ou diretório local).
+
+    `DataSource` e `Controller` usam apenas estes métodos, então qualquer
+    implementação pode ser escolhida por configuração (`STORAGE_BACKEND`).
+    """
+
+    @abstractmethod
+    def upload_data(
+        self,
+        blob_name: str,
+        data: Union[bytes, BinaryIO],
+        metadata: Optional[Dict[str, str]] = None
+    ) -> None:
+        """
+        Salva um arquivo, substituindo o anterior com o mesmo nome.
+
+        Args:
+            blob_name (str): Nome do arquivo a ser salvo.
+            data (bytes | BinaryIO): Conteúdo do arquivo, ou arquivo aberto para leitura em partes.
+            metadata (Optional[Dict[str, str]]): Metadados salvos junto com o arquivo.
+        """
+
+    @abstractmethod
+    def download_data(self, blob_name: str) -> bytes:
+        """
+        Lê um arquivo.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            bytes: Conteúdo do arquivo.
+        """
+
+    @abstractmethod
+    def download_data_if_exists(self, blob_name: str) -> Optional[bytes]:
+        """
+        Lê um arquivo, sem erro se ele não existir.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            Optional[bytes]: Conteúdo do arquivo, ou None se ele não existir.
+        """
+
+    @abstractmethod
+    def get_blob_metadata(self, blob_name: str) -> Optional[Dict[str, str]]:
+        """
+        Retorna os metadados de um arquivo, sem ler o conteúdo.
+
+        Args:
+            blob_name (str): Nome do arquivo.
+
+        Returns:
+            Optional[Dict[str, str]]: Metadados do arquivo, ou None se ele não existir.
+        """
+
+    @abstractmethod
+    def list_blob_files(self, blob_prefix: Optional[str] = None) -> List[str]:
+        """
+        Lista os arquivos salvos.
+
+        Args:
+            blob_prefix (Optional[str]): Prefixo dos arquivos (ex: 'encounters/').
+
+        Returns:
+            List[str]: Nome completo dos arquivos.
+        """
+
+    @abstractmethod
+    def download_many(
+        self,
+        blob_names: List[str],
+        max_downloads: Optional[int] = None,
+        max_concurrency: Optional[int] = None
+    ) -> Dict[str, bytes]:
+        """
+        Lê vários arquivos de uma vez.
+
+        O conteúdo pode ser qualquer objeto com o protocolo de buffer (ex: `bytes`
+        ou `pa.Buffer` mapeado em memória), aceito por `pa.py_buffer` e `file.write`.
+
+        Args:
+            blob_names (List[str]): Nomes dos arquivos.
+            max_downloads (Optional[int]): Quantidade de arquivos lidos ao mesmo tempo.
+            max_concurrency (Optional[int]): Conexões por arquivo para leitura em partes.
+
+        Returns:
+            Dict(str, bytes): Dicionário com {'nome do arquivo': conteúdo}.
+        """
+
+    def open_writer(
+        self,
+        blob_name: str,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> ContextManager[BinaryIO]:
+        """
+        Abre um arquivo para escrita em partes (ex: `pq.ParquetWriter(sink, ...)`).
+
+        O arquivo só é publicado ao sair do `with` sem erro; se houver erro, nada é
+        salvo. Esta implementação junta o conteúdo em memória e chama `upload_data`
+        no final; os armazenamentos podem sobrescrever para enviar durante a escrita.
+
+        Exemplo:
+            with storage.open_writer('encounters/encounters_2026.parquet') as sink:
+                pq.write_table(table, sink)
+
+        Args:
+            blob_name (str): Nome do arquivo a ser salvo.
+            metadata (Optional[Dict[str, str]]): Metadados salvos junto com o arquivo.
+
+        Returns:
+            ContextManager[BinaryIO]: Context manager com o arquivo aberto para escrita.
+        """
+        return _BufferedWriter(self, blob_name, metadata)
+
+
+class _BufferedWriter:
+    """Junta o conteúdo em memória e envia com `upload_data` ao sair do `with` sem erro."""
+
+    def __init__(self, storage: StorageBackend, blob_name: str, metadata: Optional[Dict[str, str]]):
+        self.storage = storage
+        self.blob_name = blob_name
+        self.metadata = metadata
+        self.buffer = io.BytesIO()
+
+    def __enter__(self) -> BinaryIO:
+        return self.buffer
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        if not exc_type:
+            self.storage.upload_data(self.blob_name, self.buffer.getvalue(), self.metadata)
+
+        self.buffer = None
+
+
+def get_storage(backend: Optional[str] = None) -> StorageBackend:
+    """
+    Cria o armazenamento configurado.
+
+    Args:
+        backend (Optional[str]): 'azure' ou 'local' (padrão: `STORAGE_BACKEND`, ou 'azure').
+
+    Returns:
+        StorageBackend: Armazenamento pronto para uso.
+    """
+    load_dotenv()
+
+    backend = backend or os.getenv('STORAGE_BACKEND', 'azure')
+
+    if backend == 'local':
+        from src.cloud.local_storage import LocalStorage
+        return LocalStorage()
+
+    if backend == 'azure':
+        from src.cloud.cloud_connection import AzureCloud
+        return AzureCloud()
+
+    raise ValueError(f'Armazenamento inválido: {backend}')
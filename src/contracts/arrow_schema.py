@@ -0,0 +1,82 @@
+import json
+import hashlib
+import pyarrow as pa
+import pandera.pandas as pdr
+
+from typing import Type, List
+
+
+ARROW_TYPES = {
+    'str': pa.string(),
+    'float64': pa.float64(),
+    'datetime64[ns]': pa.timestamp('ns'),
+    'date': pa.date32()
+}
+
+
+def get_arrow_schema(schema: Type[pdr.DataFrameModel]) -> pa.Schema:
+    """
+    Monta o schema do Arrow equivalente a um contrato do pandera.
+
+    Args:
+        schema (Type[DataFrameModel]): Contrato de `schema.py` (ex: EncontersSchema).
+
+    Returns:
+        pa.Schema: Schema com os tipos e a nulidade de cada coluna do contrato.
+    """
+    fields = []
+    for name, column in schema.to_schema().columns.items():
+        dtype = str(column.dtype)
+        if dtype not in ARROW_TYPES:
+            raise ValueError(f'Tipo sem equivalente no Arrow: {name} ({dtype})')
+
+        fields.append(pa.field(name, ARROW_TYPES[dtype], nullable=column.nullable))
+
+    return pa.schema(fields)
+
+
+def get_unique_columns(schema: Type[pdr.DataFrameModel]) -> List[str]:
+    """
+    Retorna as colunas marcadas como `unique=True` em um contrato do pandera.
+
+    Args:
+        schema (Type[DataFrameModel]): Contrato de `schema.py` (ex: OrganizationsSchema).
+
+    Returns:
+        List[str]: Nome das colunas únicas.
+    """
+    return [name for name, column in schema.to_schema().columns.items() if column.unique]
+
+
+def get_schema_version(schema: Type[pdr.DataFrameModel]) -> str:
+    """
+    Gera uma versão do contrato a partir da sua definição (tipos, nulidade, checks e config).
+
+    Qualquer mudança no contrato gera uma versão nova.
+
+    Args:
+        schema (Type[DataFrameModel]): Contrato de `schema.py` (ex: PatientsSchema).
+
+    Returns:
+        str: Hash SHA-256 da definição do contrato.
+    """
+    pandera_schema = schema.to_schema()
+
+    definition = {
+        'name': schema.__name__,
+        'coerce': pandera_schema.coerce,
+        'strict': pandera_schema.strict,
+        'columns': [
+            {
+                'name': name,
+                'dtype': str(column.dtype),
+                'nullable': column.nullable,
+                'unique': column.unique,
+                'metadata': column.metadata,
+                'checks': [[check.name, check.statistics] for check in column.checks]
+            }
+            for name, column in pandera_schema.columns.items()
+        ]
+    }
+
+    return hashlib.sha256(json.dumps(definition, sort_keys=True, default=str).encode()).hexdigest()
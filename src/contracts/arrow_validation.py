@@ -0,0 +1,116 @@
+import pyarrow as pa
+import pyarrow.compute as pc
+import pandera.pandas as pdr
+
+from typing import Type
+from pandera.errors import SchemaError
+
+from src.contracts.arrow_schema import get_arrow_schema
+
+
+CHECKS = {
+    'isin': lambda array, stats: pc.is_in(array, value_set=pa.array(stats['allowed_values'], type=array.type)),
+    'notin': lambda array, stats: pc.invert(pc.is_in(array, value_set=pa.array(stats['forbidden_values'], type=array.type))),
+    'greater_than_or_equal_to': lambda array, stats: pc.greater_equal(array, stats['min_value']),
+    'greater_than': lambda array, stats: pc.greater(array, stats['min_value']),
+    'less_than_or_equal_to': lambda array, stats: pc.less_equal(array, stats['max_value']),
+    'less_than': lambda array, stats: pc.less(array, stats['max_value'])
+}
+
+
+def validate_table(table: pa.Table, schema: Type[pdr.DataFrameModel]) -> pa.Table:
+    """
+    Valida uma Tabela Arrow contra um contrato do pandera usando kernels do `pyarrow.compute`.
+
+    Aplica as mesmas regras do `schema.validate(df)`: colunas exatas (`strict`),
+    conversão de tipos (`coerce`), nulidade, unicidade e os checks `isin`/`ge`.
+    Os erros são lançados como `SchemaError`, igual ao backend do pandera.
+
+    Args:
+        table (pa.Table): Dados a serem validados.
+        schema (Type[DataFrameModel]): Contrato de `schema.py` (ex: EncontersSchema).
+
+    Returns:
+        pa.Table: Tabela com as colunas na ordem e nos tipos do contrato.
+    """
+    pandera_schema = schema.to_schema()
+    arrow_schema = get_arrow_schema(schema)
+
+    missing = [name for name in arrow_schema.names if name not in table.column_names]
+    extra = [name for name in table.column_names if name not in arrow_schema.names]
+    if missing or extra:
+        raise SchemaError(
+            pandera_schema,
+            table,
+            f'Colunas diferentes do contrato {schema.__name__}: faltando {missing}, sobrando {extra}'
+        )
+
+    arrays = []
+    for field in arrow_schema:
+        column = pandera_schema.columns[field.name]
+        array = _coerce_column(table.column(field.name), field.type, pandera_schema, field.name)
+
+        if not column.nullable and array.null_count:
+            raise SchemaError(
+                pandera_schema,
+                table,
+                f"Coluna '{field.name}' não aceita nulos: {array.null_count} valores nulos"
+            )
+
+        if column.unique and pc.count_distinct(array).as_py() != len(array) - array.null_count:
+            raise SchemaError(pandera_schema, table, f"Coluna '{field.name}' possui valores duplicados")
+
+        for check in column.checks:
+            check_function = CHECKS.get(check.name)
+            if not check_function:
+                raise ValueError(f"Check sem equivalente no Arrow: {check.name} ('{field.name}')")
+
+            failures = len(array) - array.null_count - pc.sum(check_function(array, check.statistics)).as_py()
+            if failures:
+                raise SchemaError(
+                    pandera_schema,
+                    table,
+                    f"Coluna '{field.name}' falhou no check {check.name} {check.statistics}: {failures} valores"
+                )
+
+        arrays.append(array)
+
+    return pa.Table.from_arrays(arrays, schema=arrow_schema)
+
+
+def _coerce_column(array: pa.ChunkedArray, arrow_type: pa.DataType, pandera_schema, name: str) -> pa.ChunkedArray:
+    """
+    Converte uma coluna para o tipo do contrato.
+
+    Datas com fuso (ex: '2011-05-02T01:45:24Z') são convertidas para UTC sem fuso,
+    como o pandera faz.
+
+    Args:
+        array (pa.ChunkedArray): Coluna a ser convertida.
+        arrow_type (pa.DataType): Tipo de destino.
+        pandera_schema: Schema do pandera, usado na mensagem de erro.
+        name (str): Nome da coluna.
+
+    Returns:
+        pa.ChunkedArray: Coluna convertida.
+    """
+    if array.type == arrow_type:
+        return array
+
+    if pa.types.is_dictionary(array.type):
+        array = array.cast(array.type.value_type)
+
+    try:
+        if pa.types.is_timestamp(arrow_type) and pa.types.is_timestamp(array.type) and array.type.tz:
+            return array.cast(pa.timestamp(arrow_type.unit, tz='UTC')).cast(arrow_type)
+
+        try:
+            return array.cast(arrow_type)
+
+        except pa.ArrowInvalid:
+            if not pa.types.is_timestamp(arrow_type):
+                raise
+            return array.cast(pa.timestamp(arrow_type.unit, tz='UTC')).cast(arrow_type)
+
+    except (pa.ArrowInvalid, pa.ArrowNotImplementedError) as e:
+        raise SchemaError(pandera_schema, array, f"Coluna '{name}' não pode ser convertida para {arrow_type}: {str(e)}")
@@ -0,0 +1,122 @@
+import pandas as pd
+import pyarrow as pa
+import pandera.pandas as pdr
+
+from typing import Type, List
+
+from src.contracts.arrow_schema import get_arrow_schema
+
+CATEGORY_TYPE = pa.dictionary(pa.int32(), pa.string())
+PANDAS_TYPES = {
+    pa.string(): pd.StringDtype('pyarrow'),
+    pa.large_string(): pd.StringDtype('pyarrow')
+}
+
+
+def get_category_columns(schema: Type[pdr.DataFrameModel]) -> List[str]:
+    """
+    Retorna as colunas de baixa cardinalidade de um contrato (`metadata={'dtype': 'category'}`).
+
+    Args:
+        schema (Type[DataFrameModel]): Contrato de `schema.py` (ex: PatientsSchema).
+
+    Returns:
+        List[str]: Nome das colunas categóricas.
+    """
+    return [
+        name
+        for name, column in schema.to_schema().columns.items()
+        if (column.metadata or {}).get('dtype') == 'category'
+    ]
+
+
+def get_compact_arrow_schema(schema: Type[pdr.DataFrameModel]) -> pa.Schema:
+    """
+    Monta o schema do Arrow do contrato com as colunas categóricas como dicionário.
+
+    É o schema usado para gravar os parquets; os tipos das demais colunas são os
+    mesmos de `get_arrow_schema`.
+
+    Args:
+        schema (Type[DataFrameModel]): Contrato de `schema.py` (ex: EncontersSchema).
+
+    Returns:
+        pa.Schema: Schema com `dictionary<int32, string>` nas colunas categóricas.
+    """
+    arrow_schema = get_arrow_schema(schema)
+
+    for name in get_category_columns(schema):
+        index = arrow_schema.get_field_index(name)
+        arrow_schema = arrow_schema.set(index, arrow_schema.field(index).with_type(CATEGORY_TYPE))
+
+    return arrow_schema
+
+
+def apply_arrow_plan(table: pa.Table, schema: Type[pdr.DataFrameModel]) -> pa.Table:
+    """
+    Converte uma Tabela Arrow validada para os tipos compactos do contrato.
+
+    Args:
+        table (pa.Table): Dados validados (tipos de `get_arrow_schema`).
+        schema (Type[DataFrameModel]): Contrato de `schema.py`.
+
+    Returns:
+        pa.Table: Tabela com as colunas categóricas como dicionário.
+    """
+    for name in get_category_columns(schema):
+        index = table.schema.get_field_index(name)
+        column = table.column(index)
+        if not pa.types.is_dictionary(column.type):
+            table = table.set_column(index, table.field(index).with_type(CATEGORY_TYPE), column.dictionary_encode())
+
+    return table
+
+
+def apply_pandas_plan(df: pd.DataFrame, schema: Type[pdr.DataFrameModel]) -> pd.DataFrame:
+    """
+    Converte um DataFrame validado para os tipos compactos do contrato.
+
+    Colunas categóricas viram `category` e as demais colunas de texto viram
+    `string[pyarrow]`, no lugar de objetos Python. O resultado é o mesmo de
+    `to_compact_pandas(apply_arrow_plan(...))`: as categorias ficam na ordem em que
+    aparecem (como no dicionário do Arrow) e as datas nulas ficam como None.
+
+    Args:
+        df (pd.DataFrame): Dados validados.
+        schema (Type[DataFrameModel]): Contrato de `schema.py`.
+
+    Returns:
+        pd.DataFrame: DataFrame com os tipos compactos.
+    """
+    category_columns = get_category_columns(schema)
+
+    dtypes, dates = {}, {}
+    for field in get_arrow_schema(schema):
+        if field.name not in df.columns:
+            continue
+
+        if field.name in category_columns:
+            dtypes[field.name] = pd.CategoricalDtype(df[field.name].dropna().unique())
+        elif pa.types.is_string(field.type):
+            dtypes[field.name] = PANDAS_TYPES[pa.string()]
+        elif pa.types.is_date(field.type):
+            dates[field.name] = df[field.name].astype(object).where(df[field.name].notna(), None)
+
+    return df.assign(**dates).astype(dtypes)
+
+
+def to_compact_pandas(table: pa.Table) -> pd.DataFrame:
+    """
+    Converte uma Tabela Arrow para pandas mantendo os tipos compactos.
+
+    Dicionários viram `category` e textos viram `string[pyarrow]`. A memória do
+    Arrow é liberada coluna a coluna (`self_destruct`), então a tabela não pode
+    ser usada depois da conversão.
+
+    Args:
+        table (pa.Table): Tabela a ser convertida.
+
+    Returns:
+        pd.DataFrame: Dados convertidos.
+    """
+    return table.to_pandas(types_mapper=PANDAS_TYPES.get, split_blocks=True, self_destruct=True)
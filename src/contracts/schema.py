@@ -11,10 +11,10 @@ class EncontersSchema(pa.DataFrameModel):
     start: Series[datetime] = pa.Field(nullable=False)
     stop: Series[datetime] = pa.Field(nullable=False)
     patient: Series[str] = pa.Field(nullable=False)
-    organization: Series[str] = pa.Field(unique=False, nullable=False)
-    payer: Series[str] = pa.Field(unique=False, nullable=False)
-    encounterclass: Series[str] = pa.Field(isin=['ambulatory', 'outpatient', 'inpatient', 'wellness', 'urgentcare', 'emergency'], nullable=False)
-    code: Series[str] = pa.Field(nullable=False)
+    organization: Series[str] = pa.Field(unique=False, nullable=False, metadata={'dtype': 'category'})
+    payer: Series[str] = pa.Field(unique=False, nullable=False, metadata={'dtype': 'category'})
+    encounterclass: Series[str] = pa.Field(isin=['ambulatory', 'outpatient', 'inpatient', 'wellness', 'urgentcare', 'emergency'], nullable=False, metadata={'dtype': 'category'})
+    code: Series[str] = pa.Field(nullable=False, metadata={'dtype': 'category'})
     description: Series[str] = pa.Field(nullable=False)
     base_encounter_cost: Series[float] = pa.Field(ge=0)
     total_claim_cost: Series[float] = pa.Field(ge=0)
@@ -33,7 +33,7 @@ class OrganizationsSchema(pa.DataFrameModel):
     name: Series[str] = pa.Field(nullable=False)
     address: Series[str] = pa.Field(nullable=False)
     city: Series[str] = pa.Field(nullable=False)
-    state: Series[str] = pa.Field(nullable=False)
+    state: Series[str] = pa.Field(nullable=False, metadata={'dtype': 'category'})
     zip: Series[str] = pa.Field(nullable=False)
     lat: Series[float] = pa.Field(nullable=False)
     lon: Series[float] = pa.Field(nullable=False)
@@ -53,14 +53,14 @@ class PatientsSchema(pa.DataFrameModel):
     last: Series[str] = pa.Field(nullable=True)
     suffix: Series[str] = pa.Field(nullable=True)
     maiden: Series[str] = pa.Field(nullable=True)
-    marital: Series[str] = pa.Field(isin=['M','S', 'D', 'W'], nullable=True)
-    race: Series[str] = pa.Field(nullable=True)
-    ethnicity: Series[str] = pa.Field(nullable=True)
-    gender: Series[str] = pa.Field(isin=['M', 'F'], nullable=True)
+    marital: Series[str] = pa.Field(isin=['M','S', 'D', 'W'], nullable=True, metadata={'dtype': 'category'})
+    race: Series[str] = pa.Field(nullable=True, metadata={'dtype': 'category'})
+    ethnicity: Series[str] = pa.Field(nullable=True, metadata={'dtype': 'category'})
+    gender: Series[str] = pa.Field(isin=['M', 'F'], nullable=True, metadata={'dtype': 'category'})
     birthplace: Series[str] = pa.Field(nullable=True)
     address: Series[str] = pa.Field(nullable=False)
     city: Series[str] = pa.Field(nullable=False)
-    state: Series[str] = pa.Field(nullable=False)
+    state: Series[str] = pa.Field(nullable=False, metadata={'dtype': 'category'})
     county: Series[str] = pa.Field(nullable=False)
     zip: Series[str] = pa.Field(nullable=True)
     lat: Series[float] = pa.Field(nullable=False)
@@ -77,7 +77,7 @@ class PayersSchema(pa.DataFrameModel):
     name: Series[str] = pa.Field(nullable=False)
     address: Series[str] = pa.Field(nullable=True)
     city: Series[str] = pa.Field(nullable=True)
-    state_headquartered: Series[str] = pa.Field(nullable=True)
+    state_headquartered: Series[str] = pa.Field(nullable=True, metadata={'dtype': 'category'})
     zip: Series[str] = pa.Field(nullable=True)
     phone: Series[str] = pa.Field(nullable=True)
 
@@ -92,7 +92,7 @@ class ProceduresSchema(pa.DataFrameModel):
     stop: Series[datetime] = pa.Field(nullable=False)
     patient: Series[str] = pa.Field(nullable=False)
     encounter: Series[str] = pa.Field(nullable=False)
-    code: Series[str] = pa.Field(nullable=False)
+    code: Series[str] = pa.Field(nullable=False, metadata={'dtype': 'category'})
     description: Series[str] = pa.Field(nullable=False)
     base_cost: Series[float] = pa.Field(nullable=True)
     reasoncode: Series[str] = pa.Field(nullable=True)
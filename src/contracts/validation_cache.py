@@ -0,0 +1,97 @@
+import os
+import json
+import shutil
+import hashlib
+import logging
+
+from typing import Dict, Optional
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+def file_hash(file: Path) -> str:
+    """
+    Calcula o hash SHA-256 do conteúdo de um arquivo, lendo em partes.
+
+    Args:
+        file (Path): Caminho do arquivo.
+
+    Returns:
+        str: Hash SHA-256 em hexadecimal.
+    """
+    with open(file, 'rb') as f:
+        return hashlib.file_digest(f, 'sha256').hexdigest()
+
+
+class ValidationCache:
+    """
+    Guarda em disco o parquet já validado de cada arquivo.
+
+    A entrada é indexada pelo hash do conteúdo do CSV, pela versão do contrato e
+    pelo backend/leitor de validação; se qualquer um mudar, o arquivo é validado de novo.
+    """
+
+    def __init__(self, cache_path: str):
+        self.cache_path = Path(cache_path)
+
+    def get(self, name: str, key: Dict[str, str]) -> Optional[Path]:
+        """
+        Retorna o parquet validado de um arquivo, se a chave for a mesma da última validação.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            key (Dict[str, str]): Chave com 'content_hash', 'schema_version', 'backend' e 'reader'.
+
+        Returns:
+            Optional[Path]: Caminho do parquet validado, ou None se não houver cache.
+        """
+        index_path = self.cache_path / f'{name}.json'
+        parquet_path = self.cache_path / f'{name}.parquet'
+
+        if not index_path.exists() or not parquet_path.exists():
+            return None
+
+        try:
+            with open(index_path, 'r') as f:
+                cached_key = json.load(f)
+
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f'Cache de validação inválido para {name}: {str(e)}')
+            return None
+
+        if cached_key != key:
+            return None
+
+        logger.info(f'{name}: arquivo sem alterações, validação ignorada (cache).')
+        return parquet_path
+
+    def put(self, name: str, key: Dict[str, str], parquet_path: Path) -> Path:
+        """
+        Salva o parquet validado de um arquivo no cache, substituindo a entrada anterior.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            key (Dict[str, str]): Chave com 'content_hash', 'schema_version', 'backend' e 'reader'.
+            parquet_path (Path): Parquet validado a ser copiado para o cache.
+
+        Returns:
+            Path: Caminho do parquet dentro do cache.
+        """
+        self.cache_path.mkdir(parents=True, exist_ok=True)
+
+        index_path = self.cache_path / f'{name}.json'
+        cached_path = self.cache_path / f'{name}.parquet'
+
+        index_path.unlink(missing_ok=True)
+
+        temp_path = cached_path.with_suffix('.parquet.tmp')
+        shutil.copyfile(parquet_path, temp_path)
+        os.replace(temp_path, cached_path)
+
+        temp_index = index_path.with_suffix('.json.tmp')
+        with open(temp_index, 'w') as f:
+            json.dump(key, f)
+        os.replace(temp_index, index_path)
+
+        return cached_path
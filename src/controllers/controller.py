@@ -1,47 +1,153 @@
 import os
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import shutil
 import logging
 
-from typing import List, Dict
+from dotenv import load_dotenv
+from typing import Any, Callable, List, Dict, Optional, Tuple, Union
 from datetime import datetime
 from collections import defaultdict
 from pathlib import Path
 
-from src.cloud.cloud_connection import AzureCloud
+from src.cloud.storage import StorageBackend, get_storage
+from src.cloud.manifest import read_index
+from src.cloud.partitioning import partition_overlaps
+from src.metrics.run_metrics import RunMetrics
+from src.contracts.dtype_plan import to_compact_pandas
 from src.database.db_connection import DataBase
+from src.contracts.validation_cache import file_hash
+from src.recovery.checkpoints import CheckpointStore, fingerprint
+from src.recovery.retry import RetryPolicy
+from src.controllers.stage_pipeline import PipelineStage, StagePipeline
 
 logger = logging.getLogger(__name__)
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(name)s | %(levelname)s | %(message)s'
-)
 
 class Controller:
     """Responsável por fazer o Controle das Pipelines."""
 
     def __init__(self) -> None:
-        self.cloud = AzureCloud()
-        self.db = DataBase()
+        load_dotenv()
+
+        self._cloud = None
+        self._db = None
+        self.metrics = RunMetrics('controller')
+        self.checkpoints = CheckpointStore('controller')
+        self.retry = RetryPolicy()
         self.download_path = 'src/temp_downloads'
+        self.load_modes = {
+            'pandas': self.save_data_into_db_using_pandas,
+            'orm': self.save_data_into_db,
+            'copy': self.save_data_into_db_using_copy,
+            'parallel': self.save_data_into_db_in_parallel
+        }
+        self.extract_modes = {
+            'sync': self.extract_data_from_cloud,
+            'async': self.extract_data_from_cloud_concurrently,
+            'memory': self.extract_data_into_memory
+        }
+        self.executors = {
+            'phased': self._run_phased,
+            'pipelined': self._run_pipelined
+        }
+        self.stage_workers = {
+            'extract': int(os.getenv('PIPELINE_EXTRACT_WORKERS', 2)),
+            'transform': int(os.getenv('PIPELINE_TRANSFORM_WORKERS', 2)),
+            'load': int(os.getenv('PIPELINE_LOAD_WORKERS', 2))
+        }
+        self.stage_queue_size = int(os.getenv('PIPELINE_QUEUE_SIZE', 1))
+        self.arrow_load_modes = {'copy', 'parallel'}
+        self.incremental_modes = {
+            'upsert': 'upsert_data',
+            'incremental': 'incremental_load'
+        }
+
+    @property
+    def cloud(self) -> StorageBackend:
+        """Armazenamento dos arquivos, criado no primeiro uso."""
+        if self._cloud is None:
+            self._cloud = get_storage()
+        return self._cloud
+
+    @property
+    def db(self) -> DataBase:
+        """Conexão com o Banco de Dados, criada no primeiro uso."""
+        if self._db is None:
+            self._db = DataBase()
+            self._db.metrics = self.metrics
+        return self._db
+
+    def start(
+        self,
+        load_mode: str = 'pandas',
+        extract_mode: str = 'sync',
+        profile: Optional[bool] = None,
+        resume: bool = False,
+        executor: str = 'phased'
+    ) -> None:
+        """
+        Inicia a Pipeline de Dados.
+
+        Com `executor='phased'` cada etapa roda para todos os arquivos antes da
+        seguinte (baixa tudo, lê tudo, carrega tudo). Com 'pipelined' cada arquivo
+        passa sozinho por download, leitura e carga (ver `_run_pipelined`), então a
+        carga de um arquivo pode acontecer enquanto outro ainda está sendo baixado.
+
+        Cada arquivo é carregado na sua própria transação e marcado como 'loaded' nos
+        checkpoints (ver `CheckpointStore`) e na tabela `pipeline_state`, então a
+        carga incremental seguinte só aplica os snapshots mais novos. Com `resume=True` as tabelas não são
+        recriadas: os arquivos já carregados com o mesmo snapshot são pulados, e os
+        demais têm a tabela esvaziada e carregada de novo. Nos modos com disco, os
+        arquivos já baixados e íntegros também não são baixados de novo.
 
-    def start(self) -> None:
-        """Inicia a Pipeline de Dados."""
+        Args:
+            load_mode (str): Modo de carga no Banco ('pandas', 'orm', 'copy' ou 'parallel').
+            extract_mode (str): Modo de download da Cloud ('sync', 'async' ou 'memory').
+                No modo 'memory' os arquivos não passam pelo disco.
+            profile (Optional[bool]): Grava cProfile e tracemalloc por etapa (padrão: `PROFILE_ENABLED`).
+            resume (bool): Retoma a última execução, pulando o que já foi concluído.
+            executor (str): Forma de execução das etapas ('phased' ou 'pipelined').
+        """
         logger.info('Iniciando Pipeline de Dados...')
 
+        if load_mode not in self.load_modes:
+            raise ValueError(f'Modo de carga inválido: {load_mode}')
+
+        if extract_mode not in self.extract_modes:
+            raise ValueError(f'Modo de extração inválido: {extract_mode}')
+
+        executor_function = self.executors.get(executor)
+        if not executor_function:
+            raise ValueError(f'Modo de execução inválido: {executor}')
+
         start_time = datetime.now()
+        self.metrics.begin(profile=profile)
+        self.checkpoints.begin(resume=resume)
+        status = 'error'
         try:
-            self.db.drop_tables()
-            self.db.create_tables()
+            with self.metrics.stage('create_tables'):
+                if not self.checkpoints.resumed:
+                    self.db.drop_tables()
+                    self.db.clear_pipeline_state()
+                self.db.create_tables()
 
-            data = self.extract_data_from_cloud()
-            data = self.transform_data()
-            data = self.save_data_into_db_using_pandas(data)
+            files = self._get_unloaded_snapshots(self._get_latest_snapshots())
+            if not files:
+                pipeline_time = (datetime.now() - start_time).total_seconds()
+                status = 'success'
+                logger.info(f'Todos os arquivos já carregados. Pipeline concluída em {pipeline_time:.2f}s')
+                return
 
-            shutil.rmtree(Path(self.download_path))
+            if self.checkpoints.resumed:
+                self.db.truncate_tables(list(files))
+                self.db.clear_pipeline_state(list(files))
+
+            executor_function(files, load_mode, extract_mode)
 
             end_time = datetime.now()
             pipeline_time = (end_time - start_time).total_seconds()
+            status = 'success'
 
             logger.info(f'Pipeline concluída com sucesso em {pipeline_time:.2f}s')
 
@@ -49,23 +155,266 @@ class Controller:
             logger.error(f'Erro ao rodar a pipeline de dados: {str(e)}')
             raise
 
-    def extract_data_from_cloud(self) -> None:
+        finally:
+            self.checkpoints.finish(status)
+            self.metrics.finish(status)
+
+    def _run_phased(self, files: Dict[str, str], load_mode: str, extract_mode: str) -> None:
+        """
+        Roda as etapas uma de cada vez: baixa todos os arquivos, lê todos e carrega todos.
+
+        Args:
+            files (Dict[str, str]): Snapshot de cada arquivo a ser carregado.
+            load_mode (str): Modo de carga no Banco.
+            extract_mode (str): Modo de download da Cloud.
+        """
+        load_function = self.load_modes[load_mode]
+        extract_function = self.extract_modes[extract_mode]
+
+        with self.metrics.stage('extract') as stage:
+            data = self.retry.call('download dos snapshots', extract_function, files)
+
+            if extract_mode == 'memory':
+                stage['bytes'] = sum(len(content) for content in data.values())
+            else:
+                stage['bytes'] = sum(file.stat().st_size for file in Path(self.download_path).iterdir())
+
+        with self.metrics.stage('transform', data_bytes=stage['bytes']):
+            if extract_mode == 'memory':
+                data = self.transform_data_from_memory(data, to_pandas=load_mode not in self.arrow_load_modes)
+            else:
+                data = self.transform_data(names=list(files))
+
+        for name, frame in data.items():
+            self.checkpoints.mark(name, 'parsed', fingerprint(blob_name=files[name]), rows=len(frame))
+
+        with self.metrics.stage('load', rows=sum(len(df) for df in data.values())):
+            self._load_and_checkpoint(load_mode, load_function, data, files)
+
+        if extract_mode != 'memory':
+            shutil.rmtree(Path(self.download_path))
+
+    def _run_pipelined(self, files: Dict[str, str], load_mode: str, extract_mode: str) -> None:
+        """
+        Roda download, leitura e carga de cada arquivo de forma independente, com filas limitadas entre as etapas.
+
+        Cada etapa tem seus próprios workers (`PIPELINE_EXTRACT_WORKERS`,
+        `PIPELINE_TRANSFORM_WORKERS` e `PIPELINE_LOAD_WORKERS`, padrão: 2) e entre
+        elas há filas de `PIPELINE_QUEUE_SIZE` arquivos (padrão: 1): quando a carga
+        fica para trás, as leituras e os downloads esperam, limitando a memória aos
+        arquivos em andamento. Os arquivos são baixados direto para a memória, como
+        no modo 'memory', e cada etapa tem novas tentativas e grava o seu checkpoint.
+        O relatório de métricas ganha a seção 'overlap' (ver `StagePipeline.report`).
+
+        Args:
+            files (Dict[str, str]): Snapshot de cada arquivo a ser carregado.
+            load_mode (str): Modo de carga no Banco.
+            extract_mode (str): Ignorado, os downloads sempre vão para a memória.
+        """
+        load_function = self.load_modes[load_mode]
+        to_pandas = load_mode not in self.arrow_load_modes
+
+        def extract(name: str, blob_file: str) -> bytes:
+            with self.metrics.stage('extract', dataset=name) as stage:
+                data = self.retry.call(f'download de {name}', self.cloud.download_data, blob_file)
+                stage['bytes'] = len(data)
+
+            self.checkpoints.mark(name, 'downloaded', fingerprint(blob_name=blob_file), size=len(data))
+            return data
+
+        def transform(name: str, data: bytes) -> Union[pa.Table, pd.DataFrame]:
+            frame = self.transform_data_from_memory({name: data}, to_pandas=to_pandas)[name]
+
+            self.checkpoints.mark(name, 'parsed', fingerprint(blob_name=files[name]), rows=len(frame))
+            return frame
+
+        def load(name: str, frame: Union[pa.Table, pd.DataFrame]) -> int:
+            rows = len(frame)
+            self.retry.call(f'carga de {name}', load_function, {name: frame})
+
+            self._mark_loaded(name, files[name], rows)
+            return rows
+
+        pipeline = StagePipeline(
+            [
+                PipelineStage('extract', extract, self.stage_workers['extract']),
+                PipelineStage('transform', transform, self.stage_workers['transform']),
+                PipelineStage('load', load, self.stage_workers['load'])
+            ],
+            queue_size=self.stage_queue_size
+        )
+
+        logger.info(f'Rodando {len(files)} arquivos em pipeline (workers: {self.stage_workers}).')
+        try:
+            pipeline.run(dict(files))
+
+        finally:
+            report = pipeline.report()
+            self.metrics.add_section('overlap', report)
+
+            for name, stage in report['stages'].items():
+                logger.info(
+                    f"{name}: {stage['busy_seconds']:.2f}s ocupada ({stage['parallelism']}x workers), "
+                    f"{stage['overlap_ratio']:.0%} sobreposta às outras etapas, "
+                    f"{stage['blocked_seconds']:.2f}s bloqueada pela fila"
+                )
+            logger.info(
+                f"Pipeline em {report['wall_seconds']:.2f}s para {report['serial_seconds']:.2f}s com as etapas "
+                f"em sequência (speedup {report['speedup']})"
+            )
+
+    def _load_and_checkpoint(
+        self,
+        load_mode: str,
+        load_function,
+        data: Dict[str, Union[pa.Table, pd.DataFrame]],
+        files: Dict[str, str]
+    ) -> None:
+        """
+        Carrega os arquivos no Banco, cada um com novas tentativas, e grava o checkpoint 'loaded'.
+
+        No modo 'parallel' as tabelas são carregadas juntas, uma por conexão. Cada
+        tabela tem as próprias tentativas e é marcada assim que é gravada, então uma
+        nova tentativa nunca carrega de novo uma tabela que já terminou.
+
+        Args:
+            load_mode (str): Modo de carga no Banco.
+            load_function (Callable): Função de `load_modes`.
+            data (Dict[str, pa.Table | pd.DataFrame]): Dados transformados de cada arquivo.
+            files (Dict[str, str]): Snapshot de cada arquivo.
+        """
+        if load_mode == 'parallel':
+            rows = {name: len(frame) for name, frame in data.items()}
+            load_function(data, on_loaded=lambda name: self._mark_loaded(name, files[name], rows[name]))
+            return
+
+        for name in list(data):
+            frame = data.pop(name)
+            self.retry.call(f'carga de {name}', load_function, {name: frame})
+            self._mark_loaded(name, files[name], len(frame))
+
+    def _mark_loaded(self, name: str, blob_file: str, rows: int) -> None:
+        """
+        Grava o checkpoint 'loaded' e o último snapshot carregado (`pipeline_state`) de um arquivo.
+
+        Args:
+            name (str): Nome do arquivo.
+            blob_file (str): Snapshot carregado.
+            rows (int): Quantidade de linhas carregadas.
+        """
+        self.checkpoints.mark(name, 'loaded', fingerprint(blob_name=blob_file), blob_name=blob_file, rows=rows)
+
+        self.db.update_pipeline_state(
+            dataset=name,
+            blob_name=blob_file,
+            snapshot=self._extract_timestamp(blob_file),
+            row_count=rows
+        )
+
+    def _get_unloaded_snapshots(self, files: Dict[str, str]) -> Dict[str, str]:
+        """
+        Remove os arquivos que a execução retomada já carregou com o mesmo snapshot.
+
+        Args:
+            files (Dict[str, str]): Dicionário com {'nome do arquivo': 'snapshot'}.
+
+        Returns:
+            Dict[str, str]: Arquivos que ainda precisam ser carregados.
+        """
+        pending = {}
+        for name, blob_file in files.items():
+            if self.checkpoints.get(name, 'loaded', fingerprint(blob_name=blob_file)):
+                logger.info(f'{name}: {blob_file} já carregado, pulando.')
+                continue
+
+            pending[name] = blob_file
+
+        return pending
+
+    def start_incremental(self, method: str = 'upsert', profile: Optional[bool] = None) -> None:
+        """
+        Inicia a Pipeline de Dados de forma incremental.
+
+        Compara o último snapshot de cada arquivo com o registrado na tabela
+        `pipeline_state` e baixa/aplica apenas os arquivos com snapshot mais novo,
+        sem recriar as tabelas. O estado de cada arquivo é atualizado logo após
+        a sua carga, então uma falha não faz perder os arquivos já aplicados e a
+        próxima execução já continua de onde parou (sem precisar de `resume`).
+
+        Args:
+            method (str): Forma de aplicar os dados ('upsert' ou 'incremental').
+            profile (Optional[bool]): Grava cProfile e tracemalloc por etapa (padrão: `PROFILE_ENABLED`).
+        """
+        logger.info('Iniciando Pipeline de Dados incremental...')
+
+        load_method = self.incremental_modes.get(method)
+        if not load_method:
+            raise ValueError(f'Modo incremental inválido: {method}')
+
+        start_time = datetime.now()
+        self.metrics.begin(profile=profile)
+        status = 'error'
+        try:
+            with self.metrics.stage('create_tables'):
+                self.db.create_tables()
+
+            load_function = getattr(self.db, load_method)
+            files = self._get_pending_snapshots()
+            if not files:
+                pipeline_time = (datetime.now() - start_time).total_seconds()
+                status = 'success'
+                logger.info(f'Nenhum snapshot novo. Pipeline concluída em {pipeline_time:.2f}s')
+                return
+
+            with self.metrics.stage('extract') as stage:
+                downloads = self.retry.call('download dos snapshots', self.cloud.download_many, list(files.values()))
+                stage['bytes'] = sum(len(content) for content in downloads.values())
+
+            for name, blob_file in files.items():
+                data = self.transform_data_from_memory({name: downloads.pop(blob_file)})[name]
+
+                self.retry.call(f'carga de {name}', load_function, {name: data})
+
+                self.db.update_pipeline_state(
+                    dataset=name,
+                    blob_name=blob_file,
+                    snapshot=self._extract_timestamp(blob_file),
+                    row_count=len(data)
+                )
+
+            pipeline_time = (datetime.now() - start_time).total_seconds()
+            status = 'success'
+            logger.info(f'Pipeline incremental concluída com sucesso em {pipeline_time:.2f}s ({len(files)} arquivos).')
+
+        except Exception as e:
+            logger.error(f'Erro ao rodar a pipeline incremental: {str(e)}')
+            raise
+
+        finally:
+            self.metrics.finish(status)
+
+    def extract_data_from_cloud(self, files: Optional[Dict[str, str]] = None) -> None:
         """
         Extrai os dados da cloud e salva localmente temporariamente.
 
+        Arquivos já baixados por uma execução retomada, com o mesmo conteúdo, não
+        são baixados de novo.
+
+        Args:
+            files (Optional[Dict[str, str]]): Snapshots a baixar (padrão: o último de cada arquivo).
+
         Returns:
             None: Quantidade de arquivos salvos, se erro, mensagem de erro.
         """
         logger.info('Extraindo Dados da Cloud...')
 
         try:
-            blob_file = self.cloud.list_blob_files()
-            files = self._get_cloud_data(blob_file)
+            files = self._get_latest_snapshots() if files is None else files
 
             temp_dir = Path(self.download_path)
             temp_dir.mkdir(exist_ok=True)
 
-            for prefix, blob_file in files.items():
+            for prefix, blob_file in self._get_missing_downloads(files).items():
                 file = prefix.split('_')[0]
                 file_name = f'{file}.parquet'
                 download_path = temp_dir / file_name
@@ -77,30 +426,260 @@ class Controller:
                 with open(download_path, 'wb') as file:
                     file.write(data)
 
+                self._mark_downloaded(prefix, blob_file, download_path)
                 logger.info(f'"{download_path}" arquivo salvo com sucesso.')
         
         except Exception as e:
             logger.error(f'Erro ao extrair dados da cloud: {str(e)}')
             raise
 
-    def transform_data(self) -> Dict[str, pd.DataFrame]:
+    def extract_data_from_cloud_concurrently(self, files: Optional[Dict[str, str]] = None) -> None:
         """
-        Lista os arquivos dentro do diretório temporario e salva em um dicionário
-        
+        Extrai os dados da cloud com downloads assíncronos simultâneos e salva localmente temporariamente.
+
+        Args:
+            files (Optional[Dict[str, str]]): Snapshots a baixar (padrão: o último de cada arquivo).
+
+        Returns:
+            None: Quantidade de arquivos salvos, se erro, mensagem de erro.
+        """
+        logger.info('Extraindo Dados da Cloud de forma assíncrona...')
+
+        try:
+            files = self._get_latest_snapshots() if files is None else files
+
+            temp_dir = Path(self.download_path)
+            temp_dir.mkdir(exist_ok=True)
+
+            files = self._get_missing_downloads(files)
+            downloads = self.cloud.download_many(list(files.values()))
+
+            for prefix, blob_file in files.items():
+                file = prefix.split('_')[0]
+                download_path = temp_dir / f'{file}.parquet'
+
+                with open(download_path, 'wb') as file:
+                    file.write(downloads[blob_file])
+
+                self._mark_downloaded(prefix, blob_file, download_path)
+                logger.info(f'"{download_path}" arquivo salvo com sucesso.')
+
+        except Exception as e:
+            logger.error(f'Erro ao extrair dados da cloud: {str(e)}')
+            raise
+
+    def extract_data_into_memory(self, files: Optional[Dict[str, str]] = None) -> Dict[str, bytes]:
+        """
+        Extrai os dados da cloud direto para a memória, sem salvar arquivos temporários.
+
+        Args:
+            files (Optional[Dict[str, str]]): Snapshots a baixar (padrão: o último de cada arquivo).
+
+        Returns:
+            Dict(str, bytes): Dicionário com {'nome do arquivo': conteúdo parquet}.
+        """
+        logger.info('Extraindo Dados da Cloud para a memória...')
+
+        try:
+            files = self._get_latest_snapshots() if files is None else files
+
+            downloads = self.cloud.download_many(list(files.values()))
+
+            data = {}
+            for prefix, blob_file in files.items():
+                name = prefix.split('_')[0]
+                data[name] = downloads.pop(blob_file)
+                self.checkpoints.mark(name, 'downloaded', fingerprint(blob_name=blob_file), size=len(data[name]))
+
+            logger.info(f'{len(data)} arquivos extraídos para a memória.')
+            return data
+
+        except Exception as e:
+            logger.error(f'Erro ao extrair dados da cloud: {str(e)}')
+            raise
+
+    def _get_missing_downloads(self, files: Dict[str, str]) -> Dict[str, str]:
+        """
+        Remove os snapshots que já estão no diretório temporário, íntegros, de uma execução retomada.
+
+        Args:
+            files (Dict[str, str]): Dicionário com {'nome do arquivo': 'snapshot'}.
+
+        Returns:
+            Dict[str, str]: Snapshots que precisam ser baixados.
+        """
+        missing = {}
+        for prefix, blob_file in files.items():
+            checkpoint = self.checkpoints.get(prefix, 'downloaded', fingerprint(blob_name=blob_file))
+            download_path = Path(self.download_path) / f"{prefix.split('_')[0]}.parquet"
+
+            if checkpoint and download_path.exists() and file_hash(download_path) == checkpoint.get('file_hash'):
+                logger.info(f'{prefix}: {blob_file} já baixado, pulando.')
+                continue
+
+            missing[prefix] = blob_file
+
+        return missing
+
+    def _mark_downloaded(self, prefix: str, blob_file: str, download_path: Path) -> None:
+        """
+        Grava o checkpoint 'downloaded' de um arquivo salvo no diretório temporário.
+
+        Args:
+            prefix (str): Nome do arquivo.
+            blob_file (str): Snapshot baixado.
+            download_path (Path): Caminho do arquivo salvo.
+        """
+        if not self.checkpoints.enabled:
+            return
+
+        self.checkpoints.mark(
+            prefix, 'downloaded', fingerprint(blob_name=blob_file),
+            path=str(download_path), file_hash=file_hash(download_path)
+        )
+
+    def transform_data_from_memory(
+        self,
+        data: Dict[str, bytes],
+        to_pandas: bool = False,
+        filters: Optional[Dict[str, List[Tuple[str, str, Any]]]] = None
+    ) -> Dict[str, Union[pa.Table, pd.DataFrame]]:
+        """
+        Lê os arquivos parquet direto dos bytes baixados, sem cópia para disco.
+
+        Os bytes são envolvidos em um buffer do Arrow sem cópia e liberados assim
+        que cada tabela é lida. Apenas as colunas da tabela do Banco são lidas e
+        os filtros são aplicados nos row groups, como em `transform_data`.
+
+        Args:
+            data (Dict[str, bytes]): Dicionário com {'nome do arquivo': conteúdo parquet}.
+            to_pandas (bool): Converte as tabelas para pd.DataFrame (para os modos 'pandas' e 'orm').
+            filters (Optional[Dict[str, List[Tuple]]]): Filtros por arquivo no formato do pyarrow.
+
+        Returns:
+            Dict(str, pa.Table | pd.DataFrame): Dicionário com {'nome do arquivo': dados}.
+        """
+        logger.info('Iniciando Transformação de Dados em memória...')
+
+        filters = filters or {}
+
+        tables = {}
+        try:
+            for prefix in list(data):
+                buffer = pa.py_buffer(data.pop(prefix))
+                with self.metrics.stage('transform', dataset=prefix, data_bytes=buffer.size) as stage:
+                    table = pq.read_table(
+                        pa.BufferReader(buffer),
+                        columns=self._get_columns(prefix, pq.read_schema(pa.BufferReader(buffer))),
+                        filters=filters.get(prefix)
+                    )
+                    rows = stage['rows'] = table.num_rows
+
+                    tables[prefix] = to_compact_pandas(table) if to_pandas else table
+                logger.info(f'{prefix} arquivo transformado com sucesso ({rows} linhas).')
+
+            logger.info(f'{len(tables)} arquivos transformados com sucesso.')
+            return tables
+
+        except Exception as e:
+            logger.error(f'Erro ao transformar arquivos: {str(e)}')
+            raise
+
+    def read_date_range(self, name: str, start: datetime, end: datetime) -> pa.Table:
+        """
+        Lê apenas as partições de um arquivo que cobrem o intervalo [start, end).
+
+        Usa o layout particionado por ano/mês (ver `DataSource(partitioned=True)`):
+        só os blobs dos meses no intervalo são baixados e o filtro por data é
+        aplicado nos row groups pelas estatísticas de min/max.
+
+        Args:
+            name (str): Nome do arquivo particionado (ex: 'encounters').
+            start (datetime): Início do intervalo (inclusivo).
+            end (datetime): Fim do intervalo (exclusivo).
+
+        Returns:
+            pa.Table: Registros com a data de partição dentro do intervalo.
+        """
+        logger.info(f'Lendo {name} de {start} até {end}...')
+
+        manifest = (read_index(self.cloud) or {}).get(name) or {}
+        partitions = manifest.get('partitions')
+        if not partitions:
+            raise ValueError(f'Arquivo sem layout particionado: {name}')
+
+        blob_files = [
+            partition['blob_name']
+            for key, partition in sorted(partitions.items())
+            if partition_overlaps(key, start, end)
+        ]
+        logger.info(f'{len(blob_files)}/{len(partitions)} partições no intervalo.')
+
+        try:
+            downloads = self.cloud.download_many(blob_files)
+
+            column = manifest.get('partition_column', 'start')
+            filters = [(column, '>=', start), (column, '<', end)]
+
+            tables = [
+                pq.read_table(pa.BufferReader(pa.py_buffer(downloads.pop(blob_file))), filters=filters)
+                for blob_file in blob_files
+            ]
+
+            table = pa.concat_tables(tables) if tables else pa.table({})
+            logger.info(f'{table.num_rows} registros lidos de {name}.')
+            return table
+
+        except Exception as e:
+            logger.error(f'Erro ao ler partições de {name}: {str(e)}')
+            raise
+
+    def transform_data(
+        self,
+        filters: Optional[Dict[str, List[Tuple[str, str, Any]]]] = None,
+        names: Optional[List[str]] = None
+    ) -> Dict[str, pd.DataFrame]:
+        """
+        Lê os arquivos do diretório temporário e salva em um dicionário.
+
+        Cada arquivo é lido com memory map, apenas com as colunas que existem na
+        tabela do Banco (`db_model.py`) e com os filtros aplicados nos row groups.
+        A conversão para pandas usa `split_blocks` e `self_destruct`, liberando a
+        memória do Arrow coluna a coluna em vez de manter duas cópias, e mantém os
+        tipos compactos (categóricas e `string[pyarrow]`).
+
+        Args:
+            filters (Optional[Dict[str, List[Tuple]]]): Filtros por arquivo no formato do pyarrow
+                (ex: {'encounters': [('start', '>=', datetime(2020, 1, 1))]}).
+            names (Optional[List[str]]): Arquivos a serem lidos (padrão: todos do diretório).
+
         Returns:
             Dict(str, pd.DataFrame): Dicionário com {'nome do arquivo': pd.DataFrame}.
         """
         logger.info('Iniciando Transformação de Dados...')
 
+        filters = filters or {}
+
         data = {}
         try:
             file_path = os.listdir(Path(self.download_path))
 
             for file in file_path:
                 prefix = Path(file).stem
+                if names is not None and prefix not in names:
+                    continue
+
                 full_path = os.path.join(self.download_path, file)
-                df = pd.read_parquet(full_path)
-                data[prefix] = df
+
+                with self.metrics.stage('transform', dataset=prefix, data_bytes=os.path.getsize(full_path)) as stage:
+                    table = pq.read_table(
+                        full_path,
+                        columns=self._get_columns(prefix, pq.read_schema(full_path, memory_map=True)),
+                        filters=filters.get(prefix),
+                        memory_map=True
+                    )
+                    stage['rows'] = table.num_rows
+                    data[prefix] = to_compact_pandas(table)
 
                 logger.info(f'{prefix} arquivo transformado com sucesso.')
 
@@ -111,6 +690,23 @@ class Controller:
             logger.error(f'Erro ao transformar arquivos: {str(e)}')
             raise
 
+    def _get_columns(self, name: str, schema: pa.Schema) -> Optional[List[str]]:
+        """
+        Retorna as colunas do parquet que existem na tabela do Banco.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            schema (pa.Schema): Schema do parquet.
+
+        Returns:
+            Optional[List[str]]: Colunas a serem lidas, ou None (todas) se o arquivo não tiver tabela.
+        """
+        if name not in self.db.ORM_MAPPING:
+            return None
+
+        table_columns = set(self.db.get_table_columns(name))
+        return [column for column in schema.names if column in table_columns]
+
     def save_data_into_db(self, df_dict: Dict[str, pd.DataFrame]) -> None:
         """
         Salva os dados no Banco de Dados.
@@ -145,6 +741,53 @@ class Controller:
         match = file_name.split('_')[-1]
         return datetime.fromisoformat(match)
 
+    def _get_latest_snapshots(self) -> Dict[str, str]:
+        """
+        Busca o último snapshot de cada arquivo pelo índice de manifestos.
+
+        Arquivos que não estão no índice (ou todos, se o índice não existir) são
+        buscados listando apenas o prefixo de cada um.
+
+        Returns:
+            Dict(str, str): Dicionário com {'nome do arquivo' : 'último arquivo salvo na Azure'}.
+        """
+        index = read_index(self.cloud) or {}
+        files = {name: manifest['blob_name'] for name, manifest in index.items()}
+
+        missing = [name for name in self.db.ORM_MAPPING if name not in files]
+        if missing:
+            logger.warning(f'Snapshots fora do índice, listando por prefixo: {missing}')
+
+            blob_files = []
+            for name in missing:
+                blob_files.extend(self.cloud.list_blob_files(blob_prefix=f'{name}/'))
+
+            files.update(self._get_cloud_data(blob_files))
+
+        logger.info(f'{len(files)} snapshots encontrados.')
+        return files
+
+    def _get_pending_snapshots(self) -> Dict[str, str]:
+        """
+        Retorna os snapshots mais novos do que os já carregados no Banco.
+
+        Returns:
+            Dict(str, str): Dicionário com {'nome do arquivo' : 'snapshot ainda não carregado'}.
+        """
+        state = self.db.get_pipeline_state()
+
+        pending = {}
+        for name, blob_file in self._get_latest_snapshots().items():
+            loaded = state.get(name)
+            if loaded and self._extract_timestamp(blob_file) <= loaded['snapshot']:
+                logger.info(f'{name}: sem snapshot novo desde {loaded["snapshot"]}.')
+                continue
+
+            pending[name] = blob_file
+
+        logger.info(f'{len(pending)} snapshots novos para carregar.')
+        return pending
+
     def _get_cloud_data(self, files: List[Path]) -> Dict[str, str]:
         """
         Pega o último arquivo de uma lista baseando no timestamp.
@@ -159,7 +802,10 @@ class Controller:
 
         try:
             for file in files:
-                prefix = Path(file).stem.split('/')[0]
+                if Path(file).suffix != '.parquet':
+                    continue
+
+                prefix = str(file).split('/')[0]
                 file_by_prefix[prefix].append(file)
 
             data = {}
@@ -186,4 +832,51 @@ class Controller:
 
         except Exception as e:
             logger.error(f'Erro ao concluir processo: {str(e)}')
-            raise
\ No newline at end of file
+            raise
+
+    def save_data_into_db_using_copy(self, data: Dict[str, pd.DataFrame]) -> None:
+        """
+        Salva os dados no Banco de Dados usando o COPY do PostgreSQL.
+
+        Args:
+            data (Dict[str, pd.DataFrame]): Dicionário com {'nome do arquivo': pd.DataFrame}.
+
+        Returns:
+            None: Mensagem de sucesso, se erro, mensagem de erro.
+        """
+        logger.info('Iniciando COPY de Dados no Banco...')
+
+        try:
+            self.db.insert_data_with_copy(data)
+            logger.info('Processo concluído com sucesso.')
+
+        except Exception as e:
+            logger.error(f'Erro ao concluir processo: {str(e)}')
+            raise
+
+    def save_data_into_db_in_parallel(
+        self,
+        data: Dict[str, pd.DataFrame],
+        on_loaded: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        Salva as tabelas no Banco de Dados ao mesmo tempo, via COPY, uma por conexão.
+
+        Cada tabela é tentada de novo sozinha em caso de erro temporário (`RetryPolicy`).
+
+        Args:
+            data (Dict[str, pd.DataFrame]): Dicionário com {'nome do arquivo': pd.DataFrame}.
+            on_loaded (Optional[Callable]): Chamada com o nome de cada tabela assim que ela é gravada.
+
+        Returns:
+            None: Mensagem de sucesso, se erro, mensagem de erro.
+        """
+        logger.info('Iniciando Carga Paralela de Dados no Banco...')
+
+        try:
+            self.db.insert_data_parallel(data, method='copy', retry=self.retry, on_loaded=on_loaded)
+            logger.info('Processo concluído com sucesso.')
+
+        except Exception as e:
+            logger.error(f'Erro ao concluir processo: {str(e)}')
+            raise
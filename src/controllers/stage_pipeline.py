@@ -0,0 +1,337 @@
+import time
+import queue
+import logging
+import threading
+
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class PipelineStage:
+    """
+    Etapa de uma `StagePipeline`: uma função aplicada a cada arquivo por `workers` threads.
+
+    A função recebe o nome do arquivo e o resultado da etapa anterior e devolve o
+    resultado passado para a etapa seguinte.
+    """
+
+    def __init__(self, name: str, function: Callable[[str, Any], Any], workers: int = 1):
+        if workers < 1:
+            raise ValueError(f'Quantidade de workers inválida para a etapa {name}: {workers}')
+
+        self.name = name
+        self.function = function
+        self.workers = workers
+
+
+class StagePipeline:
+    """
+    Executa uma sequência de etapas em que cada arquivo avança sozinho, sem esperar os demais.
+
+    Entre duas etapas há uma fila limitada a `queue_size` arquivos. Com a etapa
+    seguinte ocupada e a fila cheia, a anterior espera (backpressure), então no
+    máximo `workers + queue_size` resultados de cada etapa ficam em memória ao
+    mesmo tempo. O primeiro erro para todas as etapas e é levantado por `run`; os
+    arquivos que estavam em andamento são descartados.
+
+    Exemplo:
+        pipeline = StagePipeline([
+            PipelineStage('extract', download, workers=2),
+            PipelineStage('load', load, workers=1)
+        ], queue_size=1)
+        pipeline.run({'encounters': 'encounters/encounters_2026-01-17T22:02:19.parquet'})
+    """
+
+    def __init__(self, stages: List[PipelineStage], queue_size: int = 1, poll_interval: float = 0.1):
+        if not stages:
+            raise ValueError('A pipeline precisa de pelo menos uma etapa.')
+        if queue_size < 1:
+            raise ValueError(f'Tamanho de fila inválido: {queue_size}')
+
+        self.stages = stages
+        self.queue_size = queue_size
+        self.poll_interval = poll_interval
+
+        self.timeline = []
+        self._totals = {}
+        self._error = None
+        self._start = None
+        self._end = None
+        self._stop = threading.Event()
+        self._lock = threading.Lock()
+
+    def run(self, items: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Passa cada item por todas as etapas.
+
+        Args:
+            items (Dict[str, Any]): Entrada da primeira etapa de cada arquivo (ex: {'nome do arquivo': 'snapshot'}).
+
+        Returns:
+            Dict[str, Any]: Resultado da última etapa de cada arquivo.
+        """
+        self.timeline = []
+        self._totals = {stage.name: {'blocked_seconds': 0.0, 'waiting_seconds': 0.0} for stage in self.stages}
+        self._error = None
+        self._stop.clear()
+
+        queues = [queue.Queue()]
+        queues += [queue.Queue(maxsize=self.queue_size) for _ in self.stages[1:]]
+        queues.append(queue.Queue())
+
+        threads = [
+            [
+                threading.Thread(
+                    target=self._work,
+                    args=(stage, queues[index], queues[index + 1]),
+                    name=f'{stage.name}-{worker}',
+                    daemon=True
+                )
+                for worker in range(stage.workers)
+            ]
+            for index, stage in enumerate(self.stages)
+        ]
+
+        self._start = time.perf_counter()
+        try:
+            for stage_threads in threads:
+                for thread in stage_threads:
+                    thread.start()
+
+            for item in items.items():
+                queues[0].put(item)
+
+            for index, stage in enumerate(self.stages):
+                for _ in range(stage.workers):
+                    self._put(queues[index], _DONE)
+
+                for thread in threads[index]:
+                    thread.join()
+
+        except BaseException:
+            self._stop.set()
+            raise
+
+        finally:
+            self._end = time.perf_counter()
+
+        if self._error:
+            raise self._error
+
+        results = {}
+        while not queues[-1].empty():
+            name, result = queues[-1].get_nowait()
+            results[name] = result
+
+        return results
+
+    def report(self) -> Dict[str, Any]:
+        """
+        Resume a última execução: tempo de cada etapa e quanto dele coincidiu com as outras.
+
+        - 'busy_seconds': tempo com pelo menos um worker da etapa trabalhando.
+        - 'work_seconds': soma do tempo de todos os arquivos na etapa.
+        - 'parallelism': 'work_seconds' / 'busy_seconds', quantos workers da etapa trabalhavam em média.
+        - 'overlap_seconds' / 'overlap_ratio': parte de 'busy_seconds' em que outra etapa também trabalhava.
+        - 'blocked_seconds': tempo dos workers esperando espaço na fila seguinte (backpressure).
+        - 'waiting_seconds': tempo dos workers esperando arquivos da etapa anterior.
+
+        'serial_seconds' soma o 'busy_seconds' de todas as etapas: o tempo aproximado
+        de rodar uma etapa depois da outra, mantendo os workers de cada uma. 'speedup'
+        é esse tempo dividido pelo total, o ganho apenas da sobreposição entre etapas.
+        O ganho dos workers dentro de cada etapa fica em 'parallelism'.
+
+        Returns:
+            Dict[str, Any]: Resumo por etapa e linha do tempo de cada arquivo (segundos desde o início).
+        """
+        wall_seconds = (self._end or time.perf_counter()) - self._start if self._start else 0.0
+
+        busy = {
+            stage.name: _merge([(start, end) for name, _, start, end in self.timeline if name == stage.name])
+            for stage in self.stages
+        }
+
+        stages = {}
+        for stage in self.stages:
+            intervals = [(start, end) for name, _, start, end in self.timeline if name == stage.name]
+            others = _merge([interval for name, merged in busy.items() if name != stage.name for interval in merged])
+
+            busy_seconds = _length(busy[stage.name])
+            work_seconds = sum(end - start for start, end in intervals)
+            overlap_seconds = _intersection_length(busy[stage.name], others)
+
+            stages[stage.name] = {
+                'workers': stage.workers,
+                'datasets': len(intervals),
+                'busy_seconds': round(busy_seconds, 4),
+                'work_seconds': round(work_seconds, 4),
+                'parallelism': round(work_seconds / busy_seconds, 2) if busy_seconds else 0.0,
+                'overlap_seconds': round(overlap_seconds, 4),
+                'overlap_ratio': round(overlap_seconds / busy_seconds, 4) if busy_seconds else 0.0,
+                'blocked_seconds': round(self._totals.get(stage.name, {}).get('blocked_seconds', 0.0), 4),
+                'waiting_seconds': round(self._totals.get(stage.name, {}).get('waiting_seconds', 0.0), 4)
+            }
+
+        serial_seconds = sum(_length(merged) for merged in busy.values())
+        return {
+            'queue_size': self.queue_size,
+            'wall_seconds': round(wall_seconds, 4),
+            'serial_seconds': round(serial_seconds, 4),
+            'speedup': round(serial_seconds / wall_seconds, 2) if wall_seconds else None,
+            'stages': stages,
+            'timeline': [
+                {'stage': name, 'dataset': dataset, 'start': round(start, 4), 'end': round(end, 4)}
+                for name, dataset, start, end in sorted(self.timeline, key=lambda entry: entry[2])
+            ]
+        }
+
+    def _work(self, stage: PipelineStage, inbox: queue.Queue, outbox: queue.Queue) -> None:
+        """
+        Worker de uma etapa: processa os arquivos da fila até receber o fim ou um erro parar a pipeline.
+
+        Args:
+            stage (PipelineStage): Etapa do worker.
+            inbox (queue.Queue): Fila com a saída da etapa anterior.
+            outbox (queue.Queue): Fila da etapa seguinte.
+        """
+        while True:
+            item = self._get(stage.name, inbox)
+            if item is _DONE:
+                return
+
+            name, value = item
+            item = None
+
+            start = time.perf_counter()
+            try:
+                result = stage.function(name, value)
+
+            except Exception as e:
+                self._fail(stage.name, name, e)
+                return
+
+            finally:
+                value = None
+                with self._lock:
+                    self.timeline.append((stage.name, name, start - self._start, time.perf_counter() - self._start))
+
+            self._put(outbox, (name, result), stage.name)
+            result = None
+
+    def _get(self, stage_name: str, inbox: queue.Queue) -> Any:
+        """
+        Espera o próximo arquivo da fila, ou o fim se a pipeline foi parada.
+
+        Args:
+            stage_name (str): Etapa que espera, para somar o tempo de espera.
+            inbox (queue.Queue): Fila de entrada da etapa.
+
+        Returns:
+            Any: (nome do arquivo, valor) ou o marcador de fim.
+        """
+        start = time.perf_counter()
+        try:
+            while not self._stop.is_set():
+                try:
+                    return inbox.get(timeout=self.poll_interval)
+
+                except queue.Empty:
+                    continue
+
+            return _DONE
+
+        finally:
+            self._add_total(stage_name, 'waiting_seconds', time.perf_counter() - start)
+
+    def _put(self, outbox: queue.Queue, item: Any, stage_name: Optional[str] = None) -> None:
+        """
+        Coloca um item na fila, esperando espaço enquanto a pipeline não for parada.
+
+        Args:
+            outbox (queue.Queue): Fila de destino.
+            item (Any): Item a ser colocado.
+            stage_name (Optional[str]): Etapa que espera, para somar o tempo bloqueado pela fila cheia.
+        """
+        start = time.perf_counter()
+        while not self._stop.is_set():
+            try:
+                outbox.put(item, timeout=self.poll_interval)
+                break
+
+            except queue.Full:
+                continue
+
+        if stage_name:
+            self._add_total(stage_name, 'blocked_seconds', time.perf_counter() - start)
+
+    def _add_total(self, stage_name: str, key: str, seconds: float) -> None:
+        with self._lock:
+            self._totals[stage_name][key] += seconds
+
+    def _fail(self, stage_name: str, name: str, error: Exception) -> None:
+        """
+        Guarda o primeiro erro e para todas as etapas.
+
+        Args:
+            stage_name (str): Etapa que falhou.
+            name (str): Arquivo que falhou.
+            error (Exception): Erro levantado pela etapa.
+        """
+        logger.error(f'Erro na etapa {stage_name} de {name}: {str(error)}')
+        with self._lock:
+            if self._error is None:
+                error.add_note(f'Etapa: {stage_name} | Arquivo: {name}')
+                self._error = error
+        self._stop.set()
+
+
+def _merge(intervals: List[Tuple[float, float]]) -> List[Tuple[float, float]]:
+    """
+    Junta intervalos que se sobrepõem.
+
+    Args:
+        intervals (List[Tuple[float, float]]): Intervalos (início, fim) em qualquer ordem.
+
+    Returns:
+        List[Tuple[float, float]]: Intervalos ordenados e sem sobreposição.
+    """
+    merged = []
+    for start, end in sorted(intervals):
+        if merged and start <= merged[-1][1]:
+            merged[-1] = (merged[-1][0], max(merged[-1][1], end))
+        else:
+            merged.append((start, end))
+
+    return merged
+
+
+def _length(intervals: List[Tuple[float, float]]) -> float:
+    return sum(end - start for start, end in intervals)
+
+
+def _intersection_length(first: List[Tuple[float, float]], second: List[Tuple[float, float]]) -> float:
+    """
+    Calcula o tempo em comum entre duas listas de intervalos já juntados por `_merge`.
+
+    Args:
+        first (List[Tuple[float, float]]): Intervalos ordenados e sem sobreposição.
+        second (List[Tuple[float, float]]): Intervalos ordenados e sem sobreposição.
+
+    Returns:
+        float: Soma dos trechos presentes nas duas listas.
+    """
+    total, i, j = 0.0, 0, 0
+    while i < len(first) and j < len(second):
+        start = max(first[i][0], second[j][0])
+        end = min(first[i][1], second[j][1])
+        total += max(0.0, end - start)
+
+        if first[i][1] < second[j][1]:
+            i += 1
+        else:
+            j += 1
+
+    return total
@@ -1,30 +1,88 @@
 import os
-import io
+import csv
+import json
+import hashlib
+import shutil
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 import logging
 
 from datetime import datetime
 from dotenv import load_dotenv
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Type, Union, Any
 from pathlib import Path
+from pyarrow import csv as pa_csv
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 from src.contracts.schema import EncontersSchema, OrganizationsSchema, PatientsSchema, PayersSchema, ProceduresSchema
-from src.cloud.cloud_connection import AzureCloud
+from src.contracts.arrow_schema import get_arrow_schema, get_unique_columns, get_schema_version
+from src.contracts.arrow_validation import validate_table
+from src.contracts.dtype_plan import (
+    CATEGORY_TYPE,
+    apply_arrow_plan,
+    apply_pandas_plan,
+    get_category_columns,
+    get_compact_arrow_schema,
+    to_compact_pandas
+)
+from src.contracts.validation_cache import ValidationCache, file_hash
+from src.cloud.storage import StorageBackend, get_storage
+from src.cloud.manifest import read_index, write_manifests
+from src.metrics.run_metrics import RunMetrics
+from src.cloud.partitioning import iter_partitions, partition_blob_name, table_hash, write_partition
+from src.data_source.upload_ledger import UploadLedger
+from src.recovery.checkpoints import CheckpointStore
+from src.recovery.retry import RetryPolicy
+from src.data_source.parquet_profiles import WRITE_PROFILES, WriteProfiles, open_parquet_writer, write_dataframe
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(name)s | %(levelname)s | %(message)s',
-)
+CSV_NULL_VALUES = pa_csv.ConvertOptions().null_values
 
 class DataSource:
     """Responsável por fazer Coleta de Dados do tipo CSV."""
-    def __init__(self, cloud_conn: Optional[AzureCloud] = None):
+    def __init__(
+        self,
+        cloud_conn: Optional[StorageBackend] = None,
+        validation_backend: Optional[str] = None,
+        partitioned: Optional[bool] = None
+    ):
         load_dotenv()
 
-        self.cloud_conn = cloud_conn or AzureCloud()
+        self._cloud_conn = cloud_conn
         self.file_path = 'src/data'
+        self.staging_path = 'src/temp_uploads'
+        self.block_size = int(os.getenv('CSV_BLOCK_SIZE', 16 * 1024 * 1024))
+        self.max_workers = int(os.getenv('CSV_MAX_WORKERS', os.cpu_count() or 1))
+
+        self.validation_backend = validation_backend or os.getenv('VALIDATION_BACKEND', 'pandera')
+        if self.validation_backend not in ('pandera', 'arrow'):
+            raise ValueError(f'Backend de validação inválido: {self.validation_backend}')
+
+        cache_path = os.getenv('VALIDATION_CACHE_PATH', 'src/.validation_cache')
+        self.validation_cache = ValidationCache(cache_path) if cache_path else None
+
+        ledger_path = os.getenv('UPLOAD_LEDGER_PATH', 'src/.upload_ledger.json')
+        self.upload_ledger = UploadLedger(ledger_path) if ledger_path else None
+
+        if partitioned is None:
+            partitioned = os.getenv('PARQUET_PARTITIONED', 'false').lower() == 'true'
+        self.partitioned = partitioned
+        self.write_profiles = WriteProfiles()
+
+        self.source_files = {}
+        self.file_hashes = {}
+        self.metrics = RunMetrics('data_source')
+        self.checkpoints = CheckpointStore('data_source')
+        self.retry = RetryPolicy()
+
+        self.partition_columns = {
+            'encounters': 'start',
+            'procedures': 'start'
+        }
+
         self.validation_schema = {
             'encounters': EncontersSchema,
             'organizations': OrganizationsSchema,
@@ -33,18 +91,67 @@ class DataSource:
             'procedures': ProceduresSchema
         }
 
-    def start(self):
-        """Roda a Pipeline de Dados."""
+        self.transform_modes = {
+            'default': self.transform_data,
+            'streaming': self.transform_data_streaming,
+            'parallel': self.transform_data_parallel
+        }
+
+    @property
+    def cloud_conn(self) -> StorageBackend:
+        """Armazenamento dos arquivos, criado no primeiro uso (só a carga precisa dele)."""
+        if self._cloud_conn is None:
+            self._cloud_conn = get_storage()
+        return self._cloud_conn
+
+    def start(self, transform_mode: str = 'default', profile: Optional[bool] = None, resume: bool = False):
+        """
+        Roda a Pipeline de Dados.
+
+        Cada arquivo enviado é marcado como 'uploaded' nos checkpoints (ver
+        `CheckpointStore`). Com `resume=True`, os arquivos já enviados com o mesmo
+        conteúdo não são nem transformados, e nos modos 'streaming' e 'parallel' os
+        parquets já validados no staging são reutilizados.
+
+        Args:
+            transform_mode (str): Modo de transformação ('default', 'streaming' ou 'parallel').
+                No modo 'streaming' cada CSV é lido em blocos e gravado em parquet no disco.
+                No modo 'parallel' cada CSV é processado da mesma forma, em um processo separado.
+            profile (Optional[bool]): Grava cProfile e tracemalloc por etapa (padrão: `PROFILE_ENABLED`).
+                As etapas que rodam em outros processos (modo 'parallel') não são perfiladas.
+            resume (bool): Retoma a última execução, pulando o que já foi concluído.
+        """
         logger.info('Iniciando Pipeline de Dados...')
 
+        transform_function = self.transform_modes.get(transform_mode)
+        if not transform_function:
+            raise ValueError(f'Modo de transformação inválido: {transform_mode}')
+
         start_time = datetime.now()
+        self.metrics.begin(profile=profile)
+        self.checkpoints.begin(resume=resume)
+        status = 'error'
         try:
-            data = self.extract_data()
-            data = self.transform_data(data)
-            data = self.load_data(data)
+            with self.metrics.stage('extract') as stage:
+                data = self.extract_data()
+                stage['bytes'] = sum(Path(file).stat().st_size for file in data)
+
+            reader = self._dataframe_reader() if transform_mode == 'default' else 'arrow'
+            data = self._get_pending_files(data, reader)
+
+            if data:
+                with self.metrics.stage('transform', data_bytes=stage['bytes']):
+                    data = transform_function(data)
+
+                with self.metrics.stage('load'):
+                    if transform_mode == 'default':
+                        data = self.load_data(data)
+                    else:
+                        data = self.load_files(data)
 
             end_time = datetime.now()
             pipeline_time = (end_time - start_time).total_seconds()
+            status = 'success'
 
             logger.info(f'Pipeline Concluída com Sucesso em: {pipeline_time:.2f}s')
 
@@ -52,6 +159,39 @@ class DataSource:
             logger.error(f'Erro ao rodar a pipeline: {str(e)}')
             raise
 
+        finally:
+            self.checkpoints.finish(status)
+            self.metrics.finish(status)
+
+    def _get_pending_files(self, data: List[Path], reader: str) -> List[Path]:
+        """
+        Remove os CSVs que a execução retomada já enviou com o mesmo conteúdo.
+
+        Args:
+            data (List[Path]): Lista com os arquivos no diretório padrão.
+            reader (str): Leitor de CSV do modo de transformação ('pandas-text' ou 'arrow').
+
+        Returns:
+            List[Path]: Arquivos que ainda precisam ser transformados e enviados.
+        """
+        if not self.checkpoints.resumed:
+            return data
+
+        pending = []
+        for file in data:
+            name = Path(file).stem
+            content_hash = self._content_hash(name, reader)
+
+            checkpoint = content_hash and self.checkpoints.get(name, 'uploaded', content_hash)
+            if checkpoint:
+                logger.info(f"{name}: já enviado em {checkpoint['blob_name']}, pulando.")
+                continue
+
+            pending.append(file)
+
+        logger.info(f'{len(pending)}/{len(data)} arquivos pendentes.')
+        return pending
+
     def extract_data(self) -> List[Path]:
         """
         Extrai os arquivos no diretório padrão e joga para uma lista.
@@ -68,6 +208,7 @@ class DataSource:
                 if file.endswith('.csv'):
                     full_path = os.path.join(self.file_path, file)
                     files.append(full_path)
+                    self.source_files[Path(file).stem] = full_path
 
             logger.info(f'{len(files)} arquivos extraidos com sucesso.')
             return files
@@ -98,22 +239,32 @@ class DataSource:
             for file in data:
                 filename = Path(file).stem
                 logger.info(f'{filename}')
-                df = pd.read_csv(file)
-
-                df.columns = (
-                    df.columns
-                        .str.strip()
-                        .str.lower()
-                        .str.replace(' ', '_')
-                        .str.replace('-', '_')
-                )
 
                 schema = self.validation_schema.get(filename)
                 if not schema:
                     raise ValueError(f'Schema não encontrado para: {filename}')
-                
-                df_validated = schema.validate(df)
-                df_dict[filename] = df_validated
+
+                with self.metrics.stage('transform', dataset=filename, data_bytes=Path(file).stat().st_size) as stage:
+                    cache_key = self._cache_key(file, schema, self._dataframe_reader())
+                    cached_path = self._get_cached(filename, cache_key)
+                    if cached_path:
+                        df_dict[filename] = to_compact_pandas(pq.read_table(cached_path))
+                        stage['rows'] = len(df_dict[filename])
+                        continue
+
+                    df_validated = self._validate_file(file, schema)
+                    df_dict[filename] = df_validated
+                    stage['rows'] = len(df_validated)
+                    self._mark(filename, 'validated', self._dataframe_reader(), rows=len(df_validated))
+
+                    if cache_key:
+                        staging_dir = Path(self.staging_path)
+                        staging_dir.mkdir(exist_ok=True)
+                        parquet_path = staging_dir / f'{filename}.parquet'
+
+                        df_validated.to_parquet(parquet_path, engine='pyarrow', index=False)
+                        self._put_cached(filename, cache_key, parquet_path)
+                        parquet_path.unlink()
 
             logger.info(f'{len(df_dict)} arquivos transformados com sucesso.')
             return df_dict
@@ -122,9 +273,155 @@ class DataSource:
             logger.error(f'Erro ao transformar dados: \n{str(e)}')
             return {}
     
+    def transform_data_streaming(self, data: List[Path], block_size: Optional[int] = None) -> Dict[str, Path]:
+        """
+        Lê cada CSV em blocos, valida cada bloco e grava em um arquivo parquet local.
+
+        O pico de memória depende do tamanho do bloco e não do tamanho dos arquivos.
+
+        Args:
+            data (List[Path]): Lista com os arquivos no diretório padrão.
+            block_size (Optional[int]): Tamanho em bytes de cada bloco lido do CSV (padrão: `CSV_BLOCK_SIZE`).
+
+        Returns:
+            Dict(str, Path): Dicionário com 'nome do arquivo': caminho do parquet gerado.
+        """
+        logger.info('Iniciando Transformação de Dados em blocos...')
+
+        if not data:
+            logger.warning('Transformação Cancelada. Nenhum arquivo foi passado')
+            return {}
+
+        staging_dir = Path(self.staging_path)
+        staging_dir.mkdir(exist_ok=True)
+
+        files = {}
+        try:
+            for file in data:
+                filename = Path(file).stem
+
+                schema = self.validation_schema.get(filename)
+                if not schema:
+                    raise ValueError(f'Schema não encontrado para: {filename}')
+
+                with self.metrics.stage('transform', dataset=filename, data_bytes=Path(file).stat().st_size) as stage:
+                    profile = self.write_profiles.get(filename)
+                    cache_key = self._cache_key(file, schema, 'arrow', profile)
+                    cached_path = self._get_cached(filename, cache_key) or self._get_validated_file(filename)
+                    if cached_path:
+                        files[filename] = cached_path
+                        continue
+
+                    output_path = staging_dir / f'{filename}.parquet'
+                    total_records = _csv_to_parquet(
+                        file, output_path, schema, block_size or self.block_size, self.validation_backend, profile
+                    )
+                    self._put_cached(filename, cache_key, output_path)
+                    self._mark_validated_file(filename, output_path, total_records)
+                    stage['rows'] = total_records
+
+                files[filename] = output_path
+                logger.info(f'{filename}: {total_records} registros validados.')
+
+            logger.info(f'{len(files)} arquivos transformados com sucesso.')
+            return files
+
+        except Exception as e:
+            logger.error(f'Erro ao transformar dados: \n{str(e)}')
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+
+    def transform_data_parallel(
+        self,
+        data: List[Path],
+        max_workers: Optional[int] = None,
+        block_size: Optional[int] = None
+    ) -> Dict[str, Path]:
+        """
+        Lê, valida e grava cada CSV em parquet em um processo separado.
+
+        Cada processo devolve apenas a quantidade de registros; o parquet fica no
+        diretório de staging. Os erros de cada arquivo são registrados sem esconder
+        o resultado dos demais e reunidos em um `ExceptionGroup` ao final.
+
+        Args:
+            data (List[Path]): Lista com os arquivos no diretório padrão.
+            max_workers (Optional[int]): Quantidade de processos (padrão: `CSV_MAX_WORKERS`).
+            block_size (Optional[int]): Tamanho em bytes de cada bloco lido do CSV (padrão: `CSV_BLOCK_SIZE`).
+
+        Returns:
+            Dict(str, Path): Dicionário com 'nome do arquivo': caminho do parquet gerado.
+        """
+        logger.info('Iniciando Transformação de Dados em paralelo...')
+
+        if not data:
+            logger.warning('Transformação Cancelada. Nenhum arquivo foi passado')
+            return {}
+
+        staging_dir = Path(self.staging_path)
+        staging_dir.mkdir(exist_ok=True)
+
+        workers = max(1, min(max_workers or self.max_workers, len(data)))
+
+        files = {}
+        errors = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {}
+            for file in data:
+                filename = Path(file).stem
+
+                schema = self.validation_schema.get(filename)
+                if not schema:
+                    error = ValueError(f'Schema não encontrado para: {filename}')
+                    logger.error(f'Erro ao transformar {filename}: {str(error)}')
+                    errors.append(error)
+                    continue
+
+                profile = self.write_profiles.get(filename)
+                cache_key = self._cache_key(file, schema, 'arrow', profile)
+                cached_path = self._get_cached(filename, cache_key) or self._get_validated_file(filename)
+                if cached_path:
+                    files[filename] = cached_path
+                    continue
+
+                output_path = staging_dir / f'{filename}.parquet'
+                future = executor.submit(
+                    _csv_to_parquet, file, output_path, schema, block_size or self.block_size,
+                    self.validation_backend, profile
+                )
+                futures[future] = (filename, output_path, cache_key)
+
+            for future in as_completed(futures):
+                filename, output_path, cache_key = futures[future]
+                try:
+                    total_records = future.result()
+                    self._put_cached(filename, cache_key, output_path)
+                    self._mark_validated_file(filename, output_path, total_records)
+                    files[filename] = output_path
+                    logger.info(f'{filename}: {total_records} registros validados.')
+
+                except Exception as e:
+                    logger.error(f'Erro ao transformar {filename}: \n{str(e)}')
+                    e.add_note(f'Arquivo: {filename}')
+                    errors.append(e)
+
+        if errors:
+            logger.error(f'{len(errors)}/{len(data)} arquivos falharam; {len(files)} transformados: {sorted(files)}')
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise ExceptionGroup(f'{len(errors)}/{len(data)} arquivos falharam na transformação', errors)
+
+        logger.info(f'{len(files)} arquivos transformados com sucesso em {workers} processos.')
+        return files
+
     def load_data(self, df_dict: Dict[str, pd.DataFrame]) -> None:
         """
         Transforma os arquiuvos em parquet e depois salva na Azure.
+
+        O parquet é escrito direto no armazenamento (`open_writer`), um row group por
+        vez: na Azure, os blocos já prontos são enviados enquanto os próximos são
+        gerados, sem montar o arquivo inteiro em memória. A etapa 'to_parquet' mede a
+        geração do parquet (incluindo a espera por blocos na fila de envio) e a
+        'upload', que a contém, também o envio dos últimos blocos.
         
         Args:
             df_dict (Dict[str, DataFrame]): Dicionário com 'nome do arquivo': pd.DataFrame.
@@ -138,24 +435,547 @@ class DataSource:
             logger.warning('Salvamento cancelado. Nenhum dado foi passado.')
             raise
 
+        skipped = 0
+        bytes_saved = 0
+        manifests = {}
+        error = None
         try:
+            previous = self._read_previous_manifests(df_dict)
+
             for name, df in df_dict.items():
-                download_buffer = io.BytesIO()
-                df.to_parquet(download_buffer, engine='pyarrow', index=False)
-                parquet_data = download_buffer.getvalue()
+                content_hash = self._content_hash(name, self._dataframe_reader())
+                last_upload = self._get_unchanged_upload(name, content_hash)
+                if last_upload:
+                    skipped += 1
+                    bytes_saved += last_upload['size']
+                    self._mark(
+                        name, 'uploaded', self._dataframe_reader(),
+                        blob_name=last_upload['blob_name'], size=last_upload['size']
+                    )
+                    continue
+
+                with self.metrics.stage('upload', dataset=name, rows=len(df)) as stage:
+                    file_name = self._rename_file()
+                    blob_name = f'{name}/{name}_{file_name}'
+
+                    metadata = {'content_hash': content_hash} if content_hash else None
+
+                    def upload() -> int:
+                        with self.cloud_conn.open_writer(blob_name, metadata) as sink:
+                            with self.metrics.stage('to_parquet', dataset=name, rows=len(df)) as encode:
+                                write_dataframe(df, sink, self.write_profiles.get(name))
+                                encode['bytes'] = sink.tell()
+                            return sink.tell()
+
+                    size = stage['bytes'] = self.retry.call(f'upload de {blob_name}', upload)
+
+                    manifests[name] = self._register_upload(name, blob_name, size, len(df), content_hash)
+                    logger.info(f'{blob_name} arquivo salvo com sucesso.')
+
+                    if name in self.partition_columns and self.partitioned:
+                        manifests[name]['partition_column'] = self.partition_columns[name]
+                        manifests[name]['partitions'] = self._upload_partitions(
+                            name, pa.Table.from_pandas(df, preserve_index=False), previous.get(name), file_name
+                        )
+
+                self._mark(name, 'uploaded', self._dataframe_reader(), blob_name=blob_name, size=size)
+
+            logger.info(f'{len(df_dict) - skipped} arquivos salvos com sucesso.')
+            logger.info(f'{skipped} arquivos sem alterações ignorados ({bytes_saved} bytes economizados).')
+
+        except Exception as e:
+            logger.error(f'Erro ao tentar salvar os arquivos na Azure: {str(e)}')
+            error = e
+            raise
+
+        finally:
+            self._write_manifests(manifests, error)
+
+    def load_files(self, files: Dict[str, Path]) -> None:
+        """
+        Envia os arquivos parquet gerados localmente para a Azure, lendo do disco em partes.
+
+        Se algum envio falhar e os checkpoints estiverem ligados, o staging é mantido
+        para que `start(resume=True)` reutilize os parquets já validados.
+
+        Args:
+            files (Dict[str, Path]): Dicionário com 'nome do arquivo': caminho do parquet.
+
+        Returns:
+            None: Mensagem de sucesso, se erro, mensagem de erro.
+        """
+        logger.info('Preparando Arquivos para serem salvos...')
+
+        if not files:
+            logger.warning('Salvamento cancelado. Nenhum arquivo foi passado.')
+            return
+
+        skipped = 0
+        bytes_saved = 0
+        manifests = {}
+        succeeded = False
+        error = None
+        try:
+            previous = self._read_previous_manifests(files)
+
+            for name, path in files.items():
+                content_hash = self._content_hash(name, 'arrow')
+                last_upload = self._get_unchanged_upload(name, content_hash)
+                if last_upload:
+                    skipped += 1
+                    bytes_saved += last_upload['size']
+                    self._mark(name, 'uploaded', 'arrow', blob_name=last_upload['blob_name'], size=last_upload['size'])
+                    continue
 
                 file_name = self._rename_file()
                 blob_name = f'{name}/{name}_{file_name}'
 
-                self.cloud_conn.upload_data(blob_name=blob_name, data=parquet_data)
-                logger.info(f'{blob_name} arquivo salvo com sucesso.')
+                rows = pq.read_metadata(path).num_rows
+                size = Path(path).stat().st_size
+                with self.metrics.stage('upload', dataset=name, rows=rows, data_bytes=size):
+                    with open(path, 'rb') as parquet_file:
+                        manifests[name] = self._upload(name, blob_name, parquet_file, size, rows, content_hash)
+
+                    logger.info(f'{blob_name} arquivo salvo com sucesso.')
 
-            logger.info(f'{len(df_dict)} arquivos salvos com sucesso.')
+                    if name in self.partition_columns and self.partitioned:
+                        manifests[name]['partition_column'] = self.partition_columns[name]
+                        manifests[name]['partitions'] = self._upload_partitions(name, path, previous.get(name), file_name)
+
+                self._mark(name, 'uploaded', 'arrow', blob_name=blob_name, size=size)
+
+            logger.info(f'{len(files) - skipped} arquivos salvos com sucesso.')
+            logger.info(f'{skipped} arquivos sem alterações ignorados ({bytes_saved} bytes economizados).')
+            succeeded = True
 
         except Exception as e:
             logger.error(f'Erro ao tentar salvar os arquivos na Azure: {str(e)}')
+            error = e
             raise
 
+        finally:
+            self._write_manifests(manifests, error)
+
+            if succeeded or not self.checkpoints.enabled:
+                shutil.rmtree(Path(self.staging_path), ignore_errors=True)
+
+    def _write_manifests(self, manifests: Dict[str, Dict[str, Any]], error: Optional[Exception] = None) -> None:
+        """
+        Salva os manifestos dos arquivos já enviados, mesmo se um envio seguinte falhou.
+
+        Se o envio já falhou (ex: armazenamento fora do ar), um erro ao salvar os
+        manifestos só é registrado, para não esconder o erro original.
+
+        Args:
+            manifests (Dict[str, Dict[str, Any]]): {'nome do arquivo': manifesto} dos arquivos enviados.
+            error (Optional[Exception]): Erro do envio que está sendo levantado, se houver.
+        """
+        try:
+            write_manifests(self.cloud_conn, manifests)
+
+        except Exception as e:
+            if error is None:
+                raise
+
+            logger.error(f'Erro ao salvar os manifestos dos arquivos enviados: {str(e)}')
+            error.add_note(f'Manifestos não foram salvos: {str(e)}')
+
+    def _upload(
+        self,
+        name: str,
+        blob_name: str,
+        data,
+        size: int,
+        rows: int,
+        content_hash: Optional[str]
+    ) -> Dict:
+        """
+        Envia um arquivo para a Azure com o hash do conteúdo nos metadados e registra o upload.
+
+        Erros temporários são tentados de novo (`RetryPolicy`), lendo o arquivo desde o início.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            blob_name (str): Nome do blob de destino.
+            data (bytes | BinaryIO): Conteúdo do parquet.
+            size (int): Tamanho do conteúdo em bytes.
+            rows (int): Quantidade de linhas do arquivo.
+            content_hash (Optional[str]): Hash gerado por `_content_hash`.
+
+        Returns:
+            Dict: Manifesto do snapshot enviado (blob, data, tamanho, linhas e hash).
+        """
+        metadata = {'content_hash': content_hash} if content_hash else None
+
+        def upload() -> None:
+            if hasattr(data, 'seek'):
+                data.seek(0)
+            self.cloud_conn.upload_data(blob_name=blob_name, data=data, metadata=metadata)
+
+        self.retry.call(f'upload de {blob_name}', upload)
+
+        return self._register_upload(name, blob_name, size, rows, content_hash)
+
+    def _register_upload(
+        self,
+        name: str,
+        blob_name: str,
+        size: int,
+        rows: int,
+        content_hash: Optional[str]
+    ) -> Dict:
+        """
+        Registra um arquivo já enviado no registro de uploads.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            blob_name (str): Nome do blob enviado.
+            size (int): Tamanho do conteúdo em bytes.
+            rows (int): Quantidade de linhas do arquivo.
+            content_hash (Optional[str]): Hash gerado por `_content_hash`.
+
+        Returns:
+            Dict: Manifesto do snapshot enviado (blob, data, tamanho, linhas e hash).
+        """
+        if content_hash and self.upload_ledger:
+            self.upload_ledger.put(name, {
+                'content_hash': content_hash,
+                'blob_name': blob_name,
+                'size': size,
+                'uploaded_at': datetime.now().isoformat()
+            })
+
+        return {
+            'blob_name': blob_name,
+            'snapshot': Path(blob_name).stem.split('_')[-1],
+            'size': size,
+            'rows': rows,
+            'content_hash': content_hash
+        }
+
+    def _upload_partitions(
+        self,
+        name: str,
+        source: Union[pa.Table, Path],
+        previous: Optional[Dict],
+        file_name: str
+    ) -> Dict[str, Dict]:
+        """
+        Envia um arquivo particionado por ano/mês (layout Hive), apenas com as partições alteradas.
+
+        O hash de cada partição é comparado com o manifesto anterior; partições
+        iguais continuam apontando para o blob já enviado.
+
+        O snapshot completo continua sendo enviado junto com as partições: a carga
+        no Banco (`Controller.start` e `start_incremental`) lê o arquivo inteiro pelo
+        'blob_name' do manifesto, e as partições servem às leituras por intervalo de
+        datas (`Controller.read_date_range`).
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            source (pa.Table | Path): Dados validados, em memória ou em um parquet local.
+            previous (Optional[Dict]): Manifesto anterior do arquivo, se existir.
+            file_name (str): Data e hora do envio, gerado por `_rename_file`.
+
+        Returns:
+            Dict[str, Dict]: Dicionário com {'chave da partição': blob, tamanho, linhas e hash}.
+        """
+        previous_partitions = (previous or {}).get('partitions') or {}
+
+        partitions = {}
+        uploaded = 0
+        for key, table in iter_partitions(source, self.partition_columns[name]):
+            content_hash = table_hash(table)
+
+            last_partition = previous_partitions.get(key)
+            if last_partition and last_partition['content_hash'] == content_hash:
+                partitions[key] = last_partition
+                continue
+
+            parquet_data = write_partition(table, self.write_profiles.get(name))
+            blob_name = partition_blob_name(name, key, file_name)
+            self.retry.call(
+                f'upload de {blob_name}', self.cloud_conn.upload_data, blob_name=blob_name, data=parquet_data
+            )
+
+            partitions[key] = {
+                'blob_name': blob_name,
+                'size': len(parquet_data),
+                'rows': table.num_rows,
+                'content_hash': content_hash
+            }
+            uploaded += 1
+
+        logger.info(f'{name}: {uploaded}/{len(partitions)} partições enviadas, {len(partitions) - uploaded} sem alterações.')
+        return partitions
+
+    def _read_previous_manifests(self, data: Dict) -> Dict[str, Dict]:
+        """
+        Lê os manifestos atuais, apenas se algum arquivo for particionado.
+
+        Args:
+            data (Dict): Dicionário com os arquivos a serem enviados.
+
+        Returns:
+            Dict[str, Dict]: Dicionário com {'nome do arquivo': manifesto}.
+        """
+        if not self.partitioned or not any(name in self.partition_columns for name in data):
+            return {}
+
+        return read_index(self.cloud_conn) or {}
+
+    def _get_unchanged_upload(self, name: str, content_hash: Optional[str]) -> Optional[Dict]:
+        """
+        Verifica se o arquivo já foi enviado com o mesmo conteúdo.
+
+        O registro local precisa ter o mesmo hash e o blob registrado ainda precisa
+        existir na Azure com esse hash nos metadados.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            content_hash (Optional[str]): Hash gerado por `_content_hash`.
+
+        Returns:
+            Optional[Dict]: Registro do último upload, se o arquivo puder ser ignorado.
+        """
+        if not content_hash or not self.upload_ledger:
+            return None
+
+        last_upload = self.upload_ledger.get(name)
+        if not last_upload or last_upload.get('content_hash') != content_hash:
+            return None
+
+        metadata = self.cloud_conn.get_blob_metadata(last_upload['blob_name'])
+        if not metadata or metadata.get('content_hash') != content_hash:
+            return None
+
+        logger.info(
+            f"{name}: sem alterações desde {last_upload['blob_name']}, "
+            f"upload ignorado ({last_upload['size']} bytes economizados)."
+        )
+        return last_upload
+
+    def _content_hash(self, name: str, reader: str) -> Optional[str]:
+        """
+        Calcula o hash do conteúdo de um arquivo a partir do CSV de origem.
+
+        O hash combina o conteúdo do CSV, a versão do contrato, o backend de validação,
+        o leitor de CSV e o perfil de escrita, que juntos definem o parquet gerado.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            reader (str): Leitor de CSV usado ('pandas-text' ou 'arrow').
+
+        Returns:
+            Optional[str]: Hash SHA-256, ou None se o CSV de origem não for conhecido.
+        """
+        source = self.source_files.get(name)
+        schema = self.validation_schema.get(name)
+        if not source or not schema:
+            return None
+
+        fingerprint = self._fingerprint(source, schema, reader)
+        if name in self.partition_columns and self.partitioned:
+            fingerprint['layout'] = 'partitioned'
+
+        profile_id = _profile_id(self.write_profiles.get(name))
+        if profile_id:
+            fingerprint['write_profile'] = profile_id
+
+        return hashlib.sha256(json.dumps(fingerprint, sort_keys=True).encode()).hexdigest()
+
+    def _dataframe_reader(self) -> str:
+        """
+        Retorna o leitor de CSV usado no modo 'default' para o backend configurado.
+
+        Returns:
+            str: 'arrow' para o backend 'arrow', 'pandas-text' para o backend 'pandera'.
+        """
+        return 'arrow' if self.validation_backend == 'arrow' else 'pandas-text'
+
+    def _file_hash(self, file: Path) -> str:
+        """
+        Calcula o hash do conteúdo de um CSV, uma única vez por execução.
+
+        Args:
+            file (Path): Caminho do CSV.
+
+        Returns:
+            str: Hash SHA-256 do arquivo.
+        """
+        key = str(file)
+        if key not in self.file_hashes:
+            self.file_hashes[key] = file_hash(file)
+
+        return self.file_hashes[key]
+
+    def _fingerprint(self, file: Path, schema: Type, reader: str) -> Dict[str, str]:
+        """
+        Monta a identificação do resultado da validação de um CSV.
+
+        Args:
+            file (Path): Caminho do CSV.
+            schema (Type): Contrato de `schema.py` do arquivo.
+            reader (str): Leitor de CSV usado ('pandas-text' ou 'arrow'). Resultados de leitores
+                antigos, que inferiam os tipos, não são reaproveitados.
+
+        Returns:
+            Dict[str, str]: Hash do conteúdo, versão do contrato, backend e leitor.
+        """
+        return {
+            'content_hash': self._file_hash(file),
+            'schema_version': get_schema_version(schema),
+            'backend': self.validation_backend,
+            'reader': reader
+        }
+
+    def _validate_file(self, file: Path, schema: Type) -> pd.DataFrame:
+        """
+        Lê um CSV inteiro e valida com o backend configurado.
+
+        Os dois backends leem todas as colunas como texto, com os mesmos valores nulos,
+        e deixam a conversão de tipos para o contrato. O backend 'pandera' usa
+        `pd.read_csv` + `schema.validate`. O backend 'arrow' usa o leitor do pyarrow
+        (as categóricas já como dicionário) e valida com kernels do `pyarrow.compute`.
+        Nos dois casos o resultado segue o plano de tipos compactos do contrato
+        (`dtype_plan.py`), então os backends geram os mesmos dados.
+
+        Args:
+            file (Path): Caminho do CSV.
+            schema (Type): Contrato de `schema.py` do arquivo.
+
+        Returns:
+            pd.DataFrame: Dados validados.
+        """
+        name = Path(file).stem
+
+        if self.validation_backend == 'arrow':
+            with self.metrics.stage('csv_parse', dataset=name, data_bytes=Path(file).stat().st_size) as stage:
+                table = pa_csv.read_csv(file, **_csv_options(file, self.block_size, schema))
+                stage['rows'] = table.num_rows
+            self._mark(name, 'parsed', 'arrow', rows=table.num_rows)
+
+            with self.metrics.stage('validate', dataset=name, rows=table.num_rows):
+                df = to_compact_pandas(apply_arrow_plan(validate_table(table, schema), schema))
+
+        else:
+            with self.metrics.stage('csv_parse', dataset=name, data_bytes=Path(file).stat().st_size) as stage:
+                df = _read_csv_as_text(file)
+                stage['rows'] = len(df)
+            self._mark(name, 'parsed', 'pandas-text', rows=len(df))
+
+            with self.metrics.stage('validate', dataset=name, rows=len(df)):
+                df = apply_pandas_plan(schema.validate(df), schema)
+
+        return df
+
+    def _mark(self, name: str, stage: str, reader: str, **details) -> None:
+        """
+        Grava o checkpoint de uma etapa, identificada pelo hash do conteúdo (`_content_hash`).
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            stage (str): Etapa ('parsed', 'validated' ou 'uploaded').
+            reader (str): Leitor de CSV usado ('pandas-text' ou 'arrow').
+            **details: Dados da etapa gravados junto com o checkpoint.
+        """
+        if not self.checkpoints.enabled:
+            return
+
+        content_hash = self._content_hash(name, reader)
+        if content_hash:
+            self.checkpoints.mark(name, stage, content_hash, **details)
+
+    def _get_validated_file(self, name: str) -> Optional[Path]:
+        """
+        Retorna o parquet validado no staging por uma execução retomada, se ainda estiver íntegro.
+
+        Args:
+            name (str): Nome do arquivo.
+
+        Returns:
+            Optional[Path]: Caminho do parquet, ou None.
+        """
+        content_hash = self._content_hash(name, 'arrow')
+        checkpoint = content_hash and self.checkpoints.get(name, 'validated', content_hash)
+        if not checkpoint or 'path' not in checkpoint:
+            return None
+
+        path = Path(checkpoint['path'])
+        if not path.exists() or file_hash(path) != checkpoint['file_hash']:
+            return None
+
+        logger.info(f'{name}: reutilizando o parquet validado em {path}.')
+        return path
+
+    def _mark_validated_file(self, name: str, path: Path, rows: int) -> None:
+        """
+        Grava o checkpoint 'validated' de um parquet gerado no staging.
+
+        Args:
+            name (str): Nome do arquivo.
+            path (Path): Caminho do parquet.
+            rows (int): Quantidade de registros.
+        """
+        if self.checkpoints.enabled:
+            self._mark(name, 'validated', 'arrow', path=str(path), file_hash=file_hash(path), rows=rows)
+
+    def _cache_key(
+        self,
+        file: Path,
+        schema: Type,
+        reader: str,
+        profile: Optional[Dict] = None
+    ) -> Optional[Dict[str, str]]:
+        """
+        Monta a chave do cache de validação de um arquivo.
+
+        Args:
+            file (Path): Caminho do CSV.
+            schema (Type): Contrato de `schema.py` do arquivo.
+            reader (str): Leitor de CSV usado ('pandas-text' ou 'arrow').
+            profile (Optional[Dict]): Perfil de escrita, quando o parquet em cache é o enviado.
+
+        Returns:
+            Optional[Dict[str, str]]: Chave gerada por `_fingerprint`, ou None sem cache.
+        """
+        if not self.validation_cache:
+            return None
+
+        key = self._fingerprint(file, schema, reader)
+        if profile and _profile_id(profile):
+            key['write_profile'] = _profile_id(profile)
+
+        return key
+
+    def _get_cached(self, name: str, cache_key: Optional[Dict[str, str]]) -> Optional[Path]:
+        """
+        Retorna o parquet validado do cache, se o arquivo não mudou.
+
+        Args:
+            name (str): Nome do arquivo.
+            cache_key (Optional[Dict[str, str]]): Chave gerada por `_cache_key`.
+
+        Returns:
+            Optional[Path]: Caminho do parquet em cache, ou None.
+        """
+        if not cache_key:
+            return None
+
+        return self.validation_cache.get(name, cache_key)
+
+    def _put_cached(self, name: str, cache_key: Optional[Dict[str, str]], parquet_path: Path) -> None:
+        """
+        Salva o parquet validado no cache.
+
+        Args:
+            name (str): Nome do arquivo.
+            cache_key (Optional[Dict[str, str]]): Chave gerada por `_cache_key`.
+            parquet_path (Path): Parquet validado.
+        """
+        if cache_key:
+            self.validation_cache.put(name, cache_key, parquet_path)
+
     def _rename_file(self) -> str:
         """
         Renomeia o nome do arquivo para ter o timezone.
@@ -165,4 +985,167 @@ class DataSource:
         """
         date_time = datetime.now().isoformat()
         match = date_time.split('.')[0]
-        return f'{match}.parquet'
\ No newline at end of file
+        return f'{match}.parquet'
+
+
+def _normalize_columns(columns: List[str]) -> List[str]:
+    """
+    Padroniza o nome das colunas (ex: 'Base Encounter-Cost' -> 'base_encounter_cost').
+
+    Args:
+        columns (List[str]): Nome original das colunas.
+
+    Returns:
+        List[str]: Nome das colunas padronizado.
+    """
+    return [
+        column.strip().lower().replace(' ', '_').replace('-', '_')
+        for column in columns
+    ]
+
+
+def _csv_options(file: Path, block_size: int, schema: Optional[Type] = None) -> Dict:
+    """
+    Monta as opções do leitor de CSV do pyarrow: colunas padronizadas e lidas como texto.
+
+    Com o contrato, as colunas categóricas já são lidas como dicionário.
+
+    Args:
+        file (Path): Caminho do CSV.
+        block_size (int): Tamanho em bytes de cada bloco lido.
+        schema (Optional[Type]): Contrato de `schema.py` do arquivo.
+
+    Returns:
+        Dict: Argumentos 'read_options' e 'convert_options' para `read_csv`/`open_csv`.
+    """
+    with open(file, encoding='utf-8-sig', newline='') as csv_file:
+        header = next(csv.reader(csv_file))
+
+    columns = _normalize_columns(header)
+    category_columns = get_category_columns(schema) if schema else []
+
+    return {
+        'read_options': pa_csv.ReadOptions(column_names=columns, skip_rows=1, block_size=block_size),
+        'convert_options': pa_csv.ConvertOptions(
+            column_types={
+                column: CATEGORY_TYPE if column in category_columns else pa.string()
+                for column in columns
+            },
+            null_values=CSV_NULL_VALUES,
+            strings_can_be_null=True
+        )
+    }
+
+
+def _read_csv_as_text(file: Path) -> pd.DataFrame:
+    """
+    Lê um CSV inteiro com o pandas, com as colunas padronizadas e lidas como texto.
+
+    Lê os mesmos valores nulos do leitor do pyarrow (`_csv_options`), sem inferir
+    tipos: um CEP como '02186' continua '02186' (e não 2186.0) e os números são
+    convertidos pelo contrato a partir do texto original.
+
+    Args:
+        file (Path): Caminho do CSV.
+
+    Returns:
+        pd.DataFrame: Dados do CSV, com todas as colunas como texto.
+    """
+    df = pd.read_csv(file, dtype=str, keep_default_na=False, na_values=CSV_NULL_VALUES)
+    df.columns = _normalize_columns(df.columns)
+    return df
+
+
+def _profile_id(profile: Dict) -> Optional[str]:
+    """
+    Identifica um perfil de escrita nos hashes e no cache, vazio para o padrão.
+
+    O perfil padrão não entra na identificação, para que os hashes já registrados
+    continuem valendo.
+
+    Args:
+        profile (Dict): Perfil de `WriteProfiles.get`.
+
+    Returns:
+        Optional[str]: 'perfil:linhas por row group', ou None para o perfil padrão.
+    """
+    default = WRITE_PROFILES['default']
+    if all(profile[key] == value for key, value in default.items()):
+        return None
+
+    return f"{profile['name']}:{profile['row_group_size']}"
+
+
+def _csv_to_parquet(
+    file: Path,
+    output_path: Path,
+    schema: Type,
+    block_size: int,
+    backend: str = 'pandera',
+    profile: Optional[Dict] = None
+) -> int:
+    """
+    Lê um CSV em blocos com o leitor do pyarrow, valida cada bloco e grava em parquet.
+
+    Todas as colunas são lidas como texto e convertidas pelo contrato e o parquet
+    é gravado com os tipos compactos do contrato (categóricas como dicionário).
+    Colunas `unique=True` são conferidas entre todos os blocos depois da escrita
+    (ver `_check_unique_columns`), sem guardar os valores durante a leitura.
+
+    Args:
+        file (Path): Caminho do CSV.
+        output_path (Path): Caminho do parquet a ser gerado.
+        schema (Type): Contrato de `schema.py` do arquivo.
+        block_size (int): Tamanho em bytes de cada bloco lido.
+        backend (str): Backend de validação ('pandera' ou 'arrow').
+        profile (Optional[Dict]): Perfil de escrita (padrão: 'default'). Cada bloco lido
+            vira ao menos um row group, então o row group fica limitado por `block_size`.
+
+    Returns:
+        int: Quantidade de registros gravados.
+    """
+    arrow_schema = get_arrow_schema(schema)
+
+    reader = pa_csv.open_csv(file, **_csv_options(file, block_size, schema))
+
+    total_records = 0
+    profile = profile or WRITE_PROFILES['default']
+
+    with open_parquet_writer(output_path, get_compact_arrow_schema(schema), profile) as writer:
+        for batch in reader:
+            if backend == 'arrow':
+                table = validate_table(pa.Table.from_batches([batch]), schema)
+            else:
+                df_validated = schema.validate(batch.to_pandas())
+                table = pa.Table.from_pandas(df_validated, schema=arrow_schema, preserve_index=False)
+
+            table = apply_arrow_plan(table, schema)
+
+            writer.write_table(table, row_group_size=profile['row_group_size'])
+            total_records += table.num_rows
+
+    _check_unique_columns(output_path, get_unique_columns(schema), file)
+    return total_records
+
+
+def _check_unique_columns(output_path: Path, columns: List[str], file: Path) -> None:
+    """
+    Confere se as colunas únicas não têm valores repetidos no parquet gerado.
+
+    Cada coluna é lida sozinha do parquet, então a memória usada é a de uma coluna
+    em Arrow, e não um `set` do Python com os valores de todos os blocos. Se houver
+    valores repetidos, o parquet é apagado.
+
+    Args:
+        output_path (Path): Caminho do parquet gerado.
+        columns (List[str]): Colunas `unique=True` do contrato.
+        file (Path): CSV de origem, para a mensagem de erro.
+    """
+    for column in columns:
+        values = pq.read_table(output_path, columns=[column], memory_map=True).column(column)
+        if pa.types.is_dictionary(values.type):
+            values = values.cast(values.type.value_type)
+
+        if pc.count_distinct(values, mode='all').as_py() != len(values):
+            Path(output_path).unlink(missing_ok=True)
+            raise ValueError(f'Valores duplicados na coluna única "{column}" de {Path(file).name}')
@@ -0,0 +1,183 @@
+import os
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from dotenv import load_dotenv
+from typing import Dict, Optional, Any, BinaryIO
+
+WRITE_PROFILES = {
+    'default': {
+        'compression': 'snappy',
+        'compression_level': None,
+        'use_dictionary': True,
+        'write_statistics': True,
+        'write_page_index': False,
+        'data_page_size': None,
+        'row_group_size': 128 * 1024
+    },
+    'fast-write': {
+        'compression': 'lz4',
+        'compression_level': None,
+        'use_dictionary': 'categorical',
+        'write_statistics': False,
+        'write_page_index': False,
+        'data_page_size': None,
+        'row_group_size': 1024 * 1024
+    },
+    'small-size': {
+        'compression': 'zstd',
+        'compression_level': 9,
+        'use_dictionary': True,
+        'write_statistics': True,
+        'write_page_index': False,
+        'data_page_size': None,
+        'row_group_size': 1024 * 1024
+    },
+    'fast-scan': {
+        'compression': 'lz4',
+        'compression_level': None,
+        'use_dictionary': True,
+        'write_statistics': True,
+        'write_page_index': True,
+        'data_page_size': 256 * 1024,
+        'row_group_size': 64 * 1024
+    }
+}
+
+
+def parse_dataset_profiles(value: Optional[str]) -> Dict[str, str]:
+    """
+    Lê os perfis por arquivo no formato 'arquivo=perfil', separados por vírgula.
+
+    Exemplo:
+        'encounters=small-size,patients=fast-scan' -> {'encounters': 'small-size', 'patients': 'fast-scan'}
+
+    Args:
+        value (Optional[str]): Texto com os perfis (ex: `PARQUET_DATASET_PROFILES`).
+
+    Returns:
+        Dict[str, str]: Perfil de cada arquivo.
+    """
+    profiles = {}
+    for item in (value or '').split(','):
+        if not item.strip():
+            continue
+
+        dataset, _, profile = item.partition('=')
+        if not profile:
+            raise ValueError(f'Perfil de parquet inválido: {item}')
+
+        profiles[dataset.strip()] = profile.strip()
+
+    return profiles
+
+
+class WriteProfiles:
+    """
+    Escolhe as configurações de escrita do parquet de cada arquivo.
+
+    - 'default': snappy, dicionário em todas as colunas, row groups de 128 mil linhas.
+    - 'fast-write': lz4, dicionário só nas categóricas, sem estatísticas.
+    - 'small-size': zstd nível 9, row groups de 1 milhão de linhas.
+    - 'fast-scan': lz4, estatísticas e page index, row groups e páginas menores
+      para filtrar o máximo possível antes de descomprimir.
+
+    O perfil padrão vem de `PARQUET_PROFILE` e cada arquivo pode usar outro em
+    `PARQUET_DATASET_PROFILES` (ex: 'encounters=small-size'). `PARQUET_ROW_GROUP_SIZE`,
+    se definido, substitui o tamanho do row group de todos os perfis.
+    `python -m src.benchmarks.parquet_profiles` compara os perfis com os dados reais.
+    """
+
+    def __init__(
+        self,
+        default: Optional[str] = None,
+        dataset_profiles: Optional[Dict[str, str]] = None,
+        row_group_size: Optional[int] = None
+    ):
+        load_dotenv()
+
+        self.default = default or os.getenv('PARQUET_PROFILE', 'default')
+        if dataset_profiles is None:
+            dataset_profiles = parse_dataset_profiles(os.getenv('PARQUET_DATASET_PROFILES'))
+        self.dataset_profiles = dataset_profiles
+
+        row_group_size = row_group_size or os.getenv('PARQUET_ROW_GROUP_SIZE')
+        self.row_group_size = int(row_group_size) if row_group_size else None
+
+        for name in [self.default, *self.dataset_profiles.values()]:
+            if name not in WRITE_PROFILES:
+                raise ValueError(f'Perfil de parquet inválido: {name}')
+
+    def get(self, dataset: str) -> Dict[str, Any]:
+        """
+        Retorna o perfil de escrita de um arquivo.
+
+        Args:
+            dataset (str): Nome do arquivo (ex: 'encounters').
+
+        Returns:
+            Dict[str, Any]: Configurações do perfil, com o nome em 'name'.
+        """
+        name = self.dataset_profiles.get(dataset, self.default)
+
+        profile = {**WRITE_PROFILES[name], 'name': name}
+        if self.row_group_size:
+            profile['row_group_size'] = self.row_group_size
+
+        return profile
+
+
+def open_parquet_writer(sink: Any, schema: pa.Schema, profile: Dict[str, Any]) -> pq.ParquetWriter:
+    """
+    Abre um `pq.ParquetWriter` com as configurações de um perfil.
+
+    O tamanho do row group não é do writer: cada `write_table` deve receber
+    `row_group_size=profile['row_group_size']`.
+
+    Args:
+        sink (Any): Caminho ou arquivo aberto para escrita.
+        schema (pa.Schema): Schema do parquet.
+        profile (Dict[str, Any]): Perfil de `WriteProfiles.get` ou de `WRITE_PROFILES`.
+
+    Returns:
+        pq.ParquetWriter: Writer a ser usado com `with`.
+    """
+    use_dictionary = profile['use_dictionary']
+    if use_dictionary == 'categorical':
+        use_dictionary = [field.name for field in schema if pa.types.is_dictionary(field.type)]
+
+    options = {
+        'compression': profile['compression'],
+        'compression_level': profile['compression_level'],
+        'use_dictionary': use_dictionary,
+        'write_statistics': profile['write_statistics'],
+        'write_page_index': profile['write_page_index']
+    }
+    if profile['data_page_size']:
+        options['data_page_size'] = profile['data_page_size']
+
+    return pq.ParquetWriter(sink, schema, **options)
+
+
+def write_dataframe(df: pd.DataFrame, sink: BinaryIO, profile: Dict[str, Any]) -> None:
+    """
+    Escreve um DataFrame em parquet, convertendo para Arrow um row group por vez.
+
+    Equivale a `df.to_parquet(sink, index=False)` com as configurações do perfil,
+    mas sem a cópia Arrow do DataFrame inteiro: só o pedaço atual fica convertido
+    em memória. O schema vem do DataFrame inteiro, então uma coluna vazia no
+    primeiro pedaço (ex: 'deathdate') não vira tipo `null`.
+
+    Args:
+        df (pd.DataFrame): Dados validados.
+        sink (BinaryIO): Arquivo aberto para escrita (ex: `open_writer`).
+        profile (Dict[str, Any]): Perfil de escrita.
+    """
+    row_group_size = profile['row_group_size']
+    schema = pa.Schema.from_pandas(df, preserve_index=False)
+
+    with open_parquet_writer(sink, schema, profile) as writer:
+        for start in range(0, max(len(df), 1), row_group_size):
+            chunk = df.iloc[start:start + row_group_size]
+            writer.write_table(pa.Table.from_pandas(chunk, schema=schema, preserve_index=False))
@@ -0,0 +1,68 @@
+import os
+import json
+import logging
+
+from typing import Dict, Optional, Any
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class UploadLedger:
+    """
+    Registro local do último upload de cada arquivo para a Azure.
+
+    Guarda o hash do conteúdo, o nome do blob e o tamanho enviado, para que
+    arquivos sem alterações não sejam enviados de novo.
+    """
+
+    def __init__(self, ledger_path: str):
+        self.ledger_path = Path(ledger_path)
+
+    def get(self, name: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna o último upload registrado de um arquivo.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+
+        Returns:
+            Optional[Dict[str, Any]]: Registro com 'content_hash', 'blob_name', 'size' e 'uploaded_at', ou None.
+        """
+        return self._read().get(name)
+
+    def put(self, name: str, entry: Dict[str, Any]) -> None:
+        """
+        Registra o upload de um arquivo, substituindo o registro anterior.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+            entry (Dict[str, Any]): Registro com 'content_hash', 'blob_name', 'size' e 'uploaded_at'.
+        """
+        ledger = self._read()
+        ledger[name] = entry
+
+        self.ledger_path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = self.ledger_path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(ledger, f, indent=2)
+        os.replace(temp_path, self.ledger_path)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Lê o registro do disco.
+
+        Returns:
+            Dict[str, Dict[str, Any]]: Registro completo, vazio se o arquivo não existir ou estiver inválido.
+        """
+        if not self.ledger_path.exists():
+            return {}
+
+        try:
+            with open(self.ledger_path, 'r') as f:
+                return json.load(f)
+
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f'Registro de uploads inválido, ignorando: {str(e)}')
+            return {}
@@ -1,28 +1,34 @@
 import os
+import io
+import time
 import logging
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
 
-from typing import Dict, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
-from sqlalchemy import create_engine
+from psycopg2 import sql
+from pyarrow import csv as pa_csv
+from sqlalchemy import create_engine, Table, DateTime, Float, String
 from sqlalchemy.orm import sessionmaker
 
+from src.metrics.run_metrics import RunMetrics
+from src.recovery.retry import RetryPolicy
 from src.database.db_model import (
     Base,
     EncountersModel,
     OrganizationsModel,
     PatientsModel,
     PayersModel,
-    ProceduresModel
+    ProceduresModel,
+    PipelineStateModel
 )
 
 logger = logging.getLogger(__name__)
 
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s | %(name)s | %(levelname)s | %(message)s'
-)
-
 class DataBase:
     """Responsável por fazer as conexões e as funções com o Banco de Dados."""
 
@@ -34,14 +40,16 @@ class DataBase:
         self.db_host = os.getenv('DB_HOST')
         self.db_port = os.getenv('DB_PORT')
         self.db_name = os.getenv('DB_NAME')
+        self.pool_size = 10
+        self.max_overflow = 20
 
         try:
             self.engine = create_engine(
                 f'postgresql://{self.db_user}:{self.db_pass}@{self.db_host}:{self.db_port}/{self.db_name}',
                 echo=False,
                 pool_pre_ping=True,
-                pool_size=10,
-                max_overflow=20
+                pool_size=self.pool_size,
+                max_overflow=self.max_overflow
             )
 
             self._Session = sessionmaker(bind=self.engine, autocommit=False, autoflush=False)
@@ -59,6 +67,24 @@ class DataBase:
             'procedures': 'raw_procedures'
         }
 
+        self.MODEL_MAPPING = {
+            'encounters': EncountersModel,
+            'organizations': OrganizationsModel,
+            'patients': PatientsModel,
+            'payers': PayersModel,
+            'procedures': ProceduresModel
+        }
+
+        self.BUSINESS_KEYS = {
+            'procedures': [
+                column.strip()
+                for column in os.getenv('PROCEDURES_BUSINESS_KEY', 'start,patient,encounter,code').split(',')
+            ]
+        }
+
+        self.max_workers = int(os.getenv('DB_MAX_WORKERS', 5))
+        self.metrics = RunMetrics('database', enabled=False)
+
     def create_tables(self) -> None:
         """Cria as tabelas no Banco de Dados."""
         logger.info('Criando as Tabelas no Banco de Dados...')
@@ -72,17 +98,56 @@ class DataBase:
             raise
 
     def drop_tables(self) -> None:
-        """Deleta todas as tabelas no Banco de Dados."""
+        """
+        Deleta todas as tabelas de dados no Banco de Dados.
+
+        A tabela `pipeline_state` é mantida: quem recarrega os dados atualiza ou
+        apaga o estado de cada arquivo (ver `clear_pipeline_state`).
+        """
         logger.warning('AVISO: Deletando TODAS as Tabelas...')
 
         try:
-            self.Base.metadata.drop_all(self.engine)
+            tables = [
+                table for table in self.Base.metadata.sorted_tables
+                if table.name != PipelineStateModel.__tablename__
+            ]
+            self.Base.metadata.drop_all(self.engine, tables=tables)
             logger.info('Tabelas deletadas com sucesso.')
 
         except Exception as e:
             logger.error(f'Erro ao deletar as tabelas: {str(e)}')
             raise
 
+    def truncate_tables(self, names: List[str]) -> None:
+        """
+        Apaga os registros das tabelas de alguns arquivos, sem recriar as tabelas.
+
+        Args:
+            names (List[str]): Nomes dos arquivos (ex: ['encounters', 'procedures']).
+        """
+        tables = [self._get_table(name) for name in names if name in self.ORM_MAPPING]
+        if not tables:
+            return
+
+        logger.warning(f'Apagando os registros de: {[table.name for table in tables]}')
+
+        connection = self.engine.raw_connection()
+
+        try:
+            with connection.cursor() as cursor:
+                cursor.execute(sql.SQL('TRUNCATE {}').format(
+                    sql.SQL(', ').join(sql.Identifier(table.name) for table in tables)
+                ))
+            connection.commit()
+
+        except Exception as e:
+            logger.error(f'Erro ao apagar os registros: {str(e)}')
+            connection.rollback()
+            raise
+
+        finally:
+            connection.close()
+
     def insert_data(self, df_dict: Dict[str, pd.DataFrame], batch_size: Optional[int] = 5_000) -> None:
         """
         Insere os registros no Banco de Dados.
@@ -104,16 +169,21 @@ class DataBase:
 
         try:
             for name, df in df_dict.items():
-                model = self.ORM_MAPPING.get(name)
-                records = df.to_dict(orient='records')
-                total_records = len(records)
-
-                for i in range(0, total_records, batch_size):
-                    batch = records[i:i + batch_size]
-                    session.bulk_insert_mappings(model, batch)
-
-                    records_inserted = min(i + batch_size, total_records)
-                    logger.info(f'{records_inserted}/{total_records} arquivos inseridos.')
+                with self.metrics.stage('load', dataset=name, rows=len(df)):
+                    model = self.MODEL_MAPPING.get(name)
+                    with self.metrics.stage('to_records', dataset=name, rows=len(df)):
+                        records = self._to_records(df)
+                    total_records = len(records)
+
+                    with self.metrics.stage('bulk_insert', dataset=name, rows=total_records):
+                        for i in range(0, total_records, batch_size):
+                            batch_start = time.perf_counter()
+                            batch = records[i:i + batch_size]
+                            session.bulk_insert_mappings(model, batch)
+                            self.metrics.record_batch('insert', name, len(batch), time.perf_counter() - batch_start)
+
+                            records_inserted = min(i + batch_size, total_records)
+                            logger.info(f'{records_inserted}/{total_records} arquivos inseridos.')
 
                 logger.info(f'{total_records} inseridos para: {name}')
 
@@ -149,13 +219,15 @@ class DataBase:
 
         try:
             for name, df in df_dict.items():
-                model = self.ORM_MAPPING.get(name)
-                records = df.to_dict(orient='records')
+                model = self.MODEL_MAPPING.get(name)
+                records = self._to_records(df)
                 total_records = len(records)
 
                 for i in range(0, total_records, batch_size):
+                    batch_start = time.perf_counter()
                     batch = records[i:i + batch_size]
                     session.bulk_update_mappings(model, batch)
+                    self.metrics.record_batch('update', name, len(batch), time.perf_counter() - batch_start)
 
                     records_inserted = min(i + batch_size, total_records)
                     logger.info(f'{records_inserted}/{total_records} registros atualizados.')
@@ -173,119 +245,130 @@ class DataBase:
         finally:
             session.close()
 
-    def upsert_data(self, df_dict: Dict[str, pd.DataFrame], batch_size: Optional[int] = 5_000) -> None:
+    def upsert_data(self, df_dict: Dict[str, Union[pd.DataFrame, pa.Table]], batch_size: Optional[int] = 100_000) -> None:
         """
         Atualiza ou faz o Insert dos registros no Banco de Dados.
-        
+
+        Cada tabela é carregada via COPY em uma tabela temporária de staging e depois
+        aplicada com um único `INSERT ... ON CONFLICT (id) DO UPDATE`. O `updated_at`
+        só muda nas linhas em que algum valor foi realmente alterado. Tabelas sem a
+        chave primária nos dados, mas com chave de negócio (ex: 'procedures'), só
+        recebem os registros novos, como em `incremental_load`. Chaves primárias
+        repetidas nos dados fazem a carga falhar, como na carga completa.
+
         Args:
-            df_dict (Dict[str, DataFrame]): Arquivo com 'nome_do_arquivo': pd.DataFrame.
-            batch_size (Optional[int]): Quantidade de registros para o Batch de Dados.
+            df_dict (Dict[str, DataFrame | pa.Table]): Arquivo com 'nome_do_arquivo': pd.DataFrame ou pa.Table.
+            batch_size (Optional[int]): Quantidade de registros por bloco do COPY na staging.
 
         Returns:
             None: Mensagem de sucesso, se erro, mensagem de erro.
         """
         logger.info('Iniciando Upsert de Dados...')
 
-        if not df_dict or df_dict is None:
+        if not df_dict:
             logger.warning('Upsert Cancelado. Nenhum registro foi passado.')
             return
 
-        session = self._Session()
+        connection = self.engine.raw_connection()
 
         try:
-            for name, df in df_dict.items():
-                model = self.ORM_MAPPING.get(name)
-                pk_column = 'id'
-                records = df.to_dict(orient='records')
-
-                existing_ids = set(
-                    row[0] for row in session.query(getattr(model, pk_column)).all()
-                )
-
-                existing = []
-                new_records = []
-
-                for record in records:
-                    pk_value = record.get(pk_column)
-                    if pk_value not in existing_ids:
-                        new_records.append(record)
-                    else:
-                        existing.append(record)
-
-                    if existing:
-                        for i in range(0, len(existing), batch_size):
-                            batch = existing[i:i + batch_size]
-                            session.bulk_update_mappings(model, batch)
-                        logger.info(f'{len(existing)} registros atualizados em: {name}')
-
-                    if new_records:
-                        for i in range(0, len(new_records), batch_size):
-                            batch = new_records[i:i + batch_size]
-                            session.bulk_insert_mappings(model, batch_size)
-                        logger.info(f'{len(new_records)} registros salvos em: {name}')
-
-                logger.info('Upsert concluído')
-                session.commit()
+            with connection.cursor() as cursor:
+                for name, data in df_dict.items():
+                    with self.metrics.stage('load', dataset=name, rows=len(data)):
+                        table = self._get_table(name)
+                        arrow_table = self._prepare_copy_table(table, data)
+                        key_columns = [column.name for column in table.primary_key]
+
+                        missing = [column for column in key_columns if column not in arrow_table.column_names]
+                        if missing and name in self.BUSINESS_KEYS:
+                            key_columns = self._get_key_columns(name, table, arrow_table.column_names)
+                            inserted = self._insert_new_rows(
+                                cursor, table, arrow_table, key_columns, batch_size, unique_keys=False
+                            )
+                            logger.info(f'{inserted} registros novos salvos em: {name} (sem chave primária, apenas inserção)')
+                            continue
+
+                        if missing:
+                            raise ValueError(f'Chave {missing} não encontrada nos dados de: {name}')
+
+                        stage_name = self._create_stage_table(cursor, table, arrow_table.column_names)
+                        self._copy_arrow(cursor, stage_name, arrow_table, batch_size)
+                        self._check_duplicate_keys(cursor, table.name, stage_name, key_columns)
+
+                        upsert_sql = self._build_upsert_sql(table, stage_name, arrow_table.column_names, key_columns)
+                        cursor.execute(upsert_sql)
+                        inserted, updated = cursor.fetchone()
+
+                        cursor.execute(sql.SQL('DROP TABLE {stage}').format(stage=sql.Identifier(stage_name)))
+                        logger.info(f'{inserted} registros salvos e {updated} registros atualizados em: {name}')
+
+            connection.commit()
+            logger.info('Upsert concluído')
 
         except Exception as e:
             logger.error(f'Erro ao fazer o upsert de dados: {str(e)}')
-            session.rollback()
+            connection.rollback()
             raise
 
         finally:
-            session.close()
+            connection.close()
 
-    def incremental_load(self, df_dict: Dict[str, pd.DataFrame], batch_size: Optional[int] = 5_000) -> None:
+    def incremental_load(self, df_dict: Dict[str, Union[pd.DataFrame, pa.Table]], batch_size: Optional[int] = 100_000) -> None:
         """
         Insere apenas registros novos no Banco de Dados.
-        
+
+        Cada tabela é carregada via COPY em uma tabela temporária de staging e os
+        registros cuja chave ainda não existe no destino são inseridos com um único
+        `INSERT ... SELECT ... WHERE NOT EXISTS`, sem trazer as chaves existentes
+        para o Python. A chave é a chave primária ou, para tabelas sem chave natural
+        nos dados (ex: 'procedures'), a chave de negócio de `BUSINESS_KEYS`.
+
+        Assim como na carga completa, registros repetidos com chave de negócio são
+        todos inseridos, e chaves primárias repetidas fazem a carga falhar.
+
         Args:
-            df_dict (Dict[str, DataFrame]): Arquivo com 'nome_do_arquivo': pd.DataFrame.
-            batch_size (Optional[int]): Quantidade de registros para o Batch de Dados.
+            df_dict (Dict[str, DataFrame | pa.Table]): Arquivo com 'nome_do_arquivo': pd.DataFrame ou pa.Table.
+            batch_size (Optional[int]): Quantidade de registros por bloco do COPY na staging.
 
         Returns:
             None: Mensagem de sucesso, se erro, mensagem de erro.
         """
         logger.info('Iniciando atualização incremental...')
 
-        if not df_dict or df_dict is None:
+        if not df_dict:
             logger.warning('Atualização incremental cancelada. Nenhum dado foi passado.')
+            return
 
-        session = self._Session()
+        connection = self.engine.raw_connection()
 
         try:
-            for name, df in df_dict.items():
-                model = self.ORM_MAPPING.get(name)
-                pk_column = 'id'
-                records = df.to_dict(orient='records')
-                existing_ids = set(
-                    row[0] for row in session.query(getattr(model, pk_column)).all()
-                )
-
-                new_records = [record for record in records if record.get(pk_column) not in existing_ids]
-                
-                if new_records:
-                    for i in range(0, len(new_records), batch_size):
-                        batch = new_records[i:i + batch_size]
-                        session.bulk_insert_mappings(model, batch)
-
-                        records_inserted = min(i + batch_size, len(new_records))
-                        logger.info(f'{records_inserted}/{len(new_records)} registros adicionados...')
-
-                    logger.info(f'{len(new_records)} registros inseridos para: {name}')
-                else:
-                    logger.info(f'Nenhum novo registro para: {name}')
+            with connection.cursor() as cursor:
+                for name, data in df_dict.items():
+                    with self.metrics.stage('load', dataset=name, rows=len(data)):
+                        table = self._get_table(name)
+                        arrow_table = self._prepare_copy_table(table, data)
+                        key_columns = self._get_key_columns(name, table, arrow_table.column_names)
+
+                        inserted = self._insert_new_rows(
+                            cursor, table, arrow_table, key_columns, batch_size,
+                            unique_keys=name not in self.BUSINESS_KEYS
+                        )
+
+                    if inserted:
+                        logger.info(f'{inserted} registros inseridos para: {name}')
+                    else:
+                        logger.info(f'Nenhum novo registro para: {name}')
 
+            connection.commit()
             logger.info('Atualização incremental concluída.')
-            session.commit()
 
         except Exception as e:
             logger.error(f'Erro ao fazer a atualizção incremental: {str(e)}')
-            session.rollback()
+            connection.rollback()
             raise
 
         finally:
-            session.close()
+            connection.close()
 
     def insert_data_with_pandas(self, df_dict: Dict[str, pd.DataFrame]) -> None:
         logger.info('Inserindo Dados...')
@@ -297,11 +380,582 @@ class DataBase:
         try:
             for name, df in df_dict.items():
                 table_name = self.ORM_MAPPING.get(name)
-                df.to_sql(table_name, self.engine, if_exists='replace')
+                with self.metrics.stage('load', dataset=name, rows=len(df)):
+                    df.to_sql(table_name, self.engine, if_exists='replace')
                 logger.info(f'{len(df):.2f} linhas inseridas em {table_name}')
 
             logger.info(f'{len(df_dict)} Tabelas modificadas.')
 
         except Exception as e:
             logger.error(f'Erro ao inserir dados: {str(e)}')
-            raise
\ No newline at end of file
+            raise
+
+    def insert_data_with_copy(self, df_dict: Dict[str, Union[pd.DataFrame, pa.Table]], chunk_size: Optional[int] = 100_000) -> None:
+        """
+        Insere os registros no Banco de Dados usando o `COPY ... FROM STDIN` do PostgreSQL.
+
+        Os dados são convertidos para Arrow e enviados em blocos de CSV, sem criar
+        um dicionário Python por linha.
+
+        Args:
+            df_dict (Dict[str, DataFrame | pa.Table]): Arquivo com 'nome_do_arquivo': pd.DataFrame ou pa.Table.
+            chunk_size (Optional[int]): Quantidade de registros enviados em cada bloco do COPY.
+
+        Returns:
+            None: Mensagem de sucesso, se erro, mensagem de erro.
+        """
+        logger.info('Iniciando Inserção de Dados via COPY...')
+
+        if not df_dict:
+            logger.warning('Inserção cancelada. Nenhum dado foi passado.')
+            return
+
+        connection = self.engine.raw_connection()
+
+        try:
+            with connection.cursor() as cursor:
+                for name, data in df_dict.items():
+                    self._copy_table(cursor, name, data, chunk_size)
+
+            connection.commit()
+            logger.info('Inserção via COPY concluída com sucesso.')
+
+        except Exception as e:
+            logger.error(f'Erro ao inserir dados via COPY: {str(e)}')
+            connection.rollback()
+            raise
+
+        finally:
+            connection.close()
+
+    def get_table_columns(self, name: str) -> List[str]:
+        """
+        Retorna as colunas da tabela de um arquivo, como definidas em `db_model.py`.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+
+        Returns:
+            List[str]: Nome das colunas da tabela.
+        """
+        return list(self._get_table(name).columns.keys())
+
+    def get_pipeline_state(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retorna o último snapshot carregado de cada arquivo.
+
+        Returns:
+            Dict(str, Dict): Dicionário com {'nome do arquivo': {'blob_name', 'snapshot', 'row_count'}}.
+        """
+        session = self._Session()
+
+        try:
+            return {
+                state.dataset: {
+                    'blob_name': state.blob_name,
+                    'snapshot': state.snapshot,
+                    'row_count': state.row_count
+                }
+                for state in session.query(PipelineStateModel).all()
+            }
+
+        except Exception as e:
+            logger.error(f'Erro ao buscar o estado da pipeline: {str(e)}')
+            raise
+
+        finally:
+            session.close()
+
+    def clear_pipeline_state(self, datasets: Optional[List[str]] = None) -> None:
+        """
+        Apaga o último snapshot carregado de alguns arquivos (ou de todos).
+
+        Usado quando as tabelas são recriadas ou esvaziadas, para que a carga
+        incremental não considere carregado um snapshot que não está mais no Banco.
+
+        Args:
+            datasets (Optional[List[str]]): Nomes dos arquivos (padrão: todos).
+        """
+        session = self._Session()
+
+        try:
+            query = session.query(PipelineStateModel)
+            if datasets is not None:
+                query = query.filter(PipelineStateModel.dataset.in_(datasets))
+
+            deleted = query.delete(synchronize_session=False)
+            session.commit()
+            logger.info(f'Estado apagado para {deleted} arquivos.')
+
+        except Exception as e:
+            logger.error(f'Erro ao apagar o estado da pipeline: {str(e)}')
+            session.rollback()
+            raise
+
+        finally:
+            session.close()
+
+    def update_pipeline_state(self, dataset: str, blob_name: str, snapshot: datetime, row_count: int) -> None:
+        """
+        Registra o último snapshot carregado de um arquivo.
+
+        Args:
+            dataset (str): Nome do arquivo (ex: 'encounters').
+            blob_name (str): Nome do blob carregado.
+            snapshot (datetime): Data e hora do snapshot.
+            row_count (int): Quantidade de linhas do snapshot.
+
+        Returns:
+            None: Mensagem de sucesso, se erro, mensagem de erro.
+        """
+        session = self._Session()
+
+        try:
+            session.merge(PipelineStateModel(
+                dataset=dataset,
+                blob_name=blob_name,
+                snapshot=snapshot,
+                row_count=row_count
+            ))
+            session.commit()
+            logger.info(f'Estado atualizado para {dataset}: {blob_name}')
+
+        except Exception as e:
+            logger.error(f'Erro ao atualizar o estado da pipeline: {str(e)}')
+            session.rollback()
+            raise
+
+        finally:
+            session.close()
+
+    def insert_data_parallel(
+        self,
+        df_dict: Dict[str, Union[pd.DataFrame, pa.Table]],
+        method: str = 'copy',
+        max_workers: Optional[int] = None,
+        retry: Optional[RetryPolicy] = None,
+        on_loaded: Optional[Callable[[str], None]] = None
+    ) -> None:
+        """
+        Carrega as tabelas ao mesmo tempo, cada uma em uma conexão do pool e na sua própria transação.
+
+        As tabelas maiores são enviadas primeiro, para que o tempo total fique próximo
+        ao tempo da maior tabela. Os erros de todas as tabelas são reunidos em um
+        único `ExceptionGroup` ao final, sem interromper as demais cargas.
+
+        Com `retry`, cada tabela tem as próprias tentativas: como a transação de uma
+        tabela que falhou é desfeita, só ela é carregada de novo, e as tabelas já
+        gravadas nunca são repetidas.
+
+        Args:
+            df_dict (Dict[str, DataFrame | pa.Table]): Arquivo com 'nome_do_arquivo': pd.DataFrame ou pa.Table.
+            method (str): Forma de carga de cada tabela ('copy', 'orm', 'pandas', 'upsert' ou 'incremental').
+            max_workers (Optional[int]): Quantidade de tabelas carregadas ao mesmo tempo (padrão: `DB_MAX_WORKERS`).
+            retry (Optional[RetryPolicy]): Novas tentativas de cada tabela em caso de erro temporário.
+            on_loaded (Optional[Callable]): Chamada com o nome de cada tabela assim que ela é gravada.
+
+        Returns:
+            None: Mensagem de sucesso, se erro, mensagem de erro.
+        """
+        logger.info('Iniciando Carga Paralela de Dados...')
+
+        if not df_dict:
+            logger.warning('Carga paralela cancelada. Nenhum dado foi passado.')
+            return
+
+        load_function = self._get_load_function(method)
+        workers = max_workers or self.max_workers
+        workers = max(1, min(workers, len(df_dict), self.pool_size + self.max_overflow))
+
+        tables = sorted(df_dict.items(), key=lambda item: len(item[1]), reverse=True)
+
+        def load(name: str, data: Union[pd.DataFrame, pa.Table]) -> None:
+            if retry:
+                retry.call(f'carga de {name}', load_function, {name: data})
+            else:
+                load_function({name: data})
+
+        errors = []
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix='db-load') as executor:
+            futures = {
+                executor.submit(load, name, data): name
+                for name, data in tables
+            }
+
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    future.result()
+                    logger.info(f'Carga concluída para: {name}')
+
+                    if on_loaded:
+                        on_loaded(name)
+
+                except Exception as e:
+                    logger.error(f'Erro na carga de {name}: {str(e)}')
+                    e.add_note(f'Tabela: {name}')
+                    errors.append(e)
+
+        if errors:
+            raise ExceptionGroup(f'{len(errors)}/{len(df_dict)} tabelas falharam na carga paralela', errors)
+
+        logger.info(f'{len(df_dict)} tabelas carregadas em paralelo com {workers} conexões.')
+
+    def _get_load_function(self, method: str) -> Callable[[Dict[str, Union[pd.DataFrame, pa.Table]]], None]:
+        """
+        Retorna a função de carga correspondente ao método.
+
+        Args:
+            method (str): Forma de carga ('copy', 'orm', 'pandas', 'upsert' ou 'incremental').
+
+        Returns:
+            Callable: Função que recebe um dicionário {'nome do arquivo': dados}.
+        """
+        load_functions = {
+            'copy': self.insert_data_with_copy,
+            'orm': self.insert_data,
+            'pandas': self.insert_data_with_pandas,
+            'upsert': self.upsert_data,
+            'incremental': self.incremental_load
+        }
+
+        load_function = load_functions.get(method)
+        if not load_function:
+            raise ValueError(f'Método de carga inválido: {method}')
+
+        return load_function
+
+    def _copy_table(self, cursor, name: str, data: Union[pd.DataFrame, pa.Table], chunk_size: int) -> int:
+        """
+        Envia um único DataFrame/Tabela Arrow para a sua tabela `raw_*` via COPY.
+
+        Args:
+            cursor: Cursor do psycopg2 aberto na transação atual.
+            name (str): Nome do arquivo (ex: 'encounters').
+            data (DataFrame | pa.Table): Dados a serem inseridos.
+            chunk_size (int): Quantidade de registros por bloco.
+
+        Returns:
+            int: Quantidade de registros inseridos.
+        """
+        with self.metrics.stage('load', dataset=name, rows=len(data)):
+            table = self._get_table(name)
+            arrow_table = self._prepare_copy_table(table, data)
+            total_records = self._copy_arrow(cursor, table.name, arrow_table, chunk_size)
+
+        logger.info(f'{total_records} inseridos para: {name}')
+        return total_records
+
+    def _copy_arrow(self, cursor, table_name: str, arrow_table: pa.Table, chunk_size: int) -> int:
+        """
+        Executa o `COPY ... FROM STDIN` de uma Tabela Arrow já preparada, em blocos.
+
+        Args:
+            cursor: Cursor do psycopg2 aberto na transação atual.
+            table_name (str): Nome da tabela de destino.
+            arrow_table (pa.Table): Dados já convertidos por `_prepare_copy_table`.
+            chunk_size (int): Quantidade de registros por bloco.
+
+        Returns:
+            int: Quantidade de registros copiados.
+        """
+        total_records = arrow_table.num_rows
+
+        copy_sql = sql.SQL('COPY {table} ({columns}) FROM STDIN WITH (FORMAT csv)').format(
+            table=sql.Identifier(table_name),
+            columns=sql.SQL(', ').join(sql.Identifier(column) for column in arrow_table.column_names)
+        ).as_string(cursor)
+
+        write_options = pa_csv.WriteOptions(include_header=False, quoting_style='needed')
+
+        records_inserted = 0
+        for batch in arrow_table.to_batches(max_chunksize=chunk_size):
+            batch_start = time.perf_counter()
+            buffer = io.BytesIO()
+            pa_csv.write_csv(batch, buffer, write_options=write_options)
+            buffer.seek(0)
+
+            cursor.copy_expert(copy_sql, buffer)
+            self.metrics.record_batch('copy', table_name, batch.num_rows, time.perf_counter() - batch_start)
+
+            records_inserted += batch.num_rows
+            logger.info(f'{records_inserted}/{total_records} registros copiados.')
+
+        return total_records
+
+    def _create_stage_table(self, cursor, table: Table, columns: List[str]) -> str:
+        """
+        Cria uma tabela temporária com as colunas carregadas, nos tipos da tabela de destino.
+
+        A staging não copia defaults nem restrições do destino: com o default da
+        chave (`nextval(...)`), cada registro carregado consumiria um valor da
+        sequence, mesmo os que nunca são inseridos.
+
+        Args:
+            cursor: Cursor do psycopg2 aberto na transação atual.
+            table (Table): Tabela de destino.
+            columns (List[str]): Colunas presentes nos dados.
+
+        Returns:
+            str: Nome da tabela de staging.
+        """
+        stage_name = f'stage_{table.name}'
+
+        cursor.execute(
+            sql.SQL(
+                'CREATE TEMP TABLE {stage} ON COMMIT DROP AS SELECT {columns} FROM {table} WITH NO DATA'
+            ).format(
+                stage=sql.Identifier(stage_name),
+                columns=self._join_identifiers(columns),
+                table=sql.Identifier(table.name)
+            )
+        )
+
+        return stage_name
+
+    def _check_duplicate_keys(self, cursor, table_name: str, stage_name: str, key_columns: List[str]) -> None:
+        """
+        Falha se a mesma chave aparece mais de uma vez na staging.
+
+        Args:
+            cursor: Cursor do psycopg2 aberto na transação atual.
+            table_name (str): Tabela de destino (ex: 'raw_patients').
+            stage_name (str): Nome da tabela de staging.
+            key_columns (List[str]): Colunas da chave.
+        """
+        cursor.execute(
+            sql.SQL('SELECT {keys} FROM {stage} GROUP BY {keys} HAVING count(*) > 1 LIMIT 1').format(
+                keys=self._join_identifiers(key_columns),
+                stage=sql.Identifier(stage_name)
+            )
+        )
+        duplicate = cursor.fetchone()
+
+        if duplicate:
+            raise ValueError(f'Chave {dict(zip(key_columns, duplicate))} repetida nos dados de: {table_name}')
+
+    def _get_key_columns(self, name: str, table: Table, columns: List[str]) -> List[str]:
+        """
+        Retorna as colunas que identificam um registro: a chave de negócio configurada ou a chave primária.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'procedures').
+            table (Table): Tabela de destino.
+            columns (List[str]): Colunas presentes nos dados.
+
+        Returns:
+            List[str]: Colunas da chave.
+        """
+        key_columns = self.BUSINESS_KEYS.get(name) or [column.name for column in table.primary_key]
+
+        missing = [column for column in key_columns if column not in columns]
+        if missing:
+            raise ValueError(f'Chave {missing} não encontrada nos dados de: {name}')
+
+        return key_columns
+
+    def _insert_new_rows(
+        self,
+        cursor,
+        table: Table,
+        arrow_table: pa.Table,
+        key_columns: List[str],
+        batch_size: int,
+        unique_keys: bool = True
+    ) -> int:
+        """
+        Carrega os dados em uma staging e insere apenas as chaves que não existem no destino.
+
+        Todos os registros de uma chave nova são inseridos, inclusive os repetidos,
+        para que o resultado seja o mesmo da carga completa.
+
+        Args:
+            cursor: Cursor do psycopg2 aberto na transação atual.
+            table (Table): Tabela de destino.
+            arrow_table (pa.Table): Dados preparados por `_prepare_copy_table`.
+            key_columns (List[str]): Colunas da chave.
+            batch_size (int): Quantidade de registros por bloco do COPY.
+            unique_keys (bool): Falha se uma chave se repete nos dados (chave primária).
+
+        Returns:
+            int: Quantidade de registros inseridos.
+        """
+        stage_name = self._create_stage_table(cursor, table, arrow_table.column_names)
+        self._copy_arrow(cursor, stage_name, arrow_table, batch_size)
+
+        if unique_keys:
+            self._check_duplicate_keys(cursor, table.name, stage_name, key_columns)
+
+        cursor.execute(
+            sql.SQL(
+                'INSERT INTO {table} ({columns}) '
+                'SELECT {columns} FROM {stage} AS s '
+                'WHERE NOT EXISTS (SELECT 1 FROM {table} AS t WHERE ({target_keys}) = ({stage_keys}))'
+            ).format(
+                table=sql.Identifier(table.name),
+                columns=self._join_identifiers(arrow_table.column_names),
+                stage=sql.Identifier(stage_name),
+                target_keys=self._join_identifiers(key_columns, 't'),
+                stage_keys=self._join_identifiers(key_columns, 's')
+            )
+        )
+        inserted = cursor.rowcount
+
+        cursor.execute(sql.SQL('DROP TABLE {stage}').format(stage=sql.Identifier(stage_name)))
+        return inserted
+
+    def _build_upsert_sql(self, table: Table, stage_name: str, columns: List[str], key_columns: List[str]) -> sql.Composed:
+        """
+        Monta o `INSERT ... ON CONFLICT DO UPDATE` da staging para a tabela de destino.
+
+        Retorna a quantidade de linhas inseridas e atualizadas em uma única linha.
+
+        Args:
+            table (Table): Tabela de destino.
+            stage_name (str): Nome da tabela de staging.
+            columns (List[str]): Colunas carregadas na staging.
+            key_columns (List[str]): Colunas da chave de conflito.
+
+        Returns:
+            sql.Composed: Comando SQL do upsert.
+        """
+        value_columns = [column for column in columns if column not in key_columns]
+
+        if value_columns:
+            assignments = [
+                sql.SQL('{column} = EXCLUDED.{column}').format(column=sql.Identifier(column))
+                for column in value_columns
+            ]
+            if 'updated_at' in table.columns and 'updated_at' not in columns:
+                assignments.append(sql.SQL('updated_at = now()'))
+
+            conflict_action = sql.SQL(
+                'DO UPDATE SET {assignments} WHERE ({current}) IS DISTINCT FROM ({incoming})'
+            ).format(
+                assignments=sql.SQL(', ').join(assignments),
+                current=self._join_identifiers(value_columns, table.name),
+                incoming=self._join_identifiers(value_columns, 'excluded')
+            )
+        else:
+            conflict_action = sql.SQL('DO NOTHING')
+
+        return sql.SQL(
+            'WITH upserted AS ('
+            'INSERT INTO {table} ({columns}) '
+            'SELECT {columns} FROM {stage} '
+            'ON CONFLICT ({keys}) {conflict_action} '
+            'RETURNING (xmax = 0) AS inserted'
+            ') '
+            'SELECT count(*) FILTER (WHERE inserted), count(*) FILTER (WHERE NOT inserted) FROM upserted'
+        ).format(
+            table=sql.Identifier(table.name),
+            columns=self._join_identifiers(columns),
+            keys=self._join_identifiers(key_columns),
+            stage=sql.Identifier(stage_name),
+            conflict_action=conflict_action
+        )
+
+    def _join_identifiers(self, names: List[str], prefix: Optional[str] = None) -> sql.Composed:
+        """
+        Monta uma lista de identificadores SQL separados por vírgula.
+
+        Args:
+            names (List[str]): Nomes das colunas.
+            prefix (Optional[str]): Tabela/alias usado como prefixo (ex: 'excluded').
+
+        Returns:
+            sql.Composed: Identificadores prontos para uso no comando.
+        """
+        if prefix:
+            return sql.SQL(', ').join(sql.Identifier(prefix, name) for name in names)
+
+        return sql.SQL(', ').join(sql.Identifier(name) for name in names)
+
+    def _to_records(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
+        """
+        Converte um DataFrame em uma lista de registros para o ORM.
+
+        Valores nulos (`NaN`, `NaT` e `pd.NA` das colunas `category`/`string[pyarrow]`)
+        viram `None`, que o driver grava como `NULL`.
+
+        Args:
+            df (pd.DataFrame): Dados a serem convertidos.
+
+        Returns:
+            List[Dict[str, Any]]: Um dicionário por linha.
+        """
+        return df.astype(object).where(df.notna(), None).to_dict(orient='records')
+
+    def _get_table(self, name: str) -> Table:
+        """
+        Retorna a tabela do SQLAlchemy para um nome de arquivo.
+
+        Args:
+            name (str): Nome do arquivo (ex: 'encounters').
+
+        Returns:
+            Table: Tabela mapeada em `db_model.py`.
+        """
+        table_name = self.ORM_MAPPING.get(name)
+        if not table_name:
+            raise ValueError(f'Tabela não encontrada para: {name}')
+
+        return self.Base.metadata.tables[table_name]
+
+    def _prepare_copy_table(self, table: Table, data: Union[pd.DataFrame, pa.Table]) -> pa.Table:
+        """
+        Converte os dados para Arrow com os tipos esperados pela tabela no Banco.
+
+        Colunas que não existem na tabela são ignoradas, datas são normalizadas para
+        microssegundos e `NaN` é convertido em `NULL`.
+
+        Args:
+            table (Table): Tabela de destino.
+            data (DataFrame | pa.Table): Dados a serem convertidos.
+
+        Returns:
+            pa.Table: Tabela Arrow pronta para ser escrita em CSV.
+        """
+        if isinstance(data, pd.DataFrame):
+            data = pa.Table.from_pandas(data, preserve_index=False)
+
+        ignored = [column for column in data.column_names if column not in table.columns]
+        if ignored:
+            logger.warning(f'Colunas ignoradas em {table.name}: {ignored}')
+
+        columns = [column for column in data.column_names if column in table.columns]
+
+        arrays = []
+        for column in columns:
+            arrays.append(self._cast_copy_column(data.column(column), table.columns[column].type))
+
+        return pa.Table.from_arrays(arrays, names=columns)
+
+    def _cast_copy_column(self, array: pa.ChunkedArray, column_type) -> pa.ChunkedArray:
+        """
+        Ajusta uma coluna Arrow para o formato aceito pelo COPY em CSV.
+
+        Args:
+            array (pa.ChunkedArray): Coluna a ser ajustada.
+            column_type: Tipo da coluna no SQLAlchemy.
+
+        Returns:
+            pa.ChunkedArray: Coluna ajustada.
+        """
+        if pa.types.is_dictionary(array.type):
+            array = array.cast(array.type.value_type)
+
+        if isinstance(column_type, DateTime):
+            if pa.types.is_timestamp(array.type) and array.type.unit == 'ns':
+                array = array.cast(pa.timestamp('us', tz=array.type.tz), safe=False)
+
+        elif isinstance(column_type, Float):
+            if not pa.types.is_floating(array.type):
+                array = array.cast(pa.float64())
+            array = pc.if_else(pc.is_nan(array), pa.scalar(None, array.type), array)
+
+        elif isinstance(column_type, String):
+            if not (pa.types.is_string(array.type) or pa.types.is_large_string(array.type)):
+                array = array.cast(pa.string())
+
+        return array
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, String, Float, DateTime, Integer
+from sqlalchemy import Column, String, Float, DateTime, Integer, Index
 from sqlalchemy.orm import declarative_base
 from sqlalchemy.sql import func
 
@@ -15,7 +15,7 @@ class EncountersModel(Base):
     patient = Column(String, nullable=False)
     organization = Column(String, nullable=False)
     payer = Column(String, nullable=False)
-    encountersclass = Column(String, nullable=True)
+    encounterclass = Column(String, nullable=True)
     code = Column(String, nullable=False)
     description = Column(String, nullable=False)
     base_encounter_cost = Column(Float, nullable=False)
@@ -23,7 +23,7 @@ class EncountersModel(Base):
     payer_coverage = Column(Float, nullable=False)
     reasoncode = Column(String, nullable=True)
     reasondescription = Column(String, nullable=True)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     def __repr__(self):
         return f'<EncountersModel(id={self.id} | patient={self.patient})>'
@@ -41,7 +41,7 @@ class OrganizationsModel(Base):
     zip = Column(String, nullable=False)
     lat = Column(Float, nullable=False)
     lon = Column(Float, nullable=False)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     def __repr__(self):
         return f'<OrganizationsModel(id={self.id} | name={self.name})>'
@@ -55,14 +55,14 @@ class PatientsModel(Base):
     birthdate = Column(DateTime, nullable=False)
     deathdate = Column(DateTime, nullable=True)
     prefix = Column(String, nullable=True)
-    first= Column(String, nullable=False)
-    last = Column(String, nullable=False)
+    first= Column(String, nullable=True)
+    last = Column(String, nullable=True)
     suffix= Column(String, nullable=True)
-    maiden = Column(String, nullable=False)
-    marital = Column(String, nullable=False)
-    race = Column(String, nullable=False)
+    maiden = Column(String, nullable=True)
+    marital = Column(String, nullable=True)
+    race = Column(String, nullable=True)
     ethnicity = Column(String, nullable=True)
-    gender = Column(String, name=False)
+    gender = Column(String, nullable=True)
     birthplace = Column(String, nullable=True)
     address = Column(String, nullable=True)
     city = Column(String, nullable=True)
@@ -71,7 +71,7 @@ class PatientsModel(Base):
     zip = Column(String, nullable=True)
     lat = Column(Float, nullable=True)
     lon = Column(Float, nullable=True)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     def __repr__(self):
         return f'<PatientsModel(id={self.id} | first={self.first} | last={self.last})>'
@@ -88,7 +88,7 @@ class PayersModel(Base):
     state_headquartered = Column(String, nullable=True)
     zip = Column(String, nullable=True)
     phone = Column(String, nullable=True)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     def __repr__(self):
         return f'<PayersModel(id={self.id} | name = {self.name})>'
@@ -102,13 +102,32 @@ class ProceduresModel(Base):
     start = Column(DateTime, nullable=False)
     stop = Column(DateTime, nullable=False)
     patient = Column(String, nullable=False) 
-    encounter = Column(String, name=False)
+    encounter = Column(String, nullable=False)
     code = Column(String, nullable=False)
     description = Column(String, nullable=False)
-    base_cost = Column(Float, nullable=False)
+    base_cost = Column(Float, nullable=True)
     reasoncode = Column(String, nullable=True)
     reasondescription = Column(String, nullable=True)
-    updated_at = Column(DateTime, default=func.now(), onupdate=func.now())
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
+
+    __table_args__ = (
+        Index('ix_raw_procedures_business_key', 'start', 'patient', 'encounter', 'code'),
+    )
+
+    def __repr__(self):
+        return f'<ProceduresModel(start={self.start} | stop={self.stop} | patient={self.patient})>'
+
+
+class PipelineStateModel(Base):
+    """Modelo de Tabela no Banco de Dados com o último snapshot carregado de cada arquivo."""
+
+    __tablename__ = 'pipeline_state'
+
+    dataset = Column(String, primary_key=True, nullable=False)
+    blob_name = Column(String, nullable=False)
+    snapshot = Column(DateTime, nullable=False)
+    row_count = Column(Integer, nullable=False)
+    updated_at = Column(DateTime, default=func.now(), server_default=func.now(), onupdate=func.now())
 
     def __repr__(self):
-        return f'<ProceduresModel(start={self.start} | stop={self.stop} | patient={self.patient})>'
\ No newline at end of file
+        return f'<PipelineStateModel(dataset={self.dataset} | snapshot={self.snapshot})>'
@@ -0,0 +1,265 @@
+import io
+import pstats
+import cProfile
+import logging
+import threading
+import tracemalloc
+import pyarrow as pa
+
+from typing import Dict, List, Optional, Any
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+
+class MemoryBudgetExceeded(MemoryError):
+    """Erro levantado quando uma etapa aloca mais memória que o orçamento configurado."""
+
+
+def parse_memory_budgets(value: Optional[str]) -> Dict[str, int]:
+    """
+    Lê os orçamentos de memória no formato 'etapa=MB' ou 'etapa:arquivo=MB', separados por vírgula.
+
+    Exemplo:
+        'transform=512,load:encounters=1024' -> {'transform': 536870912, 'load:encounters': 1073741824}
+
+    Args:
+        value (Optional[str]): Texto com os orçamentos (ex: `PROFILE_MEMORY_BUDGETS`).
+
+    Returns:
+        Dict[str, int]: Orçamento em bytes por etapa.
+    """
+    budgets = {}
+    for item in (value or '').split(','):
+        if not item.strip():
+            continue
+
+        key, _, megabytes = item.partition('=')
+        if not megabytes:
+            raise ValueError(f'Orçamento de memória inválido: {item}')
+
+        budgets[key.strip()] = int(float(megabytes) * 2**20)
+
+    return budgets
+
+
+class RunProfiler:
+    """
+    Perfil de CPU (cProfile) e de alocações (tracemalloc) de cada etapa de uma execução.
+
+    Cada etapa grava um `.prof` (lido com `pstats` ou `snakeviz`) e um `.txt` com as
+    linhas que mais alocaram memória, no diretório de artefatos da execução. Em
+    etapas aninhadas, o cProfile só mede uma por vez: o tempo da etapa interna vai
+    para o arquivo dela e não para o da etapa externa. O pico de memória da etapa
+    externa inclui o das internas.
+
+    Apenas as etapas da thread que iniciou a execução são perfiladas; as demais
+    (ex: carga paralela) são só medidas pelo `RunMetrics`. Memória alocada pelo
+    Arrow não aparece no tracemalloc e é registrada à parte: 'arrow_peak_bytes'
+    (pico, amostrado pelo `PeakRss` da etapa) e 'arrow_allocated_bytes' (o que
+    ficou alocado ao fim).
+
+    O orçamento (`memory_budgets`) é comparado com 'memory_peak_bytes': o maior
+    entre o pico do tracemalloc somado ao pico do Arrow e o crescimento do RSS do
+    processo na etapa. Se passar, a etapa falha com `MemoryBudgetExceeded`, com os
+    três valores e as maiores alocações do Python na mensagem. O Arrow e o RSS são
+    do processo inteiro, então incluem o que outras threads alocaram ao mesmo tempo.
+    """
+
+    def __init__(
+        self,
+        artifact_path: Path,
+        memory_budgets: Optional[Dict[str, int]] = None,
+        top_allocations: int = 20,
+        traceback_frames: int = 1
+    ):
+        self.artifact_path = Path(artifact_path)
+        self.memory_budgets = memory_budgets or {}
+        self.top_allocations = top_allocations
+        self.traceback_frames = traceback_frames
+
+        self._thread_id = threading.get_ident()
+        self._stack = []
+        self._count = 0
+
+    def start(self) -> None:
+        """Cria o diretório de artefatos e liga o tracemalloc."""
+        self.artifact_path.mkdir(parents=True, exist_ok=True)
+        self._started_tracemalloc = not tracemalloc.is_tracing()
+        if self._started_tracemalloc:
+            tracemalloc.start(self.traceback_frames)
+
+    def stop(self) -> None:
+        """Desliga o tracemalloc, se foi ligado por este perfil."""
+        while self._stack:
+            frame = self._stack.pop()
+            frame['profile'].disable()
+
+        if self._started_tracemalloc:
+            tracemalloc.stop()
+
+    def enter(self, record: Dict[str, Any]) -> None:
+        """
+        Começa o perfil de uma etapa.
+
+        Args:
+            record (Dict[str, Any]): Registro da etapa no `RunMetrics`.
+        """
+        if threading.get_ident() != self._thread_id:
+            return
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent['profile'].disable()
+            parent['peak'] = max(parent['peak'], tracemalloc.get_traced_memory()[1])
+
+        tracemalloc.reset_peak()
+        current = tracemalloc.get_traced_memory()[0]
+
+        frame = {
+            'record': record,
+            'profile': cProfile.Profile(),
+            'baseline': current,
+            'peak': current,
+            'snapshot': tracemalloc.take_snapshot(),
+            'arrow_baseline': pa.total_allocated_bytes()
+        }
+        self._stack.append(frame)
+        frame['profile'].enable()
+
+    def exit(self, record: Dict[str, Any], failed: bool) -> None:
+        """
+        Fecha o perfil de uma etapa, grava os artefatos e confere o orçamento de memória.
+
+        Args:
+            record (Dict[str, Any]): Registro da etapa no `RunMetrics`.
+            failed (bool): Se a etapa terminou com erro (o orçamento não é conferido).
+        """
+        if not self._stack or self._stack[-1]['record'] is not record:
+            return
+
+        frame = self._stack.pop()
+        frame['profile'].disable()
+
+        peak = max(frame['peak'], tracemalloc.get_traced_memory()[1])
+        snapshot = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+
+        if self._stack:
+            parent = self._stack[-1]
+            parent['peak'] = max(parent['peak'], peak)
+            parent['profile'].enable()
+
+        allocations = self._top_allocations(snapshot, frame['snapshot'])
+        name = self._artifact_name(record)
+
+        frame['profile'].dump_stats(self.artifact_path / f'{name}.prof')
+        with open(self.artifact_path / f'{name}.allocations.txt', 'w') as f:
+            f.write(self._format_report(record, frame['profile'], allocations))
+
+        record['traced_peak_bytes'] = peak - frame['baseline']
+        record['arrow_allocated_bytes'] = pa.total_allocated_bytes() - frame['arrow_baseline']
+        record['memory_peak_bytes'] = max(
+            record['traced_peak_bytes'] + record.get('arrow_peak_bytes', 0),
+            record.get('rss_growth_bytes', 0)
+        )
+        record['profile'] = f'{name}.prof'
+
+        budget = self._get_budget(record)
+        if budget is not None and not failed and record['memory_peak_bytes'] > budget:
+            breakdown = '\n'.join(f"  {item['size'] / 2**20:.1f} MB  {item['location']}" for item in allocations[:10])
+            message = (
+                f"Etapa {self._label(record)} passou do orçamento de memória: "
+                f"{record['memory_peak_bytes'] / 2**20:.1f} MB de {budget / 2**20:.1f} MB "
+                f"(Python: {record['traced_peak_bytes'] / 2**20:.1f} MB, "
+                f"Arrow: {record.get('arrow_peak_bytes', 0) / 2**20:.1f} MB, "
+                f"RSS: +{record.get('rss_growth_bytes', 0) / 2**20:.1f} MB).\n"
+                f"Maiores alocações do Python:\n{breakdown}"
+            )
+            logger.error(message)
+            raise MemoryBudgetExceeded(message)
+
+    def _get_budget(self, record: Dict[str, Any]) -> Optional[int]:
+        """
+        Retorna o orçamento da etapa, priorizando o específico do arquivo ('etapa:arquivo').
+
+        Args:
+            record (Dict[str, Any]): Registro da etapa.
+
+        Returns:
+            Optional[int]: Orçamento em bytes, ou None se não houver.
+        """
+        if record['dataset']:
+            budget = self.memory_budgets.get(f"{record['stage']}:{record['dataset']}")
+            if budget is not None:
+                return budget
+
+        return self.memory_budgets.get(record['stage'])
+
+    def _top_allocations(self, snapshot: tracemalloc.Snapshot, baseline: tracemalloc.Snapshot) -> List[Dict[str, Any]]:
+        """
+        Compara o fim da etapa com o início e retorna as linhas que mais cresceram.
+
+        Args:
+            snapshot (tracemalloc.Snapshot): Snapshot do fim da etapa.
+            baseline (tracemalloc.Snapshot): Snapshot do início da etapa.
+
+        Returns:
+            List[Dict[str, Any]]: Linhas com 'location', 'size' e 'count' (crescimento).
+        """
+        filters = [
+            tracemalloc.Filter(False, tracemalloc.__file__),
+            tracemalloc.Filter(False, cProfile.__file__),
+            tracemalloc.Filter(False, pstats.__file__),
+            tracemalloc.Filter(False, str(Path(__file__).parent / '*'))
+        ]
+        stats = snapshot.filter_traces(filters).compare_to(baseline.filter_traces(filters), 'lineno')
+
+        return [
+            {
+                'location': f'{stat.traceback[0].filename}:{stat.traceback[0].lineno}',
+                'size': stat.size_diff,
+                'count': stat.count_diff
+            }
+            for stat in stats[:self.top_allocations]
+        ]
+
+    def _format_report(self, record: Dict[str, Any], profile: cProfile.Profile, allocations: List[Dict[str, Any]]) -> str:
+        """
+        Monta o relatório em texto da etapa: maiores alocações e funções mais caras.
+
+        Args:
+            record (Dict[str, Any]): Registro da etapa.
+            profile (cProfile.Profile): Perfil da etapa.
+            allocations (List[Dict[str, Any]]): Saída de `_top_allocations`.
+
+        Returns:
+            str: Relatório da etapa.
+        """
+        lines = [f'Etapa: {self._label(record)}', '', 'Maiores alocações (crescimento na etapa):']
+        lines.extend(
+            f"{item['size'] / 2**20:10.2f} MB {item['count']:>10} blocos  {item['location']}"
+            for item in allocations
+        )
+
+        stream = io.StringIO()
+        pstats.Stats(profile, stream=stream).sort_stats('cumulative').print_stats(self.top_allocations)
+        lines.extend(['', 'Funções com maior tempo acumulado:', stream.getvalue()])
+
+        return '\n'.join(lines)
+
+    def _artifact_name(self, record: Dict[str, Any]) -> str:
+        """
+        Retorna um nome de arquivo único para os artefatos da etapa.
+
+        Args:
+            record (Dict[str, Any]): Registro da etapa.
+
+        Returns:
+            str: Nome sem extensão, na ordem em que as etapas terminaram (ex: '003_transform_encounters').
+        """
+        self._count += 1
+        return f"{self._count:03d}_{self._label(record).replace(':', '_')}"
+
+    def _label(self, record: Dict[str, Any]) -> str:
+        return f"{record['stage']}:{record['dataset']}" if record['dataset'] else record['stage']
@@ -0,0 +1,457 @@
+import os
+import json
+import time
+import uuid
+import resource
+import logging
+import threading
+import pyarrow as pa
+
+from dotenv import load_dotenv
+from typing import Dict, List, Optional, Any
+from datetime import datetime
+from pathlib import Path
+
+from src.metrics.profiling import RunProfiler, MemoryBudgetExceeded, parse_memory_budgets
+
+logger = logging.getLogger(__name__)
+
+PROMETHEUS_PREFIX = 'hospital_pipeline'
+
+
+class PeakRss:
+    """
+    Mede o pico de memória residente (RSS) do processo durante um trecho de código.
+
+    Lê o RSS atual de `/proc/self/statm` em uma thread a cada `interval` segundos,
+    junto com a memória alocada pelo Arrow (`arrow_peak`), que não aparece no
+    tracemalloc. Fora do Linux, usa o pico do processo inteiro (`ru_maxrss`) e o
+    Arrow só é lido no início e no fim.
+    """
+
+    def __init__(self, interval: float = 0.01):
+        self.interval = interval
+        self.start = 0
+        self.peak = 0
+        self.arrow_start = 0
+        self.arrow_peak = 0
+        self._stop = threading.Event()
+        self._thread = None
+
+    def __enter__(self) -> 'PeakRss':
+        self.start = self.peak = current_rss()
+        self.arrow_start = self.arrow_peak = pa.total_allocated_bytes()
+        if self.peak:
+            self._thread = threading.Thread(target=self._sample, daemon=True)
+            self._thread.start()
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        if self._thread:
+            self._stop.set()
+            self._thread.join()
+            self.peak = max(self.peak, current_rss())
+        else:
+            self.peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+        self.arrow_peak = max(self.arrow_peak, pa.total_allocated_bytes())
+
+    @property
+    def growth(self) -> int:
+        """Quanto o RSS cresceu em relação ao início (0 fora do Linux)."""
+        return max(0, self.peak - self.start) if self.start else 0
+
+    @property
+    def arrow_growth(self) -> int:
+        """Quanto a memória do Arrow cresceu, no pico, em relação ao início."""
+        return max(0, self.arrow_peak - self.arrow_start)
+
+    def _sample(self) -> None:
+        while not self._stop.wait(self.interval):
+            self.peak = max(self.peak, current_rss())
+            self.arrow_peak = max(self.arrow_peak, pa.total_allocated_bytes())
+
+
+def current_rss() -> int:
+    """
+    Retorna o RSS atual do processo em bytes, ou 0 se `/proc` não existir.
+
+    Returns:
+        int: Memória residente em bytes.
+    """
+    try:
+        with open('/proc/self/statm') as statm:
+            return int(statm.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+    except OSError:
+        return 0
+
+
+class RunMetrics:
+    """
+    Métricas de uma execução da pipeline: tempo, CPU, linhas, bytes e pico de RSS por etapa e arquivo.
+
+    Ligada por `METRICS_ENABLED=true`. Ao final da execução grava um relatório JSON
+    por execução e um arquivo no formato texto do Prometheus (para o textfile
+    collector do node_exporter) em `METRICS_REPORT_PATH`. Com
+    `METRICS_BATCH_TIMINGS=true` também registra o tempo de cada lote enviado ao Banco.
+
+    Com `PROFILE_ENABLED=true` (ou `begin(profile=True)`) cada etapa também grava
+    um perfil do cProfile e as maiores alocações do tracemalloc em
+    `{pipeline}_{run_id}_profile/`, ao lado do relatório, e pode falhar por
+    orçamento de memória (`PROFILE_MEMORY_BUDGETS`, ver `RunProfiler`).
+
+    Desligada, `stage` devolve sempre o mesmo context manager vazio e nada é medido.
+    O tempo de CPU é o do processo inteiro, então etapas que rodam ao mesmo tempo
+    (ex: carga paralela) somam a CPU umas das outras.
+    """
+
+    def __init__(
+        self,
+        pipeline: str,
+        enabled: Optional[bool] = None,
+        report_path: Optional[str] = None,
+        batch_timings: Optional[bool] = None
+    ):
+        load_dotenv()
+
+        if enabled is None:
+            enabled = os.getenv('METRICS_ENABLED', 'false').lower() == 'true'
+        if batch_timings is None:
+            batch_timings = os.getenv('METRICS_BATCH_TIMINGS', 'false').lower() == 'true'
+
+        self.pipeline = pipeline
+        self.enabled = enabled
+        self.batch_timings = enabled and batch_timings
+        self.report_path = Path(report_path or os.getenv('METRICS_REPORT_PATH', 'src/metrics_reports'))
+
+        self.profile = os.getenv('PROFILE_ENABLED', 'false').lower() == 'true'
+        self.memory_budgets = parse_memory_budgets(os.getenv('PROFILE_MEMORY_BUDGETS'))
+        self.top_allocations = int(os.getenv('PROFILE_TOP_ALLOCATIONS', 20))
+
+        self.run_id = None
+        self.profiler = None
+        self._recording = False
+        self.started_at = None
+        self.stages = []
+        self.batches = []
+        self.sections = {}
+        self._start = None
+        self._lock = threading.Lock()
+
+    def begin(self, profile: Optional[bool] = None) -> None:
+        """
+        Inicia uma nova execução, descartando as medições da anterior.
+
+        Args:
+            profile (Optional[bool]): Liga o perfil de CPU e memória por etapa (padrão: `PROFILE_ENABLED`).
+                O perfil liga as métricas desta execução, mesmo com `METRICS_ENABLED` desligado.
+        """
+        self.run_id = f"{datetime.now().strftime('%Y%m%dT%H%M%S')}_{uuid.uuid4().hex[:6]}"
+        self.started_at = datetime.now().isoformat()
+        self.stages = []
+        self.batches = []
+        self.sections = {}
+        self._start = time.perf_counter()
+
+        if self.profiler:
+            self.profiler.stop()
+        self.profiler = None
+
+        if self.profile if profile is None else profile:
+            self.profiler = RunProfiler(
+                self.report_path / f'{self.pipeline}_{self.run_id}_profile',
+                memory_budgets=self.memory_budgets,
+                top_allocations=self.top_allocations
+            )
+            self.profiler.start()
+
+        self._recording = self.enabled or self.profiler is not None
+
+    def stage(self, name: str, dataset: Optional[str] = None, rows: int = 0, data_bytes: int = 0) -> '_StageTimer':
+        """
+        Mede uma etapa da pipeline.
+
+        O context manager devolve o registro da etapa, onde 'rows' e 'bytes' podem
+        ser preenchidos quando só são conhecidos no final.
+
+        Exemplo:
+            with self.metrics.stage('upload', dataset='encounters') as stage:
+                ...
+                stage['rows'] = len(df)
+
+        Args:
+            name (str): Nome da etapa (ex: 'transform').
+            dataset (Optional[str]): Arquivo processado na etapa, ou None para a etapa inteira.
+            rows (int): Quantidade de linhas processadas, se já conhecida.
+            data_bytes (int): Quantidade de bytes processados, se já conhecida.
+
+        Returns:
+            _StageTimer: Context manager da etapa.
+        """
+        if not self._recording:
+            return _NULL_STAGE
+
+        return _StageTimer(self, name, dataset, rows, data_bytes)
+
+    def record_batch(self, stage: str, dataset: str, rows: int, seconds: float) -> None:
+        """
+        Registra o tempo de um lote enviado ao Banco (apenas com `METRICS_BATCH_TIMINGS`).
+
+        Args:
+            stage (str): Operação do lote (ex: 'copy').
+            dataset (str): Tabela de destino.
+            rows (int): Quantidade de registros do lote.
+            seconds (float): Tempo do lote.
+        """
+        if not self.batch_timings:
+            return
+
+        with self._lock:
+            self.batches.append({
+                'stage': stage,
+                'dataset': dataset,
+                'rows': rows,
+                'seconds': round(seconds, 4)
+            })
+
+    def add_section(self, name: str, data: Dict[str, Any]) -> None:
+        """
+        Adiciona ao relatório uma seção com um resumo próprio da execução.
+
+        Exemplo:
+            self.metrics.add_section('overlap', pipeline.report())
+
+        Args:
+            name (str): Chave da seção no relatório JSON.
+            data (Dict[str, Any]): Conteúdo da seção (serializável em JSON).
+        """
+        if not self._recording:
+            return
+
+        with self._lock:
+            self.sections[name] = data
+
+    def finish(self, status: str = 'success') -> Optional[Path]:
+        """
+        Fecha a execução e grava o relatório JSON e o arquivo do Prometheus.
+
+        Args:
+            status (str): Resultado da execução ('success' ou 'error').
+
+        Returns:
+            Optional[Path]: Caminho do relatório JSON, ou None se as métricas estiverem desligadas.
+        """
+        if not self._recording:
+            return None
+
+        profile_path = None
+        if self.profiler:
+            self.profiler.stop()
+            profile_path = str(self.profiler.artifact_path)
+            self.profiler = None
+        self._recording = False
+
+        report = {
+            'pipeline': self.pipeline,
+            'run_id': self.run_id,
+            'status': status,
+            'started_at': self.started_at,
+            'finished_at': datetime.now().isoformat(),
+            'seconds': round(time.perf_counter() - self._start, 4),
+            'profile_path': profile_path,
+            'stages': self.stages,
+            'batches': self.batches,
+            **self.sections
+        }
+
+        try:
+            self.report_path.mkdir(parents=True, exist_ok=True)
+
+            report_file = self.report_path / f'{self.pipeline}_{self.run_id}.json'
+            with open(report_file, 'w') as f:
+                json.dump(report, f, indent=2)
+
+            prometheus_file = self.report_path / f'{self.pipeline}.prom'
+            temp_path = prometheus_file.with_suffix('.prom.tmp')
+            with open(temp_path, 'w') as f:
+                f.write(to_prometheus(report))
+            os.replace(temp_path, prometheus_file)
+
+            logger.info(f'Relatório de métricas salvo em: {report_file}')
+            return report_file
+
+        except Exception as e:
+            logger.error(f'Erro ao salvar o relatório de métricas: {str(e)}')
+            raise
+
+    def _add_stage(self, record: Dict[str, Any]) -> None:
+        with self._lock:
+            self.stages.append(record)
+
+
+class _StageTimer:
+    """Context manager que mede uma etapa e adiciona o registro em `RunMetrics.stages`."""
+
+    def __init__(self, metrics: RunMetrics, name: str, dataset: Optional[str], rows: int, data_bytes: int):
+        self.metrics = metrics
+        self.record = {'stage': name, 'dataset': dataset, 'rows': rows, 'bytes': data_bytes}
+        self.rss = PeakRss()
+
+    def __enter__(self) -> Dict[str, Any]:
+        self.rss.__enter__()
+        if self.metrics.profiler:
+            self.metrics.profiler.enter(self.record)
+
+        self.cpu_start = time.process_time()
+        self.start = time.perf_counter()
+        return self.record
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        seconds = time.perf_counter() - self.start
+        cpu_seconds = time.process_time() - self.cpu_start
+        self.rss.__exit__(exc_type, exc, traceback)
+
+        try:
+            if self.metrics.profiler:
+                self.record['rss_growth_bytes'] = self.rss.growth
+                self.record['arrow_peak_bytes'] = self.rss.arrow_growth
+                self.metrics.profiler.exit(self.record, failed=exc_type is not None)
+
+        except MemoryBudgetExceeded:
+            exc_type = MemoryBudgetExceeded
+            raise
+
+        finally:
+            self._add_record(exc_type, seconds, cpu_seconds)
+
+    def _add_record(self, exc_type, seconds: float, cpu_seconds: float) -> None:
+        rows = self.record['rows']
+        data_bytes = self.record['bytes']
+        self.record.update({
+            'status': 'error' if exc_type else 'success',
+            'seconds': round(seconds, 4),
+            'cpu_seconds': round(cpu_seconds, 4),
+            'rows_per_s': round(rows / seconds, 1) if seconds and rows else None,
+            'mb_per_s': round(data_bytes / 2**20 / seconds, 2) if seconds and data_bytes else None,
+            'peak_rss_bytes': self.rss.peak
+        })
+        self.metrics._add_stage(self.record)
+
+
+class _NullStage:
+    """Etapa vazia usada quando as métricas estão desligadas."""
+
+    def __init__(self):
+        self.record = {'rows': 0, 'bytes': 0}
+
+    def __enter__(self) -> Dict[str, Any]:
+        return self.record
+
+    def __exit__(self, *exc_info) -> None:
+        return None
+
+
+_NULL_STAGE = _NullStage()
+
+
+def to_prometheus(report: Dict[str, Any]) -> str:
+    """
+    Converte um relatório de execução para o formato texto do Prometheus.
+
+    Etapas sem arquivo (a etapa inteira) ficam com `dataset=""`. Uma etapa que rodou
+    mais de uma vez (ex: novas tentativas) vira uma única série: tempos, linhas e bytes
+    somados e o maior pico de memória, com a quantidade em `stage_count`. Os lotes do Banco
+    são resumidos em contagem e soma do tempo por operação e tabela, e a seção
+    'overlap' (execução em pipeline) em tempo ocupado, sobreposição e bloqueio por etapa.
+
+    Args:
+        report (Dict[str, Any]): Relatório gerado por `RunMetrics.finish`.
+
+    Returns:
+        str: Métricas no formato texto do Prometheus.
+    """
+    pipeline = report['pipeline']
+    lines = []
+
+    def add(name: str, help_text: str, samples: List[tuple]) -> None:
+        lines.append(f'# HELP {PROMETHEUS_PREFIX}_{name} {help_text}')
+        lines.append(f'# TYPE {PROMETHEUS_PREFIX}_{name} gauge')
+        for labels, value in samples:
+            label_text = ','.join(f'{key}="{_escape(str(label))}"' for key, label in labels.items())
+            lines.append(f'{PROMETHEUS_PREFIX}_{name}{{{label_text}}} {value}')
+
+    run_labels = {'pipeline': pipeline}
+    add('run_seconds', 'Tempo total da última execução.', [(run_labels, report['seconds'])])
+    add('run_success', '1 se a última execução terminou sem erro.', [(run_labels, int(report['status'] == 'success'))])
+    add(
+        'run_timestamp_seconds', 'Horário de término da última execução.',
+        [(run_labels, datetime.fromisoformat(report['finished_at']).timestamp())]
+    )
+
+    stage_totals = {}
+    for stage in report['stages']:
+        total = stage_totals.setdefault(
+            (stage['stage'], stage['dataset'] or ''),
+            {'count': 0, 'seconds': 0.0, 'cpu_seconds': 0.0, 'rows': 0, 'bytes': 0, 'peak_rss_bytes': 0}
+        )
+        total['count'] += 1
+        for key in ('seconds', 'cpu_seconds', 'rows', 'bytes'):
+            total[key] += stage[key]
+        total['peak_rss_bytes'] = max(total['peak_rss_bytes'], stage['peak_rss_bytes'])
+
+    stage_metrics = {
+        'stage_count': ('count', 'Vezes que cada etapa rodou, tentativas incluídas.'),
+        'stage_seconds': ('seconds', 'Tempo de cada etapa, somado entre as tentativas.'),
+        'stage_cpu_seconds': ('cpu_seconds', 'Tempo de CPU do processo durante cada etapa, somado entre as tentativas.'),
+        'stage_rows': ('rows', 'Linhas processadas em cada etapa, somadas entre as tentativas.'),
+        'stage_bytes': ('bytes', 'Bytes processados em cada etapa, somados entre as tentativas.'),
+        'stage_peak_rss_bytes': ('peak_rss_bytes', 'Maior pico de memória residente durante cada etapa.')
+    }
+    for name, (key, help_text) in stage_metrics.items():
+        add(name, help_text, [
+            ({'pipeline': pipeline, 'stage': stage, 'dataset': dataset}, round(total[key], 4))
+            for (stage, dataset), total in stage_totals.items()
+        ])
+
+    if report['batches']:
+        totals = {}
+        for batch in report['batches']:
+            count, seconds = totals.get((batch['stage'], batch['dataset']), (0, 0.0))
+            totals[(batch['stage'], batch['dataset'])] = (count + 1, seconds + batch['seconds'])
+
+        add('batch_count', 'Quantidade de lotes enviados ao Banco.', [
+            ({'pipeline': pipeline, 'stage': stage, 'dataset': dataset}, count)
+            for (stage, dataset), (count, _) in totals.items()
+        ])
+        add('batch_seconds_sum', 'Tempo somado dos lotes enviados ao Banco.', [
+            ({'pipeline': pipeline, 'stage': stage, 'dataset': dataset}, round(seconds, 4))
+            for (stage, dataset), (_, seconds) in totals.items()
+        ])
+
+    overlap = report.get('overlap')
+    if overlap:
+        overlap_metrics = {
+            'stage_busy_seconds': ('busy_seconds', 'Tempo com a etapa trabalhando na execução em pipeline.'),
+            'stage_overlap_ratio': ('overlap_ratio', 'Fração do tempo da etapa em que outra etapa também trabalhava.'),
+            'stage_blocked_seconds': ('blocked_seconds', 'Tempo da etapa esperando espaço na fila seguinte.')
+        }
+        for name, (key, help_text) in overlap_metrics.items():
+            add(name, help_text, [
+                ({'pipeline': pipeline, 'stage': stage}, values[key])
+                for stage, values in overlap['stages'].items()
+            ])
+
+    return '\n'.join(lines) + '\n'
+
+
+def _escape(value: str) -> str:
+    """
+    Escapa um valor de label do Prometheus.
+
+    Args:
+        value (str): Valor do label.
+
+    Returns:
+        str: Valor com barras, aspas e quebras de linha escapadas.
+    """
+    return value.replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n')
@@ -0,0 +1,172 @@
+import os
+import json
+import hashlib
+import logging
+import threading
+
+from dotenv import load_dotenv
+from typing import Dict, Optional, Any
+from datetime import datetime
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+STAGES = ('downloaded', 'parsed', 'validated', 'uploaded', 'loaded')
+
+
+def fingerprint(**parts: Any) -> str:
+    """
+    Calcula a identificação do conteúdo de uma etapa a partir das suas entradas.
+
+    Exemplo:
+        fingerprint(blob_name='encounters/encounters_2026-01-17T22:02:19.parquet', load_mode='copy')
+
+    Args:
+        **parts (Any): Valores que definem o resultado da etapa (serializáveis em JSON).
+
+    Returns:
+        str: Hash SHA-256 em hexadecimal.
+    """
+    return hashlib.sha256(json.dumps(parts, sort_keys=True, default=str).encode()).hexdigest()
+
+
+class CheckpointStore:
+    """
+    Checkpoints duráveis de cada arquivo e etapa de uma pipeline.
+
+    Cada etapa concluída ('downloaded', 'parsed', 'validated', 'uploaded', 'loaded')
+    é gravada em `{CHECKPOINT_PATH}/{pipeline}.json` com a identificação do seu
+    conteúdo (`fingerprint`). Uma execução com `resume=True` mantém os checkpoints da
+    anterior e as etapas com a mesma identificação são puladas; sem `resume`, os
+    checkpoints são apagados no início. `CHECKPOINT_PATH` vazio desliga os checkpoints.
+
+    Só são puladas as etapas cujo resultado fica fora da memória (arquivo baixado,
+    parquet validado em disco, blob enviado, tabela carregada); as demais são
+    gravadas apenas para mostrar até onde a execução chegou.
+    """
+
+    def __init__(self, pipeline: str, checkpoint_path: Optional[str] = None):
+        load_dotenv()
+
+        if checkpoint_path is None:
+            checkpoint_path = os.getenv('CHECKPOINT_PATH', 'src/.checkpoints')
+
+        self.pipeline = pipeline
+        self.enabled = bool(checkpoint_path)
+        self.path = Path(checkpoint_path) / f'{pipeline}.json' if self.enabled else None
+        self.resumed = False
+
+        self._lock = threading.Lock()
+        self._state = {'run': {}, 'datasets': {}}
+
+    def begin(self, resume: bool = False) -> None:
+        """
+        Começa uma execução, mantendo os checkpoints anteriores apenas com `resume`.
+
+        Args:
+            resume (bool): Continua a execução anterior, pulando o que já foi concluído.
+        """
+        if not self.enabled:
+            if resume:
+                logger.warning('Checkpoints desligados (CHECKPOINT_PATH vazio), a execução começa do zero.')
+            return
+
+        with self._lock:
+            previous = self._read() if resume else {}
+            self._state = {
+                'run': {'started_at': datetime.now().isoformat(), 'status': 'running', 'resumed': resume},
+                'datasets': previous.get('datasets', {})
+            }
+            self.resumed = resume
+            self._write()
+
+        if resume:
+            logger.info(f"{self.pipeline}: retomando com checkpoints de {len(self._state['datasets'])} arquivos.")
+
+    def get(self, dataset: str, stage: str, content: str) -> Optional[Dict[str, Any]]:
+        """
+        Retorna o checkpoint de uma etapa, se ela já foi concluída com o mesmo conteúdo.
+
+        Args:
+            dataset (str): Nome do arquivo (ex: 'encounters').
+            stage (str): Etapa (ver `STAGES`).
+            content (str): Identificação do conteúdo, gerada por `fingerprint`.
+
+        Returns:
+            Optional[Dict[str, Any]]: Checkpoint com 'fingerprint', 'completed_at' e os detalhes gravados, ou None.
+        """
+        if not self.enabled or not self.resumed:
+            return None
+
+        with self._lock:
+            checkpoint = self._state['datasets'].get(dataset, {}).get(stage)
+
+        if not checkpoint or checkpoint['fingerprint'] != content:
+            return None
+
+        return checkpoint
+
+    def mark(self, dataset: str, stage: str, content: str, **details: Any) -> None:
+        """
+        Grava a conclusão de uma etapa de um arquivo.
+
+        Args:
+            dataset (str): Nome do arquivo (ex: 'encounters').
+            stage (str): Etapa (ver `STAGES`).
+            content (str): Identificação do conteúdo, gerada por `fingerprint`.
+            **details (Any): Dados usados para retomar a etapa (ex: caminho do arquivo, nome do blob).
+        """
+        if stage not in STAGES:
+            raise ValueError(f'Etapa de checkpoint inválida: {stage}')
+
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._state['datasets'].setdefault(dataset, {})[stage] = {
+                'fingerprint': content,
+                'completed_at': datetime.now().isoformat(),
+                **details
+            }
+            self._write()
+
+    def finish(self, status: str) -> None:
+        """
+        Registra o fim da execução.
+
+        Args:
+            status (str): 'success' ou 'error'.
+        """
+        if not self.enabled:
+            return
+
+        with self._lock:
+            self._state['run'].update({'finished_at': datetime.now().isoformat(), 'status': status})
+            self._write()
+
+    def _read(self) -> Dict[str, Any]:
+        """
+        Lê os checkpoints do disco.
+
+        Returns:
+            Dict[str, Any]: Checkpoints gravados, vazio se o arquivo não existir ou estiver inválido.
+        """
+        if not self.path.exists():
+            return {}
+
+        try:
+            with open(self.path, 'r') as f:
+                return json.load(f)
+
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f'Checkpoints inválidos, começando do zero: {str(e)}')
+            return {}
+
+    def _write(self) -> None:
+        """Grava os checkpoints em um arquivo temporário e substitui o anterior."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+
+        temp_path = self.path.with_suffix('.tmp')
+        with open(temp_path, 'w') as f:
+            json.dump(self._state, f, indent=2, default=str)
+        os.replace(temp_path, self.path)
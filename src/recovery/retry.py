@@ -0,0 +1,98 @@
+import os
+import time
+import random
+import logging
+
+from dotenv import load_dotenv
+from typing import Callable, Optional, Any
+
+logger = logging.getLogger(__name__)
+
+TRANSIENT_STATUS_CODES = {408, 429, 500, 502, 503, 504}
+
+
+def is_transient(error: BaseException) -> bool:
+    """
+    Verifica se um erro é temporário (rede, Azure ou Banco) e vale uma nova tentativa.
+
+    Erros de dados, de contrato ou de permissão não são temporários e falham na hora.
+    Um `ExceptionGroup` (ex: erros de várias tarefas em paralelo) só é
+    temporário se todos os erros dentro dele forem.
+
+    Args:
+        error (BaseException): Erro levantado pela etapa.
+
+    Returns:
+        bool: True se a etapa pode ser tentada de novo.
+    """
+    if isinstance(error, BaseExceptionGroup):
+        return all(is_transient(inner) for inner in error.exceptions)
+
+    if isinstance(error, (ConnectionError, TimeoutError)):
+        return True
+
+    from azure.core.exceptions import HttpResponseError, ServiceRequestError, ServiceResponseError
+    if isinstance(error, (ServiceRequestError, ServiceResponseError)):
+        return True
+    if isinstance(error, HttpResponseError):
+        return error.status_code in TRANSIENT_STATUS_CODES
+
+    from sqlalchemy.exc import DBAPIError, OperationalError as SqlAlchemyOperationalError
+    from psycopg2 import OperationalError, InterfaceError
+    if isinstance(error, (SqlAlchemyOperationalError, OperationalError, InterfaceError)):
+        return True
+    if isinstance(error, DBAPIError):
+        return error.connection_invalidated
+
+    return False
+
+
+class RetryPolicy:
+    """
+    Tenta de novo uma etapa que falhou por erro temporário, com espera exponencial.
+
+    A espera antes da tentativa `n` é `backoff * 2 ** (n - 1)` segundos, limitada a
+    `max_backoff` e com variação aleatória de até 50%, para que várias etapas não
+    tentem de novo ao mesmo tempo. Configurada por `RETRY_ATTEMPTS` (padrão: 3),
+    `RETRY_BACKOFF` (padrão: 1s) e `RETRY_MAX_BACKOFF` (padrão: 30s).
+    """
+
+    def __init__(
+        self,
+        attempts: Optional[int] = None,
+        backoff: Optional[float] = None,
+        max_backoff: Optional[float] = None
+    ):
+        load_dotenv()
+
+        self.attempts = max(1, attempts or int(os.getenv('RETRY_ATTEMPTS', 3)))
+        self.backoff = backoff if backoff is not None else float(os.getenv('RETRY_BACKOFF', 1.0))
+        self.max_backoff = max_backoff if max_backoff is not None else float(os.getenv('RETRY_MAX_BACKOFF', 30.0))
+
+    def call(self, description: str, function: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+        """
+        Executa uma função, tentando de novo em caso de erro temporário.
+
+        Args:
+            description (str): Descrição da etapa nos logs (ex: 'upload de encounters').
+            function (Callable): Função a ser executada.
+            *args (Any): Argumentos posicionais da função.
+            **kwargs (Any): Argumentos nomeados da função.
+
+        Returns:
+            Any: Retorno da função.
+        """
+        for attempt in range(1, self.attempts + 1):
+            try:
+                return function(*args, **kwargs)
+
+            except Exception as e:
+                if attempt == self.attempts or not is_transient(e):
+                    raise
+
+                delay = min(self.max_backoff, self.backoff * 2 ** (attempt - 1)) * random.uniform(0.5, 1.0)
+                logger.warning(
+                    f'Erro temporário em {description} (tentativa {attempt}/{self.attempts}), '
+                    f'tentando de novo em {delay:.1f}s: {str(e)}'
+                )
+                time.sleep(delay)
@@ -0,0 +1,138 @@
+import os
+import uuid
+import pytest
+
+from types import SimpleNamespace
+from typing import Dict, Optional
+
+from azure.core.exceptions import ResourceNotFoundError
+
+from src.cloud.local_storage import LocalStorage
+from src.cloud.cloud_connection import AzureCloud
+
+
+class FakeBlobClient:
+    """Blob em memória com os métodos do `BlobClient` usados pela `AzureCloud`."""
+
+    def __init__(self, store: Dict[str, Dict], blob_name: str):
+        self.store = store
+        self.blob_name = blob_name
+        self.blocks = {}
+
+    def upload_blob(self, data, overwrite: bool = False, metadata: Optional[Dict[str, str]] = None, **kwargs) -> None:
+        content = data if isinstance(data, (bytes, bytearray)) else data.read()
+        self.store[self.blob_name] = {'data': bytes(content), 'metadata': dict(metadata or {})}
+
+    def stage_block(self, block_id: str, data: bytes, **kwargs) -> None:
+        self.blocks[block_id] = bytes(data)
+
+    def commit_block_list(self, block_list, metadata: Optional[Dict[str, str]] = None, **kwargs) -> None:
+        content = b''.join(self.blocks.pop(block_id) for block_id in block_list)
+        self.store[self.blob_name] = {'data': content, 'metadata': dict(metadata or {})}
+
+    def download_blob(self, **kwargs) -> SimpleNamespace:
+        data = self._get()['data']
+        return SimpleNamespace(readall=lambda: data)
+
+    def get_blob_properties(self) -> SimpleNamespace:
+        return SimpleNamespace(metadata=dict(self._get()['metadata']))
+
+    def _get(self) -> Dict:
+        if self.blob_name not in self.store:
+            raise ResourceNotFoundError(f'Blob não encontrado: {self.blob_name}')
+        return self.store[self.blob_name]
+
+
+class FakeContainerClient:
+    """Container em memória com os métodos do `ContainerClient` usados pela `AzureCloud`."""
+
+    def __init__(self, store: Dict[str, Dict]):
+        self.store = store
+
+    def get_blob_client(self, blob_name: str) -> FakeBlobClient:
+        return FakeBlobClient(self.store, blob_name)
+
+    def list_blobs(self, name_starts_with: Optional[str] = None):
+        return [
+            SimpleNamespace(name=name)
+            for name in sorted(self.store)
+            if not name_starts_with or name.startswith(name_starts_with)
+        ]
+
+
+class FakeAsyncServiceClient:
+    """Cliente assíncrono em memória, usado por `download_many`, lendo o mesmo container."""
+
+    def __init__(self, store: Dict[str, Dict]):
+        self.store = store
+
+    async def __aenter__(self) -> 'FakeAsyncServiceClient':
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        return None
+
+    def get_container_client(self, container_name: str) -> 'FakeAsyncServiceClient':
+        return self
+
+    def get_blob_client(self, blob_name: str) -> SimpleNamespace:
+        blob = FakeBlobClient(self.store, blob_name)
+
+        async def download_blob(**kwargs) -> SimpleNamespace:
+            data = blob.download_blob().readall()
+
+            async def readall() -> bytes:
+                return data
+
+            return SimpleNamespace(readall=readall)
+
+        return SimpleNamespace(download_blob=download_blob)
+
+
+def mocked_azure() -> AzureCloud:
+    """
+    Cria uma `AzureCloud` ligada a um container em memória, sem rede.
+
+    Returns:
+        AzureCloud: Armazenamento com os clientes síncrono e assíncrono trocados pelos falsos.
+    """
+    store = {}
+
+    cloud = AzureCloud(container_name='test')
+    cloud.connection_string = None
+    cloud._container_client = FakeContainerClient(store)
+    cloud._async_service_client = lambda: FakeAsyncServiceClient(store)
+    return cloud
+
+
+@pytest.fixture(params=['local', 'azure-mock', 'azurite'])
+def storage(request, tmp_path, monkeypatch):
+    """
+    Armazenamentos testados com o mesmo contrato.
+
+    - 'local': `LocalStorage` em um diretório temporário.
+    - 'azure-mock': `AzureCloud` com um container em memória.
+    - 'azurite': `AzureCloud` em um emulador real, apenas com `AZURITE_CONNECTION_STRING`
+      definido (ex: a connection string padrão do Azurite).
+    """
+    if request.param == 'local':
+        yield LocalStorage(root_path=str(tmp_path / 'storage'))
+        return
+
+    if request.param == 'azure-mock':
+        yield mocked_azure()
+        return
+
+    connection_string = os.getenv('AZURITE_CONNECTION_STRING')
+    if not connection_string:
+        pytest.skip('AZURITE_CONNECTION_STRING não definido')
+
+    monkeypatch.setenv('AZURE_STORAGE_CONNECTION_STRING', connection_string)
+    cloud = AzureCloud(container_name=f'test-{uuid.uuid4().hex[:12]}')
+    cloud.blob_service_client.create_container(cloud.container_name)
+
+    try:
+        yield cloud
+
+    finally:
+        cloud.blob_service_client.delete_container(cloud.container_name)
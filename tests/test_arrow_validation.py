@@ -0,0 +1,104 @@
+import pytest
+import pandas as pd
+
+from pathlib import Path
+from pyarrow import csv as pa_csv
+from pandera.errors import SchemaError
+
+from src.contracts.schema import EncontersSchema, OrganizationsSchema, PatientsSchema, PayersSchema
+from src.contracts.arrow_validation import validate_table
+from src.contracts.dtype_plan import apply_arrow_plan, apply_pandas_plan, to_compact_pandas
+from src.data_source.csv_data_source import DataSource, _csv_options, _read_csv_as_text
+
+
+ORGANIZATIONS = '''﻿Id,NAME,ADDRESS,CITY,STATE,ZIP,LAT,LON
+o1,GENERAL HOSPITAL,55 FRUIT STREET,BOSTON,MA,02114,42.362813,-71.069187
+o2,CLINIC,1 MAIN ST,QUINCY,MA,02186,42.290937381211286,-70.97550306
+'''
+
+PATIENTS = '''﻿Id,BIRTHDATE,DEATHDATE,PREFIX,FIRST,LAST,SUFFIX,MAIDEN,MARITAL,RACE,ETHNICITY,GENDER,BIRTHPLACE,ADDRESS,CITY,STATE,COUNTY,ZIP,LAT,LON
+p1,1977-03-19,,Mrs.,Ana,Silva,,Souza,M,white,nonhispanic,F,Quincy,1 Main St,Quincy,Massachusetts,Norfolk County,02186,42.290937381211286,-70.97550306
+p2,1940-02-19,2017-08-31,Mr.,Bruno,Lima,,,,black,hispanic,M,Boston,2 Main St,Boston,Massachusetts,Suffolk County,,42.35101012334556,-71.05822458913516
+p3,1958-06-04,,,Carla,Reis,,,S,asian,nonhispanic,,Boston,3 Main St,Boston,Massachusetts,Suffolk County,02135,42.34964153470207,-71.15437617069218
+'''
+
+PAYERS = '''﻿Id,NAME,ADDRESS,CITY,STATE_HEADQUARTERED,ZIP,PHONE
+y1,Medicare,7500 Security Blvd,Baltimore,MD,21244,1-800-633-4227
+y2,NO_INSURANCE,,,,,
+y3,Aetna,151 Farmington Avenue,Hartford,CT,06156,1-800-872-3862
+'''
+
+ENCOUNTERS = '''﻿Id,START,STOP,PATIENT,ORGANIZATION,PAYER,ENCOUNTERCLASS,CODE,DESCRIPTION,BASE_ENCOUNTER_COST,TOTAL_CLAIM_COST,PAYER_COVERAGE,REASONCODE,REASONDESCRIPTION
+e1,2011-01-02T09:26:36Z,2011-01-02T12:58:36Z,p1,o1,y1,ambulatory,185347001,Encounter,85.55,1018.02,0.0,,
+e2,2011-01-03T05:44:39Z,2011-01-03T06:01:42Z,p2,o2,y3,emergency,50849002,Emergency,142.58,2619.36,2619.36,10509002,Acute bronchitis
+'''
+
+
+def _write(tmp_path: Path, name: str, content: str) -> Path:
+    file = tmp_path / f'{name}.csv'
+    file.write_text(content, encoding='utf-8')
+    return file
+
+
+def _edit_lines(content: str, edit) -> str:
+    return ''.join(f'{edit(line)}\n' for line in content.splitlines())
+
+
+def _validate_both(file: Path, schema):
+    """Valida o mesmo CSV com os dois backends, cada um com o seu leitor de texto."""
+    table = pa_csv.read_csv(file, **_csv_options(file, 1 << 20, schema))
+    arrow = to_compact_pandas(apply_arrow_plan(validate_table(table, schema), schema))
+    pandera = apply_pandas_plan(schema.validate(_read_csv_as_text(file)), schema)
+    return arrow, pandera
+
+
+@pytest.mark.parametrize('name, content, schema', [
+    ('organizations', ORGANIZATIONS, OrganizationsSchema),
+    ('patients', PATIENTS, PatientsSchema),
+    ('payers', PAYERS, PayersSchema),
+    ('encounters', ENCOUNTERS, EncontersSchema)
+], ids=['organizations', 'patients', 'payers', 'encounters'])
+def test_backends_return_the_same_data(tmp_path, name, content, schema):
+    arrow, pandera = _validate_both(_write(tmp_path, name, content), schema)
+
+    pd.testing.assert_frame_equal(arrow, pandera)
+
+
+def test_text_columns_keep_the_original_values(tmp_path):
+    for backend in _validate_both(_write(tmp_path, 'patients', PATIENTS), PatientsSchema):
+        assert backend['zip'].tolist() == ['02186', pd.NA, '02135']
+        assert backend['lat'].tolist() == [42.290937381211286, 42.35101012334556, 42.34964153470207]
+        assert backend['deathdate'].tolist()[0] is None
+
+
+@pytest.mark.parametrize('backend', ['pandera', 'arrow'])
+def test_data_source_backends_agree(tmp_path, monkeypatch, backend):
+    for variable in ('VALIDATION_CACHE_PATH', 'UPLOAD_LEDGER_PATH', 'CHECKPOINT_PATH'):
+        monkeypatch.setenv(variable, '')
+    file = _write(tmp_path, 'organizations', ORGANIZATIONS)
+
+    df = DataSource(validation_backend=backend)._validate_file(file, OrganizationsSchema)
+
+    assert df['zip'].tolist() == ['02114', '02186']
+    pd.testing.assert_frame_equal(df, _validate_both(file, OrganizationsSchema)[0])
+
+
+@pytest.mark.filterwarnings('ignore:Could not infer format')
+@pytest.mark.parametrize('content, schema', [
+    pytest.param(_edit_lines(ORGANIZATIONS, lambda line: line.rsplit(',', 1)[0]), OrganizationsSchema, id='missing_column'),
+    pytest.param(_edit_lines(PAYERS, lambda line: f'{line},EXTRA'), PayersSchema, id='extra_column'),
+    pytest.param(ORGANIZATIONS.replace(',BOSTON,', ',,'), OrganizationsSchema, id='null_value'),
+    pytest.param(ORGANIZATIONS.replace('o2,', 'o1,'), OrganizationsSchema, id='duplicated_id'),
+    pytest.param(PATIENTS.replace(',nonhispanic,F,', ',nonhispanic,X,'), PatientsSchema, id='isin'),
+    pytest.param(ENCOUNTERS.replace(',85.55,', ',-85.55,'), EncontersSchema, id='ge'),
+    pytest.param(ORGANIZATIONS.replace('42.362813', 'norte'), OrganizationsSchema, id='not_a_number'),
+    pytest.param(PATIENTS.replace('1977-03-19', 'ontem'), PatientsSchema, id='not_a_date')
+])
+def test_backends_reject_the_same_data(tmp_path, content, schema):
+    file = _write(tmp_path, 'invalid', content)
+
+    with pytest.raises(SchemaError):
+        validate_table(pa_csv.read_csv(file, **_csv_options(file, 1 << 20, schema)), schema)
+
+    with pytest.raises(SchemaError):
+        schema.validate(_read_csv_as_text(file))
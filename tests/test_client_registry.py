@@ -0,0 +1,68 @@
+import os
+import asyncio
+import pytest
+
+from src.cloud import client_registry
+
+CONNECTION_STRING = (
+    'DefaultEndpointsProtocol=http;AccountName=devstoreaccount1;AccountKey=a2V5;'
+    'BlobEndpoint=http://127.0.0.1:1/devstoreaccount1;'
+)
+
+
+async def _open_client():
+    async with client_registry.async_blob_service_client(connection_string=CONNECTION_STRING) as client:
+        return client
+
+
+@pytest.fixture(autouse=True)
+def clear_clients():
+    client_registry.clear_clients()
+    yield
+    client_registry.clear_clients()
+
+
+def test_async_client_is_reused_between_calls():
+    first = client_registry.run_async(_open_client())
+    second = client_registry.run_async(_open_client())
+
+    assert first is second
+
+
+def test_other_event_loops_get_a_temporary_client():
+    shared = client_registry.run_async(_open_client())
+
+    assert asyncio.run(_open_client()) is not shared
+
+
+def test_clear_clients_stops_the_event_loop():
+    first = client_registry.run_async(_open_client())
+    loop = client_registry._loop
+
+    client_registry.clear_clients()
+
+    assert client_registry.run_async(_open_client()) is not first
+    assert client_registry._loop is not loop
+    assert not loop.is_running()
+
+
+@pytest.mark.filterwarnings('ignore::DeprecationWarning')
+def test_forked_child_starts_without_the_parent_clients():
+    client_registry.get_session()
+    client_registry.run_async(_open_client())
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        empty = (
+            client_registry._session is None and client_registry._loop is None
+            and not client_registry._async_service_clients
+        )
+        reused = empty and client_registry.run_async(_open_client()) is client_registry.run_async(_open_client())
+        os.write(write_fd, b'1' if reused else b'0')
+        os._exit(0)
+
+    os.close(write_fd)
+    os.waitpid(pid, 0)
+    assert os.read(read_fd, 1) == b'1'
+    assert client_registry._loop is not None
@@ -0,0 +1,86 @@
+import pytest
+import pandas as pd
+
+from src.cloud.local_storage import LocalStorage
+from src.cloud.manifest import read_index
+from src.data_source.csv_data_source import DataSource
+from src.metrics.run_metrics import RunMetrics
+
+
+class UnreachableStorage(LocalStorage):
+    """`LocalStorage` que falha ao enviar os arquivos que começam com um dos `prefixes`."""
+
+    def __init__(self, root_path: str, prefixes: tuple):
+        super().__init__(root_path)
+        self.prefixes = prefixes
+
+    def open_writer(self, blob_name, metadata=None):
+        self._connect(blob_name)
+        return super().open_writer(blob_name, metadata)
+
+    def upload_data(self, blob_name, data, metadata=None):
+        self._connect(blob_name)
+        return super().upload_data(blob_name, data, metadata)
+
+    def _connect(self, blob_name):
+        if blob_name.startswith(self.prefixes):
+            raise ConnectionError(f'armazenamento fora do ar: {blob_name}')
+
+
+@pytest.fixture
+def data_source(monkeypatch):
+    for name in ('VALIDATION_CACHE_PATH', 'UPLOAD_LEDGER_PATH', 'CHECKPOINT_PATH'):
+        monkeypatch.setenv(name, '')
+    monkeypatch.setenv('RETRY_ATTEMPTS', '1')
+    monkeypatch.setenv('PARQUET_PARTITIONED', 'false')
+
+    return DataSource()
+
+
+def _frames():
+    return {
+        'payers': pd.DataFrame({'id': ['a', 'b']}),
+        'organizations': pd.DataFrame({'id': ['c']})
+    }
+
+
+def test_failed_upload_is_not_hidden_by_the_manifest_write(data_source, tmp_path):
+    data_source._cloud_conn = UnreachableStorage(str(tmp_path), ('organizations/', 'payers/_latest'))
+
+    with pytest.raises(ConnectionError, match='organizations/') as error:
+        data_source.load_data(_frames())
+
+    assert 'Manifestos não foram salvos' in ''.join(getattr(error.value, '__notes__', []))
+
+
+def test_manifests_of_completed_uploads_are_saved(data_source, tmp_path):
+    data_source._cloud_conn = UnreachableStorage(str(tmp_path), ('organizations/',))
+
+    with pytest.raises(ConnectionError):
+        data_source.load_data(_frames())
+
+    assert list(read_index(LocalStorage(str(tmp_path)))) == ['payers']
+
+
+def test_manifest_error_is_raised_after_successful_uploads(data_source, tmp_path):
+    data_source._cloud_conn = UnreachableStorage(str(tmp_path), ('payers/_latest',))
+
+    with pytest.raises(ConnectionError, match='payers/_latest'):
+        data_source.load_data(_frames())
+
+    assert read_index(LocalStorage(str(tmp_path))) is None
+
+
+def test_upload_records_parquet_encoding_separately(data_source, tmp_path):
+    data_source._cloud_conn = LocalStorage(str(tmp_path))
+    data_source.metrics = RunMetrics('data_source', enabled=True, report_path=str(tmp_path / 'reports'))
+    data_source.metrics.begin()
+
+    data_source.load_data(_frames())
+
+    stages = {(stage['stage'], stage['dataset']): stage for stage in data_source.metrics.stages}
+    for name, df in _frames().items():
+        encode, upload = stages[('to_parquet', name)], stages[('upload', name)]
+        assert encode['rows'] == len(df)
+        assert encode['bytes'] == upload['bytes'] > 0
+        assert encode['seconds'] <= upload['seconds']
@@ -0,0 +1,58 @@
+import pytest
+
+from collections import Counter
+
+from src.controllers.controller import Controller
+
+
+@pytest.fixture
+def controller(monkeypatch):
+    for name, value in {'DB_USER': 'user', 'DB_PASS': 'pass', 'DB_HOST': 'localhost', 'DB_PORT': '5432', 'DB_NAME': 'db'}.items():
+        monkeypatch.setenv(name, value)
+    monkeypatch.setenv('CHECKPOINT_PATH', '')
+    monkeypatch.setenv('RETRY_ATTEMPTS', '3')
+    monkeypatch.setenv('RETRY_BACKOFF', '0')
+
+    controller = Controller()
+    controller.committed = Counter()
+    controller.attempts = Counter()
+    controller.marked = []
+    controller.failures = {}
+
+    def copy(data):
+        (name, _), = data.items()
+        controller.attempts[name] += 1
+        if controller.failures.get(name):
+            raise controller.failures[name].pop(0)
+        controller.committed[name] += 1
+
+    controller.db.insert_data_with_copy = copy
+    controller.db.update_pipeline_state = lambda dataset, **state: controller.marked.append(dataset)
+    return controller
+
+
+def _load(controller):
+    data = {'patients': [1, 2, 3], 'procedures': [1, 2], 'payers': [1]}
+    files = {name: f'{name}/{name}_2026-01-17T22:02:19.parquet' for name in data}
+    controller._load_and_checkpoint('parallel', controller.save_data_into_db_in_parallel, data, files)
+
+
+def test_transient_failure_retries_only_the_failed_table(controller):
+    controller.failures['procedures'] = [ConnectionError('conexão perdida')]
+
+    _load(controller)
+
+    assert controller.committed == {'patients': 1, 'procedures': 1, 'payers': 1}
+    assert controller.attempts == {'patients': 1, 'procedures': 2, 'payers': 1}
+    assert sorted(controller.marked) == ['patients', 'payers', 'procedures']
+
+
+def test_loaded_tables_are_marked_when_another_table_fails(controller):
+    controller.failures['procedures'] = [ValueError('coluna inválida')]
+
+    with pytest.raises(ExceptionGroup):
+        _load(controller)
+
+    assert controller.committed == {'patients': 1, 'payers': 1}
+    assert controller.attempts['procedures'] == 1
+    assert sorted(controller.marked) == ['patients', 'payers']
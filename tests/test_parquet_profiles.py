@@ -0,0 +1,32 @@
+import io
+import pandas as pd
+import pyarrow.parquet as pq
+
+from src.data_source.parquet_profiles import WRITE_PROFILES, write_dataframe
+
+
+def _write(df: pd.DataFrame, row_group_size: int) -> pq.ParquetFile:
+    sink = io.BytesIO()
+    write_dataframe(df, sink, {**WRITE_PROFILES['default'], 'row_group_size': row_group_size})
+    sink.seek(0)
+    return pq.ParquetFile(sink)
+
+
+def test_column_empty_in_the_first_row_group():
+    df = pd.DataFrame({
+        'id': ['a', 'b', 'c', 'd', 'e'],
+        'deathdate': [None, None, None, '2020-01-02', '2021-03-04'],
+        'gender': pd.Categorical(['M', 'F', 'M', 'F', 'M'])
+    })
+
+    parquet_file = _write(df, row_group_size=2)
+    table = parquet_file.read()
+
+    assert parquet_file.num_row_groups == 3
+    assert table.schema.field('deathdate').type == 'string'
+    assert table.to_pandas().equals(df)
+
+
+def test_empty_dataframe():
+    df = pd.DataFrame({'id': pd.Series([], dtype=object)})
+    assert _write(df, row_group_size=2).metadata.num_rows == 0
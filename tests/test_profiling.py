@@ -0,0 +1,48 @@
+import pytest
+import pyarrow as pa
+
+from src.metrics.profiling import MemoryBudgetExceeded, RunProfiler
+from src.metrics.run_metrics import RunMetrics
+
+
+def test_repeated_stage_does_not_overwrite_artifacts(tmp_path):
+    profiler = RunProfiler(tmp_path)
+    profiler.start()
+
+    try:
+        records = [{'stage': 'validate', 'dataset': 'encounters'} for _ in range(2)]
+        for record in records:
+            profiler.enter(record)
+            profiler.exit(record, failed=False)
+
+    finally:
+        profiler.stop()
+
+    assert records[0]['profile'] != records[1]['profile']
+    assert sorted(path.name for path in tmp_path.glob('*.prof')) == [
+        '001_validate_encounters.prof', '002_validate_encounters.prof'
+    ]
+
+
+def test_memory_budget_counts_arrow_allocations(tmp_path, monkeypatch):
+    monkeypatch.setenv('PROFILE_MEMORY_BUDGETS', 'build=16,small=16')
+    metrics = RunMetrics('data_source', enabled=True, report_path=str(tmp_path))
+    metrics.begin(profile=True)
+
+    try:
+        with metrics.stage('small'):
+            buffer = pa.allocate_buffer(1 * 2**20)
+        del buffer
+
+        with pytest.raises(MemoryBudgetExceeded, match='Arrow: 64.0 MB'):
+            with metrics.stage('build'):
+                buffer = pa.allocate_buffer(64 * 2**20)
+        del buffer
+
+    finally:
+        metrics.profiler.stop()
+
+    record = metrics.stages[-1]
+    assert record['status'] == 'error'
+    assert record['traced_peak_bytes'] < 2**20
+    assert record['arrow_peak_bytes'] >= 64 * 2**20
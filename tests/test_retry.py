@@ -0,0 +1,23 @@
+from azure.core.exceptions import HttpResponseError
+
+from src.recovery.retry import is_transient
+
+
+def test_transient_errors():
+    assert is_transient(ConnectionError('conexão recusada'))
+    assert is_transient(TimeoutError())
+    assert not is_transient(ValueError('coluna inválida'))
+
+
+def test_exception_group_is_transient_only_if_all_errors_are():
+    assert is_transient(ExceptionGroup('downloads', [ConnectionError(), TimeoutError()]))
+    assert not is_transient(ExceptionGroup('downloads', [ConnectionError(), ValueError()]))
+
+
+def test_nested_exception_group():
+    nested = ExceptionGroup('etapas', [ExceptionGroup('downloads', [TimeoutError()]), ConnectionError()])
+    assert is_transient(nested)
+
+    error = HttpResponseError(message='Forbidden')
+    error.status_code = 403
+    assert not is_transient(ExceptionGroup('etapas', [nested, error]))
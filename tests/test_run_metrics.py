@@ -0,0 +1,35 @@
+from src.metrics.run_metrics import to_prometheus
+
+
+def _stage(name, dataset, seconds, rows, peak):
+    return {
+        'stage': name, 'dataset': dataset, 'status': 'success', 'seconds': seconds, 'cpu_seconds': seconds,
+        'rows': rows, 'bytes': rows * 10, 'peak_rss_bytes': peak
+    }
+
+
+def test_retried_stage_is_a_single_series():
+    report = {
+        'pipeline': 'controller',
+        'status': 'success',
+        'seconds': 3.0,
+        'finished_at': '2026-01-17T22:02:19',
+        'stages': [
+            _stage('load', 'encounters', 1.0, 100, 500),
+            _stage('load', 'encounters', 1.5, 100, 800),
+            _stage('load', 'patients', 0.5, 10, 300),
+            _stage('transform', None, 0.25, 110, 200)
+        ],
+        'batches': []
+    }
+
+    samples = [line for line in to_prometheus(report).splitlines() if not line.startswith('#')]
+    series = [line.rsplit(' ', 1)[0] for line in samples]
+    assert len(series) == len(set(series))
+
+    encounters = 'pipeline="controller",stage="load",dataset="encounters"'
+    assert f'hospital_pipeline_stage_count{{{encounters}}} 2' in samples
+    assert f'hospital_pipeline_stage_seconds{{{encounters}}} 2.5' in samples
+    assert f'hospital_pipeline_stage_rows{{{encounters}}} 200' in samples
+    assert f'hospital_pipeline_stage_peak_rss_bytes{{{encounters}}} 800' in samples
+    assert 'hospital_pipeline_stage_count{pipeline="controller",stage="transform",dataset=""} 1' in samples
@@ -0,0 +1,37 @@
+import time
+
+from src.controllers.stage_pipeline import PipelineStage, StagePipeline
+
+
+def _sleep(seconds):
+    def function(name, value):
+        time.sleep(seconds)
+        return value
+
+    return function
+
+
+def test_speedup_does_not_count_workers_inside_a_stage():
+    pipeline = StagePipeline([PipelineStage('extract', _sleep(0.2), workers=4)])
+    pipeline.run({f'file_{index}': index for index in range(4)})
+
+    report = pipeline.report()
+    stage = report['stages']['extract']
+
+    assert stage['work_seconds'] >= 0.8
+    assert stage['parallelism'] > 3
+    assert report['serial_seconds'] == stage['busy_seconds']
+    assert report['speedup'] <= 1.05
+
+
+def test_speedup_counts_overlap_between_stages():
+    pipeline = StagePipeline([
+        PipelineStage('extract', _sleep(0.1)),
+        PipelineStage('load', _sleep(0.1))
+    ])
+    results = pipeline.run({f'file_{index}': index for index in range(4)})
+
+    report = pipeline.report()
+    assert results == {f'file_{index}': index for index in range(4)}
+    assert report['serial_seconds'] >= 0.8
+    assert report['speedup'] > 1.3
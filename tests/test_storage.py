@@ -0,0 +1,104 @@
+import io
+import json
+import pytest
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from src.cloud.manifest import INDEX_BLOB_NAME, manifest_blob_name, read_index, write_manifests
+
+
+def test_upload_and_download_round_trip(storage):
+    storage.upload_data(blob_name='encounters/a.parquet', data=b'first')
+    assert storage.download_data('encounters/a.parquet') == b'first'
+
+    storage.upload_data(blob_name='encounters/a.parquet', data=b'second')
+    assert storage.download_data('encounters/a.parquet') == b'second'
+
+
+def test_upload_from_stream(storage):
+    storage.upload_data(blob_name='encounters/stream.parquet', data=io.BytesIO(b'x' * 100_000))
+    assert storage.download_data('encounters/stream.parquet') == b'x' * 100_000
+
+
+def test_missing_blob(storage):
+    assert storage.download_data_if_exists('missing/a.parquet') is None
+    assert storage.get_blob_metadata('missing/a.parquet') is None
+
+    with pytest.raises(Exception):
+        storage.download_data('missing/a.parquet')
+
+
+def test_metadata(storage):
+    storage.upload_data(blob_name='encounters/a.parquet', data=b'data', metadata={'content_hash': 'abc'})
+    assert storage.get_blob_metadata('encounters/a.parquet') == {'content_hash': 'abc'}
+
+    storage.upload_data(blob_name='encounters/a.parquet', data=b'data')
+    assert storage.get_blob_metadata('encounters/a.parquet') == {}
+
+
+def test_list_by_prefix(storage):
+    for blob_name in ['encounters/a.parquet', 'encounters/b.parquet', 'patients/a.parquet']:
+        storage.upload_data(blob_name=blob_name, data=b'data', metadata={'rows': '1'})
+
+    assert sorted(storage.list_blob_files('encounters/')) == ['encounters/a.parquet', 'encounters/b.parquet']
+    assert sorted(storage.list_blob_files()) == [
+        'encounters/a.parquet', 'encounters/b.parquet', 'patients/a.parquet'
+    ]
+    assert storage.list_blob_files('organizations/') == []
+
+
+def test_open_writer_publishes_on_exit(storage):
+    if hasattr(storage, 'block_size'):
+        storage.block_size = 4
+
+    with storage.open_writer('encounters/a.parquet', metadata={'rows': '3'}) as file:
+        file.write(b'abc')
+        file.write(b'defghij')
+        assert storage.download_data_if_exists('encounters/a.parquet') is None
+
+    assert storage.download_data('encounters/a.parquet') == b'abcdefghij'
+    assert storage.get_blob_metadata('encounters/a.parquet') == {'rows': '3'}
+
+
+def test_open_writer_discards_on_error(storage):
+    with pytest.raises(RuntimeError):
+        with storage.open_writer('encounters/a.parquet') as file:
+            file.write(b'partial')
+            raise RuntimeError('falha no meio da escrita')
+
+    assert storage.download_data_if_exists('encounters/a.parquet') is None
+    assert storage.list_blob_files('encounters/') == []
+
+
+def test_download_many_reads_parquet(storage):
+    table = pa.table({'id': [1, 2, 3], 'name': ['a', 'b', 'c']})
+
+    for name in ['encounters', 'patients']:
+        with storage.open_writer(f'{name}/{name}.parquet') as file:
+            pq.write_table(table, file)
+
+    data = storage.download_many(['encounters/encounters.parquet', 'patients/patients.parquet'])
+
+    assert sorted(data) == ['encounters/encounters.parquet', 'patients/patients.parquet']
+    for content in data.values():
+        assert pq.read_table(pa.BufferReader(content)).equals(table)
+
+
+def test_manifest_round_trip(storage):
+    assert read_index(storage) is None
+
+    encounters = {'blob_name': 'encounters/a.parquet', 'rows': 3, 'content_hash': 'abc'}
+    patients = {'blob_name': 'patients/a.parquet', 'rows': 2, 'content_hash': 'def'}
+
+    write_manifests(storage, {'encounters': encounters, 'patients': patients})
+    assert read_index(storage) == {'encounters': encounters, 'patients': patients}
+    assert json.loads(storage.download_data(manifest_blob_name('encounters'))) == encounters
+
+    updated = {**encounters, 'blob_name': 'encounters/b.parquet', 'rows': 4}
+    write_manifests(storage, {'encounters': updated})
+    assert read_index(storage) == {'encounters': updated, 'patients': patients}
+
+
+def test_invalid_index_is_ignored(storage):
+    storage.upload_data(blob_name=INDEX_BLOB_NAME, data=b'{not json')
+    assert read_index(storage) is None